@@ -0,0 +1,89 @@
+"""Agent Catalog Schemas for Hub Module.
+
+Declarative description of skills, MCPs and configured agents (agent_catalog.yml), plus the plan
+produced by diffing it against the database.
+"""
+
+from typing import Any, Literal
+
+from app.agents.configured_agents.schemas import JsonSerializableType
+from pydantic import BaseModel, Field, model_validator
+
+
+class CatalogSkill(BaseModel):
+    """Skill entry of the agent catalog."""
+
+    name: str = Field(..., max_length=100, description="Skill Name")
+    description: str | None = Field(default=None, description="Skill Description")
+    skill_path: str = Field(..., max_length=500, description="Skill Path (SKILL.md)")
+    version: str = Field(default="1.0.0", max_length=20, description="Version")
+    is_active: bool = Field(default=True, description="Active status")
+
+
+class CatalogMCP(BaseModel):
+    """MCP server entry of the agent catalog."""
+
+    name: str = Field(..., max_length=100, description="MCP Server Name")
+    description: str | None = Field(default=None, description="MCP Server Description")
+    mcp_endpoint: str = Field(..., max_length=500, description="MCP Endpoint (URI or Command)")
+    version: str = Field(default="1.0.0", max_length=20, description="Version")
+    is_active: bool = Field(default=True, description="Active status")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _endpoint_from_connection_config(cls, data: Any) -> Any:
+        # The catalog template nests the endpoint as `connection_config.url`
+        if isinstance(data, dict) and "mcp_endpoint" not in data:
+            url = (data.get("connection_config") or {}).get("url")
+            if url is not None:
+                data = {**data, "mcp_endpoint": url}
+        return data
+
+
+class CatalogConfiguredAgent(BaseModel):
+    """Configured agent entry of the agent catalog; skills and MCPs are referenced by name."""
+
+    name: str = Field(..., max_length=100, description="Agent Name")
+    description: str | None = Field(default=None, description="Agent Description")
+    model: str = Field(..., max_length=100, description="Model or alias name from the model catalog")
+    system_prompt: str | None = Field(default=None, description="System Prompt")
+    skills: list[str] = Field(default_factory=list, description="Skill names")
+    mcps: list[str] = Field(default_factory=list, description="MCP names")
+    config: dict[str, JsonSerializableType] = Field(default_factory=dict, description="Configuration")
+    is_active: bool = Field(default=True, description="Active Status")
+
+
+class AgentCatalog(BaseModel):
+    """Whole agent catalog document."""
+
+    skills: list[CatalogSkill] = Field(default_factory=list)
+    mcps: list[CatalogMCP] = Field(default_factory=list)
+    configured_agents: list[CatalogConfiguredAgent] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def _unique_names(self) -> "AgentCatalog":
+        for kind, entries in (("skill", self.skills), ("mcp", self.mcps), ("configured_agent", self.configured_agents)):
+            names = [entry.name for entry in entries]
+            duplicates = sorted({name for name in names if names.count(name) > 1})
+            if duplicates:
+                raise ValueError(f"Duplicate {kind} names: {', '.join(duplicates)}")
+        return self
+
+
+class CatalogChange(BaseModel):
+    """One planned change."""
+
+    action: Literal["create", "update", "delete"]
+    kind: Literal["skill", "mcp", "configured_agent"]
+    name: str
+    fields: list[str] = Field(default_factory=list, description="Changed fields (updates only)")
+
+
+class CatalogPlan(BaseModel):
+    """Changes needed to make the database match the catalog."""
+
+    changes: list[CatalogChange] = Field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.changes
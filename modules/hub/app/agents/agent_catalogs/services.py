@@ -0,0 +1,187 @@
+import uuid
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from typing import Annotated, Any
+from uuid import UUID
+
+from app.agents.agent_catalogs.schemas import AgentCatalog, CatalogChange, CatalogPlan
+from app.agents.agent_mcps.repos import AgentMCPRepository
+from app.agents.agent_skills.repos import AgentSkillRepository
+from app.agents.configured_agents.repos import ConfiguredAgentRepository
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class AgentCatalogService:
+    """Diffs an agent catalog against the skill, MCP and configured agent tables and applies the difference.
+
+    Reads each table (and the association rows) once, then writes only what changed: one upsert per
+    table, one DELETE and one multi-row INSERT per association table, and one DELETE per table when pruning.
+    """
+
+    def __init__(
+        self,
+        skill_repo: Annotated[AgentSkillRepository, Depends()],
+        mcp_repo: Annotated[AgentMCPRepository, Depends()],
+        agent_repo: Annotated[ConfiguredAgentRepository, Depends()],
+    ):
+        self.skill_repo = skill_repo
+        self.mcp_repo = mcp_repo
+        self.agent_repo = agent_repo
+
+    async def sync(
+        self, session: AsyncSession, catalog: AgentCatalog, prune: bool = False, apply: bool = True
+    ) -> CatalogPlan:
+        """Plan the changes needed to match `catalog`, and write them unless `apply` is False.
+
+        Without `prune`, rows missing from the catalog are left alone; with it they are deleted.
+        """
+        existing_skills = await self.skill_repo.get_all_by_name(session)
+        existing_mcps = await self.mcp_repo.get_all_by_name(session)
+        existing_agents = await self.agent_repo.get_all_by_name(session)
+        skill_links, mcp_links = await self.agent_repo.get_all_links(session)
+        changes: list[CatalogChange] = []
+
+        skill_rows, skill_ids = _diff_rows(
+            "skill", existing_skills, [skill.model_dump() for skill in catalog.skills], changes
+        )
+        mcp_rows, mcp_ids = _diff_rows("mcp", existing_mcps, [mcp.model_dump() for mcp in catalog.mcps], changes)
+
+        pruned_skills = set(existing_skills) - set(skill_ids) if prune else set()
+        pruned_mcps = set(existing_mcps) - set(mcp_ids) if prune else set()
+        available_skills = {name: obj.id for name, obj in existing_skills.items() if name not in pruned_skills}
+        available_skills.update(skill_ids)
+        available_mcps = {name: obj.id for name, obj in existing_mcps.items() if name not in pruned_mcps}
+        available_mcps.update(mcp_ids)
+
+        # Desired links use ids that may not exist yet; agent ids are filled in once the rows are diffed
+        wanted_skill_names: dict[str, set[UUID]] = {}
+        wanted_mcp_names: dict[str, set[UUID]] = {}
+        for agent in catalog.configured_agents:
+            wanted_skill_names[agent.name] = _resolve_names(agent.name, "skill", agent.skills, available_skills)
+            wanted_mcp_names[agent.name] = _resolve_names(agent.name, "MCP", agent.mcps, available_mcps)
+
+        skill_links_by_agent, mcp_links_by_agent = _group_by_agent(skill_links), _group_by_agent(mcp_links)
+        link_changes: dict[str, list[str]] = {}
+        for agent in catalog.configured_agents:
+            existing = existing_agents.get(agent.name)
+            if existing is None:
+                continue
+            changed = []
+            if {(existing.id, s) for s in wanted_skill_names[agent.name]} != skill_links_by_agent.get(
+                existing.id, set()
+            ):
+                changed.append("skills")
+            if {(existing.id, m) for m in wanted_mcp_names[agent.name]} != mcp_links_by_agent.get(existing.id, set()):
+                changed.append("mcps")
+            if changed:
+                link_changes[agent.name] = changed
+
+        agent_rows, agent_ids = _diff_rows(
+            "configured_agent",
+            existing_agents,
+            [
+                agent.model_dump(exclude={"model", "skills", "mcps"}) | {"model_name": agent.model}
+                for agent in catalog.configured_agents
+            ],
+            changes,
+            link_changes,
+        )
+        pruned_agents = set(existing_agents) - set(agent_ids) if prune else set()
+
+        # Association diff, restricted to catalog agents plus rows of anything being pruned
+        pruned_agent_ids = {existing_agents[name].id for name in pruned_agents}
+        pruned_skill_ids = {existing_skills[name].id for name in pruned_skills}
+        pruned_mcp_ids = {existing_mcps[name].id for name in pruned_mcps}
+        synced_agent_ids = set(agent_ids.values())
+        wanted_skill_links = {(agent_ids[a], s) for a, ids in wanted_skill_names.items() for s in ids}
+        wanted_mcp_links = {(agent_ids[a], m) for a, ids in wanted_mcp_names.items() for m in ids}
+        skill_link_diff = _diff_links(
+            skill_links, wanted_skill_links, synced_agent_ids, pruned_agent_ids, pruned_skill_ids
+        )
+        mcp_link_diff = _diff_links(mcp_links, wanted_mcp_links, synced_agent_ids, pruned_agent_ids, pruned_mcp_ids)
+
+        # Agents linked to a skill or MCP that changes or goes away resolve differently even when their own
+        # row does not change; their updated_at is bumped so cached resolutions in every process go stale.
+        changed_skill_ids = {row["id"] for row in skill_rows} | pruned_skill_ids
+        changed_mcp_ids = {row["id"] for row in mcp_rows} | pruned_mcp_ids
+        stale_agent_ids = (
+            (
+                {agent_id for agent_id, skill_id in skill_links if skill_id in changed_skill_ids}
+                | {agent_id for agent_id, mcp_id in mcp_links if mcp_id in changed_mcp_ids}
+            )
+            - pruned_agent_ids
+            - {row["id"] for row in agent_rows}
+        )
+
+        for kind, names in (("configured_agent", pruned_agents), ("skill", pruned_skills), ("mcp", pruned_mcps)):
+            changes.extend(CatalogChange(action="delete", kind=kind, name=name) for name in sorted(names))
+
+        if apply:
+            await self.skill_repo.bulk_upsert(session, skill_rows)
+            await self.mcp_repo.bulk_upsert(session, mcp_rows)
+            await self.agent_repo.bulk_upsert(session, agent_rows)
+            await self.agent_repo.touch(session, stale_agent_ids)
+            await self.agent_repo.bulk_replace_links(session, skill_link_diff, mcp_link_diff)
+            await self.agent_repo.delete_by_names(session, pruned_agents)
+            await self.skill_repo.delete_by_names(session, pruned_skills)
+            await self.mcp_repo.delete_by_names(session, pruned_mcps)
+        return CatalogPlan(changes=changes)
+
+
+def _diff_rows(
+    kind: str,
+    existing: Mapping[str, Any],
+    desired: Sequence[dict[str, Any]],
+    changes: list[CatalogChange],
+    extra_changes: Mapping[str, list[str]] | None = None,
+) -> tuple[list[dict[str, Any]], dict[str, UUID]]:
+    """Rows to upsert (new or changed, with their id) and the id of every desired row, by name."""
+    extra_changes = extra_changes or {}
+    rows, ids = [], {}
+    for values in desired:
+        obj = existing.get(values["name"])
+        if obj is None:
+            row_id = uuid.uuid4()
+            changes.append(CatalogChange(action="create", kind=kind, name=values["name"]))
+            rows.append({"id": row_id, **values})
+        else:
+            row_id = obj.id
+            fields = [key for key, value in values.items() if getattr(obj, key) != value]
+            fields += extra_changes.get(values["name"], [])
+            if fields:
+                changes.append(CatalogChange(action="update", kind=kind, name=values["name"], fields=fields))
+                rows.append({"id": row_id, **values})
+        ids[values["name"]] = row_id
+    return rows, ids
+
+
+def _resolve_names(agent_name: str, kind: str, names: Sequence[str], available: Mapping[str, UUID]) -> set[UUID]:
+    unknown = sorted(set(names) - set(available))
+    if unknown:
+        raise ValueError(f"Configured agent '{agent_name}' references unknown {kind}(s): {', '.join(unknown)}")
+    return {available[name] for name in names}
+
+
+def _group_by_agent(links: set[tuple[UUID, UUID]]) -> dict[UUID, set[tuple[UUID, UUID]]]:
+    grouped: dict[UUID, set[tuple[UUID, UUID]]] = defaultdict(set)
+    for link in links:
+        grouped[link[0]].add(link)
+    return grouped
+
+
+def _diff_links(
+    existing: set[tuple[UUID, UUID]],
+    wanted: set[tuple[UUID, UUID]],
+    synced_agent_ids: set[UUID],
+    pruned_agent_ids: set[UUID],
+    pruned_target_ids: set[UUID],
+) -> tuple[set[tuple[UUID, UUID]], set[tuple[UUID, UUID]]]:
+    removed = {
+        link
+        for link in existing
+        if (link[0] in synced_agent_ids and link not in wanted)
+        or link[0] in pruned_agent_ids
+        or link[1] in pruned_target_ids
+    }
+    return removed, wanted - existing
@@ -0,0 +1,22 @@
+from typing import Annotated
+
+from app.agents.agent_catalogs.schemas import AgentCatalog, CatalogPlan
+from app.agents.agent_catalogs.services import AgentCatalogService
+from app_base.base.usecases.base import BaseUseCase
+from app_base.core.database.transaction import AsyncTransaction
+from fastapi import Depends
+
+
+class ApplyAgentCatalogUseCase(BaseUseCase):
+    """Sync the agent catalog into the database in a single transaction.
+
+    Usually run from the CLI, whose process has no resolved agents cached: servers see the change
+    through the agents' `updated_at`, which the sync also bumps for agents whose linked skills or MCPs changed.
+    """
+
+    def __init__(self, service: Annotated[AgentCatalogService, Depends()]) -> None:
+        self.service = service
+
+    async def execute(self, catalog: AgentCatalog, dry_run: bool = False, prune: bool = False) -> CatalogPlan:
+        async with AsyncTransaction() as session:
+            return await self.service.sync(session, catalog, prune=prune, apply=not dry_run)
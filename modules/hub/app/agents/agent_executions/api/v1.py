@@ -1,14 +1,32 @@
 from typing import Annotated
 from uuid import UUID
 
-from app.agents.agent_executions.schemas import AgentExecutionCreate, AgentExecutionRead, AgentExecutionUpdate
+from app.agents.agent_executions.filters import (
+    AgentExecutionLatencyFilterDepend,
+    AgentExecutionUsageFilterDepend,
+    UsageGranularityParam,
+)
+from app.agents.agent_executions.schemas import (
+    AgentExecutionCreate,
+    AgentExecutionEventBatch,
+    AgentExecutionIngestResult,
+    AgentExecutionLatencyRead,
+    AgentExecutionRead,
+    AgentExecutionUpdate,
+    AgentExecutionUsageRead,
+)
 from app.agents.agent_executions.usecases.crud import (
     CreateAgentExecutionUseCase,
     DeleteAgentExecutionUseCase,
     GetAgentExecutionUseCase,
+    GetMultiAgentExecutionByCursorUseCase,
     GetMultiAgentExecutionUseCase,
     UpdateAgentExecutionUseCase,
 )
+from app.agents.agent_executions.usecases.ingest import IngestAgentExecutionEventsUseCase
+from app.agents.agent_executions.usecases.latency import GetAgentExecutionLatencyUseCase
+from app.agents.agent_executions.usecases.usage import GetAgentExecutionUsageUseCase
+from app.common.pagination import CursorPage, CursorParam
 from app_base.base.deps.params.page import PaginationParam
 from app_base.base.exceptions.basic import NotFoundException
 from app_base.base.schemas.delete_resp import DeleteResponse
@@ -26,14 +44,43 @@ async def create_agent_execution(
     return await use_case.execute(agent_execution_in)
 
 
-@router.get("", response_model=PaginatedList[AgentExecutionRead])
+@router.post("/events", status_code=status.HTTP_202_ACCEPTED, response_model=AgentExecutionIngestResult)
+async def ingest_agent_execution_events(
+    use_case: Annotated[IngestAgentExecutionEventsUseCase, Depends()],
+    batch_in: AgentExecutionEventBatch,
+):
+    return await use_case.execute(batch_in)
+
+
+@router.get("", response_model=PaginatedList[AgentExecutionRead] | CursorPage[AgentExecutionRead])
 async def get_agent_executions(
     use_case: Annotated[GetMultiAgentExecutionUseCase, Depends()],
+    cursor_use_case: Annotated[GetMultiAgentExecutionByCursorUseCase, Depends()],
     pagination: PaginationParam,
+    cursor: CursorParam = None,
 ):
+    if cursor is not None:
+        return await cursor_use_case.execute(pagination["limit"], cursor)
     return await use_case.execute(**pagination)
 
 
+@router.get("/usage", response_model=list[AgentExecutionUsageRead])
+async def get_agent_execution_usage(
+    use_case: Annotated[GetAgentExecutionUsageUseCase, Depends()],
+    filters: AgentExecutionUsageFilterDepend,
+    granularity: UsageGranularityParam = "day",
+):
+    return await use_case.execute(granularity, where=filters)
+
+
+@router.get("/latency", response_model=list[AgentExecutionLatencyRead])
+async def get_agent_execution_latency(
+    use_case: Annotated[GetAgentExecutionLatencyUseCase, Depends()],
+    labels: AgentExecutionLatencyFilterDepend,
+):
+    return await use_case.execute(labels)
+
+
 @router.get("/{agent_execution_id}", response_model=AgentExecutionRead)
 async def get_agent_execution(
     use_case: Annotated[GetAgentExecutionUseCase, Depends()],
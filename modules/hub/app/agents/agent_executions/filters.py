@@ -0,0 +1,62 @@
+import datetime
+from typing import Annotated, Literal
+from uuid import UUID
+
+from app.agents.agent_executions.enum import AgentExecutionStatus, AgentExecutionType
+from app.agents.agent_executions.models import AgentExecutionUsageHourly
+from fastapi import Depends, Query
+
+
+def filter_usage(
+    filter_created_after: Annotated[
+        datetime.datetime | None, Query(description="Only executions created in or after this hour")
+    ] = None,
+    filter_created_before: Annotated[
+        datetime.datetime | None, Query(description="Only executions created in hours starting before this time")
+    ] = None,
+    filter_configured_agent_id: Annotated[UUID | None, Query(description="Only this configured agent")] = None,
+    filter_graph_agent_name: Annotated[str | None, Query(description="Only this graph agent")] = None,
+    filter_model_name: Annotated[str | None, Query(description="Only this model")] = None,
+) -> list:
+    """Bounds and keys of the usage rollup; time bounds apply to whole hour buckets."""
+    usage = AgentExecutionUsageHourly
+    where = []
+    if filter_created_after is not None:
+        where.append(usage.bucket_start >= filter_created_after.replace(minute=0, second=0, microsecond=0))
+    if filter_created_before is not None:
+        where.append(usage.bucket_start < filter_created_before)
+    if filter_configured_agent_id is not None:
+        where.append(usage.agent_key == str(filter_configured_agent_id))
+    if filter_graph_agent_name is not None:
+        where.append(usage.agent_key == filter_graph_agent_name)
+    if filter_model_name is not None:
+        where.append(usage.model_name == filter_model_name)
+    return where
+
+
+AgentExecutionUsageFilterDepend = Annotated[list, Depends(filter_usage)]
+UsageGranularityParam = Annotated[
+    Literal["hour", "day", "total"], Query(description="Bucket size; `total` sums over the whole range")
+]
+
+
+def filter_latency(
+    filter_configured_agent_id: Annotated[UUID | None, Query(description="Only this configured agent")] = None,
+    filter_graph_agent_name: Annotated[str | None, Query(description="Only this graph agent")] = None,
+    filter_execution_type: Annotated[AgentExecutionType | None, Query(description="Only this execution type")] = None,
+    filter_status: Annotated[AgentExecutionStatus | None, Query(description="Only this terminal status")] = None,
+) -> dict[str, str]:
+    """Label values the latency summaries must match."""
+    labels = {}
+    if filter_configured_agent_id is not None:
+        labels["agent"] = str(filter_configured_agent_id)
+    if filter_graph_agent_name is not None:
+        labels["agent"] = filter_graph_agent_name
+    if filter_execution_type is not None:
+        labels["execution_type"] = filter_execution_type.value
+    if filter_status is not None:
+        labels["status"] = filter_status.value
+    return labels
+
+
+AgentExecutionLatencyFilterDepend = Annotated[dict[str, str], Depends(filter_latency)]
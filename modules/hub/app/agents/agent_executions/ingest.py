@@ -0,0 +1,114 @@
+"""Process-local buffer coalescing agent execution events before they are written.
+
+Events are merged per execution id as they arrive, so `pending -> running -> success` sent within
+one flush window becomes a single row write. Buffered changes live in memory until the background
+flush writes them (on its timer, or early once the buffer is full) and are lost if the process dies
+before it. A flush that fails transiently puts its rows back.
+
+Buffers are per replica, so a change can be flushed before the create of its execution, still
+buffered by another replica. Such rows are deferred: put back for a later flush, a bounded number of times.
+"""
+
+import asyncio
+import enum
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import Any
+from uuid import UUID
+
+from app.agents.agent_executions.enum import AgentExecutionStatus
+from app.agents.agent_executions.schemas import AgentExecutionEvent
+
+TERMINAL_STATUSES = frozenset(
+    {
+        AgentExecutionStatus.SUCCESS.value,
+        AgentExecutionStatus.FAILED.value,
+        AgentExecutionStatus.CANCELLED.value,
+        AgentExecutionStatus.TIMEOUT.value,
+    }
+)
+
+
+def status_rank(status: str) -> int:
+    if status in TERMINAL_STATUSES:
+        return 2
+    return 1 if status == AgentExecutionStatus.RUNNING.value else 0
+
+
+def merge_status(current: str | None, incoming: str) -> str:
+    """Statuses only move forward; the first terminal status wins over late or duplicate events."""
+    if current is None or status_rank(incoming) > status_rank(current):
+        return incoming
+    return current
+
+
+def event_changes(event: AgentExecutionEvent) -> dict[str, Any]:
+    changes = event.model_dump(exclude_none=True)
+    return {key: value.value if isinstance(value, enum.Enum) else value for key, value in changes.items()}
+
+
+class AgentExecutionIngestBuffer:
+    """Pending changes per execution id, in arrival order."""
+
+    def __init__(self) -> None:
+        self._pending: dict[UUID, dict[str, Any]] = {}
+        # How many flushes in a row found no execution for a pending id
+        self._deferrals: dict[UUID, int] = {}
+        # Serializes flushes so an older batch can never be written after a newer one
+        self.flush_lock = asyncio.Lock()
+        # Set when the buffer is full, to wake the background flush before its next tick
+        self.flush_requested = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, events: Iterable[AgentExecutionEvent]) -> None:
+        for event in events:
+            changes = event_changes(event)
+            pending = self._pending.setdefault(event.id, {})
+            status = changes.pop("status", None)
+            if status is not None:
+                pending["status"] = merge_status(pending.get("status"), status)
+            pending.update(changes)
+
+    def drain(self) -> list[dict[str, Any]]:
+        """Take every pending row (a dict of changed columns including `id`) out of the buffer."""
+        rows, self._pending = list(self._pending.values()), {}
+        return rows
+
+    def restore(self, rows: Iterable[dict[str, Any]]) -> None:
+        """Put drained rows back, under the changes buffered since they were drained."""
+        pending = {}
+        for row in rows:
+            merged = dict(row)
+            newer = dict(self._pending.pop(row["id"], {}))
+            status = newer.pop("status", None)
+            if status is not None:
+                merged["status"] = merge_status(merged.get("status"), status)
+            merged.update(newer)
+            pending[row["id"]] = merged
+        self._pending = {**pending, **self._pending}
+
+    def defer(self, rows: Iterable[dict[str, Any]], max_deferrals: int) -> list[dict[str, Any]]:
+        """Put back rows whose execution does not exist yet; returns those deferred too often, which are dropped."""
+        deferred, dropped = [], []
+        for row in rows:
+            count = self._deferrals.get(row["id"], 0) + 1
+            if count > max_deferrals:
+                self._deferrals.pop(row["id"], None)
+                dropped.append(row)
+            else:
+                self._deferrals[row["id"]] = count
+                deferred.append(row)
+        self.restore(deferred)
+        return dropped
+
+    def written(self, ids: Iterable[UUID]) -> None:
+        """Forget the deferrals of rows that have been written."""
+        for obj_id in ids:
+            self._deferrals.pop(obj_id, None)
+
+
+@lru_cache
+def get_agent_execution_ingest_buffer() -> AgentExecutionIngestBuffer:
+    return AgentExecutionIngestBuffer()
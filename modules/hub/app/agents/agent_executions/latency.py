@@ -0,0 +1,36 @@
+"""Execution latency (`completed_at - started_at`) fed to an in-process histogram on completion."""
+
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any
+
+from app.agents.agent_executions.ingest import TERMINAL_STATUSES
+from app.agents.agent_executions.usage import agent_key
+from app.common.metrics import LatencyCollector, get_metrics_registry
+
+LATENCY_LABELS = ("agent", "execution_type", "status")
+
+
+@lru_cache
+def get_execution_latency_collector() -> LatencyCollector:
+    return get_metrics_registry().register(
+        LatencyCollector(
+            "hub_agent_execution_duration_seconds",
+            "Agent execution duration from started_at to completed_at.",
+            LATENCY_LABELS,
+        )
+    )
+
+
+def completed_latency(
+    before: Mapping[str, Any] | None, after: Mapping[str, Any] | None
+) -> tuple[tuple[str, str, str], float] | None:
+    """Labels and duration when a write moved an execution into a terminal status; None otherwise."""
+    if after is None or after["status"] not in TERMINAL_STATUSES:
+        return None
+    if before is not None and before["status"] in TERMINAL_STATUSES:
+        return None
+    started_at, completed_at = after["started_at"], after["completed_at"]
+    if started_at is None or completed_at is None or completed_at < started_at:
+        return None
+    return (agent_key(after), after["execution_type"], after["status"]), (completed_at - started_at).total_seconds()
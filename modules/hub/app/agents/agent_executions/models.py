@@ -1,17 +1,19 @@
 """AgentExecution Model for Hub Module.
 
 AgentExecution: History of agent executions.
+AgentExecutionUsageHourly: Token usage and cost rolled up per hour, agent and model.
 DB Schema Reference: docs/specification/DB_SCHEMA.md#2.4
 """
 
 import datetime
+from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Optional
 from uuid import UUID
 
 from app.agents.agent_executions.enum import AgentExecutionStatus
 from app.common.database import JSON_VARIANT
 from app_base.base.models.mixin import Base, TimestampMixin, UUIDMixin
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, Numeric, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -19,6 +21,10 @@ if TYPE_CHECKING:
     from app.tasks.tasks.models import Task
 
 
+# Exact decimal: the rollup is kept up by adding and subtracting deltas, which binary floats would drift on
+COST = Numeric(18, 8)
+
+
 class AgentExecution(Base, UUIDMixin, TimestampMixin):
     """Agent execution record."""
 
@@ -46,7 +52,37 @@ class AgentExecution(Base, UUIDMixin, TimestampMixin):
     # Usage
     token_usage: Mapped[dict[str, Any] | None] = mapped_column(JSON_VARIANT, nullable=True)
     run_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    # Extracted from token_usage on write (see app.agents.agent_executions.usage)
+    model_name: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    input_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    output_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    total_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    cost: Mapped[Decimal | None] = mapped_column(COST, nullable=True)
 
     # Relationships
     configured_agent: Mapped[Optional["ConfiguredAgent"]] = relationship("ConfiguredAgent")
     task: Mapped[Optional["Task"]] = relationship("Task")
+
+    __table_args__ = (
+        Index("ix_agent_executions_task_id", "task_id"),
+        Index("ix_agent_executions_configured_agent_id", "configured_agent_id"),
+        Index("ix_agent_executions_created_at", "created_at", "id"),
+    )
+
+
+class AgentExecutionUsageHourly(Base):
+    """Usage of the executions created in one hour, per agent and model; maintained incrementally."""
+
+    __tablename__ = "agent_execution_usage_hourly"
+
+    bucket_start: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    agent_type: Mapped[str] = mapped_column(String(50), primary_key=True)
+    # Configured agent id, or graph agent name
+    agent_key: Mapped[str] = mapped_column(String(100), primary_key=True)
+    model_name: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    execution_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    input_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    output_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    total_tokens: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    cost: Mapped[Decimal] = mapped_column(COST, nullable=False, default=0)
@@ -1,7 +1,168 @@
-from app.agents.agent_executions.models import AgentExecution
+from collections import defaultdict
+from collections.abc import Collection, Mapping, Sequence
+from typing import Any, Literal
+from uuid import UUID
+
+from app.agents.agent_executions.enum import AgentExecutionStatus
+from app.agents.agent_executions.ingest import TERMINAL_STATUSES
+from app.agents.agent_executions.models import AgentExecution, AgentExecutionUsageHourly
 from app.agents.agent_executions.schemas import AgentExecutionCreate, AgentExecutionUpdate
+from app.agents.agent_executions.usage import USAGE_COUNTERS, UsageKey, UsageValue
+from app.agents.configured_agents.models import ConfiguredAgent
+from app.common.database import dialect_name, upsert_insert
+from app.common.pagination import CursorPaginationRepositoryMixin, normalize_where
+from app.tasks.tasks.models import Task
 from app_base.base.repos.base import BaseRepository
+from sqlalchemy import Row, and_, bindparam, case, func, literal, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Columns deciding an execution's usage rollup contribution and its completion latency
+EXECUTION_STATE_COLUMNS = (
+    "created_at",
+    "agent_type",
+    "configured_agent_id",
+    "graph_agent_name",
+    "execution_type",
+    "status",
+    "started_at",
+    "completed_at",
+    "model_name",
+    "input_tokens",
+    "output_tokens",
+    "total_tokens",
+    "cost",
+)
+
+
+def _group_by_keys(rows: Sequence[Mapping[str, Any]]) -> dict[tuple[str, ...], list[Mapping[str, Any]]]:
+    # executemany needs identical parameter keys per statement
+    groups: dict[tuple[str, ...], list[Mapping[str, Any]]] = defaultdict(list)
+    for row in rows:
+        groups[tuple(sorted(row))].append(row)
+    return groups
 
 
-class AgentExecutionRepository(BaseRepository[AgentExecution, AgentExecutionCreate, AgentExecutionUpdate]):
+class AgentExecutionRepository(
+    BaseRepository[AgentExecution, AgentExecutionCreate, AgentExecutionUpdate], CursorPaginationRepositoryMixin
+):
     model = AgentExecution
+
+    async def bulk_insert_new(self, session: AsyncSession, rows: Sequence[Mapping[str, Any]]) -> set[UUID]:
+        """Insert the rows carrying the creation fields with multi-row inserts, skipping executions that
+        already exist; returns the ids inserted. Each row holds `id` plus only the columns to set."""
+        inserted: set[UUID] = set()
+        creatable = [row for row in rows if "agent_type" in row and "execution_type" in row]
+        for group in _group_by_keys(creatable).values():
+            stmt = upsert_insert(session, self.model.__table__).on_conflict_do_nothing(index_elements=["id"])
+            result = await session.execute(stmt.returning(self.model.id), list(group))
+            inserted.update(result.scalars().all())
+        return inserted
+
+    async def bulk_update_changes(self, session: AsyncSession, rows: Sequence[Mapping[str, Any]]) -> None:
+        """Apply execution changes with batched updates. Each row holds `id` plus only the columns to set."""
+        for keys, group in _group_by_keys(rows).items():
+            columns = [key for key in keys if key != "id"]
+            if not columns:
+                continue
+            await session.execute(self._update_statement(columns), [_prefixed(row) for row in group])
+
+    async def references_exist(
+        self, session: AsyncSession, configured_agent_ids: Collection[UUID], task_ids: Collection[UUID]
+    ) -> bool:
+        """Whether every configured agent and task id refers to an existing row."""
+        for model, ids in ((ConfiguredAgent, configured_agent_ids), (Task, task_ids)):
+            if ids and await session.scalar(select(func.count()).where(model.id.in_(ids))) != len(ids):
+                return False
+        return True
+
+    async def get_execution_states(
+        self, session: AsyncSession, ids: Collection[UUID], for_update: bool = False
+    ) -> dict[UUID, dict[str, Any]]:
+        """The columns that derived data (usage rollup, latency metrics) is computed from.
+
+        `for_update` locks the rows (in id order, so concurrent writers cannot deadlock) until the
+        transaction ends; callers deriving deltas from the state they are about to change need it.
+        """
+        if not ids:
+            return {}
+        columns = [self.model.__table__.c[name] for name in EXECUTION_STATE_COLUMNS]
+        stmt = select(self.model.id, *columns).where(self.model.id.in_(ids))
+        if for_update:
+            stmt = stmt.order_by(self.model.id).with_for_update()
+        rows = await session.execute(stmt)
+        return {row.id: dict(zip(EXECUTION_STATE_COLUMNS, row[1:], strict=True)) for row in rows}
+
+    async def apply_usage_deltas(self, session: AsyncSession, deltas: Mapping[UsageKey, Sequence[UsageValue]]) -> None:
+        """Add the deltas to the hourly rollup with one multi-row upsert."""
+        if not deltas:
+            return
+        table = AgentExecutionUsageHourly.__table__
+        stmt = upsert_insert(session, table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[column.name for column in table.primary_key],
+            set_={name: table.c[name] + stmt.excluded[name] for name in USAGE_COUNTERS},
+        )
+        rows = [
+            {
+                "bucket_start": bucket_start,
+                "agent_type": agent_type,
+                "agent_key": agent_key,
+                "model_name": model_name,
+                **dict(zip(USAGE_COUNTERS, values, strict=True)),
+            }
+            for (bucket_start, agent_type, agent_key, model_name), values in deltas.items()
+        ]
+        await session.execute(stmt.values(rows))
+
+    async def get_usage(
+        self,
+        session: AsyncSession,
+        granularity: Literal["hour", "day", "total"],
+        where: Sequence | None = None,
+    ) -> list[Row]:
+        usage = AgentExecutionUsageHourly
+        keys = [usage.agent_type, usage.agent_key, usage.model_name]
+        if granularity == "day":
+            if dialect_name(session) == "postgresql":
+                keys.insert(0, func.date_trunc("day", usage.bucket_start, "UTC").label("bucket_start"))
+            else:
+                keys.insert(0, func.strftime("%Y-%m-%d 00:00:00", usage.bucket_start).label("bucket_start"))
+        elif granularity == "hour":
+            keys.insert(0, usage.bucket_start)
+        stmt = (
+            select(*keys, *(func.sum(getattr(usage, name)).label(name) for name in USAGE_COUNTERS))
+            .where(*normalize_where(where))
+            .group_by(*keys)
+            # Contributions moved to another key leave zeroed rows behind
+            .having(func.sum(usage.execution_count) > 0)
+            .order_by(*keys)
+        )
+        return list((await session.execute(stmt)).all())
+
+    def _update_statement(self, columns: Sequence[str]):
+        table = self.model.__table__
+        values: dict[str, Any] = {
+            column: bindparam(f"p_{column}", type_=table.c[column].type) for column in columns if column != "status"
+        }
+        if "status" in columns:
+            incoming = bindparam("p_status", type_=table.c.status.type)
+            # Same rule as the buffer: never move back from running to pending, nor out of a terminal status
+            values["status"] = case(
+                (
+                    or_(
+                        # Individual literals: an expanding IN cannot be used with executemany
+                        table.c.status.in_([literal(status) for status in sorted(TERMINAL_STATUSES)]),
+                        and_(
+                            table.c.status == AgentExecutionStatus.RUNNING.value,
+                            incoming == AgentExecutionStatus.PENDING.value,
+                        ),
+                    ),
+                    table.c.status,
+                ),
+                else_=incoming,
+            )
+        return update(table).where(table.c.id == bindparam("p_id")).values(values)
+
+
+def _prefixed(row: Mapping[str, Any]) -> dict[str, Any]:
+    return {f"p_{key}": value for key, value in row.items()}
@@ -9,7 +9,7 @@ from uuid import UUID
 
 from app.agents.agent_executions.enum import AgentExecutionStatus, AgentExecutionType, AgentType
 from app_base.base.schemas.mixin import UUIDSchemaMixin
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class AgentExecutionBase(BaseModel):
@@ -51,7 +51,84 @@ class AgentExecutionUpdate(BaseModel):
 class AgentExecutionRead(UUIDSchemaMixin, AgentExecutionBase):
     """Schema for reading AgentExecution data."""
 
+    model_name: str | None = Field(default=None, description="Model reported in token usage")
+    input_tokens: int | None = Field(default=None, description="Input tokens")
+    output_tokens: int | None = Field(default=None, description="Output tokens")
+    total_tokens: int | None = Field(default=None, description="Total tokens")
+    cost: float | None = Field(default=None, description="Reported cost")
+
     created_at: datetime.datetime = Field(..., description="Creation timestamp")
     updated_at: datetime.datetime = Field(..., description="Last update timestamp")
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class AgentExecutionUsageRead(BaseModel):
+    """Usage aggregated over a time bucket (or the whole range), agent and model."""
+
+    bucket_start: datetime.datetime | None = Field(default=None, description="Bucket start; null for totals")
+    agent_type: AgentType = Field(..., description="Type of agent")
+    agent_key: str = Field(..., description="Configured agent ID or graph agent name")
+    model_name: str = Field(..., description="Model name; empty when not reported")
+    execution_count: int = Field(..., description="Executions that reported usage")
+    input_tokens: int = Field(..., description="Input tokens")
+    output_tokens: int = Field(..., description="Output tokens")
+    total_tokens: int = Field(..., description="Total tokens")
+    cost: float = Field(..., description="Reported cost")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AgentExecutionLatencyRead(BaseModel):
+    """Latency percentiles of completed executions observed by this hub process."""
+
+    agent_key: str = Field(..., description="Configured agent ID or graph agent name")
+    execution_type: str = Field(..., description="Type of execution")
+    status: str = Field(..., description="Terminal status")
+    count: int = Field(..., description="Completed executions observed")
+    p50: float = Field(..., description="Median duration in seconds")
+    p95: float = Field(..., description="95th percentile duration in seconds")
+    p99: float = Field(..., description="99th percentile duration in seconds")
+    max: float = Field(..., description="Longest duration in seconds")
+
+
+class AgentExecutionEvent(BaseModel):
+    """A state change of an execution, identified by a client-generated id.
+
+    The first event of an execution carries `agent_type` and `execution_type` (and may carry the
+    other creation fields); later events only carry what changed. Unset fields are left untouched.
+    """
+
+    id: UUID = Field(..., description="Execution ID, generated by the client")
+    agent_type: AgentType | None = Field(default=None, description="Type of agent; required to create")
+    configured_agent_id: UUID | None = Field(default=None, description="Configured Agent ID")
+    graph_agent_name: str | None = Field(default=None, max_length=100, description="Graph Agent Name")
+    task_id: UUID | None = Field(default=None, description="Associated Task ID")
+    execution_type: AgentExecutionType | None = Field(default=None, description="Type of execution; required to create")
+    status: AgentExecutionStatus | None = Field(default=None, description="Execution status")
+    input_data: dict[str, Any] | None = Field(default=None, description="Input data")
+    output_data: dict[str, Any] | None = Field(default=None, description="Output data")
+    error_message: str | None = Field(default=None, description="Error message")
+    started_at: datetime.datetime | None = Field(default=None, description="Start timestamp")
+    completed_at: datetime.datetime | None = Field(default=None, description="Completion timestamp")
+    token_usage: dict[str, Any] | None = Field(default=None, description="Token usage data")
+    run_id: str | None = Field(default=None, max_length=100, description="Run ID")
+
+    @model_validator(mode="after")
+    def _check_creation_fields(self) -> "AgentExecutionEvent":
+        if (self.agent_type is None) != (self.execution_type is None):
+            raise ValueError("agent_type and execution_type must be given together")
+        return self
+
+
+class AgentExecutionEventBatch(BaseModel):
+    """A batch of execution events, applied in order."""
+
+    events: list[AgentExecutionEvent] = Field(..., min_length=1, max_length=1000, description="Events in order")
+
+
+class AgentExecutionIngestResult(BaseModel):
+    """Outcome of an ingestion request."""
+
+    accepted: int = Field(..., description="Number of events accepted")
+    buffered: int = Field(..., description="Executions with changes not yet written")
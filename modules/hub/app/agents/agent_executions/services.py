@@ -1,8 +1,16 @@
-from typing import Annotated
+from collections.abc import Mapping, Sequence
+from typing import Annotated, Any, Literal
+from uuid import UUID
 
+from app.agents.agent_executions.ingest import TERMINAL_STATUSES
+from app.agents.agent_executions.latency import completed_latency, get_execution_latency_collector
 from app.agents.agent_executions.models import AgentExecution
 from app.agents.agent_executions.repos import AgentExecutionRepository
-from app.agents.agent_executions.schemas import AgentExecutionCreate, AgentExecutionUpdate
+from app.agents.agent_executions.schemas import AgentExecutionCreate, AgentExecutionEvent, AgentExecutionUpdate
+from app.agents.agent_executions.usage import extract_usage, usage_deltas
+from app.common.metrics import observe_after_commit
+from app.common.pagination import CursorPaginationServiceMixin
+from app_base.base.exceptions.basic import BadRequestException
 from app_base.base.services.base import (
     BaseContextKwargs,
     BaseCreateServiceMixin,
@@ -12,9 +20,12 @@ from app_base.base.services.base import (
     BaseUpdateServiceMixin,
 )
 from fastapi import Depends
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class AgentExecutionService(
+    CursorPaginationServiceMixin,
     BaseCreateServiceMixin[AgentExecutionRepository, AgentExecution, AgentExecutionCreate, BaseContextKwargs],
     BaseGetMultiServiceMixin[AgentExecutionRepository, AgentExecution, BaseContextKwargs],
     BaseGetServiceMixin[AgentExecutionRepository, AgentExecution, BaseContextKwargs],
@@ -31,3 +42,86 @@ class AgentExecutionService(
     @property
     def context_model(self):
         return BaseContextKwargs
+
+    async def create(
+        self,
+        session: AsyncSession,
+        obj_in: AgentExecutionCreate,
+        context: BaseContextKwargs | None = None,
+        **update_fields,
+    ) -> AgentExecution:
+        """Create an execution, extracting its usage columns and counting it in the usage rollup and
+        latency metrics."""
+        usage = extract_usage(obj_in.token_usage)
+        execution = await super().create(session, obj_in, context, **usage, **update_fields)
+        if usage or obj_in.status.value in TERMINAL_STATUSES:
+            await self._sync_derived(session, {execution.id: None})
+        return execution
+
+    async def update(
+        self,
+        session: AsyncSession,
+        obj_id: UUID,
+        obj_in: AgentExecutionUpdate,
+        context: BaseContextKwargs | None = None,
+        **update_fields,
+    ) -> AgentExecution:
+        """Update an execution; a new `token_usage` replaces its usage columns and its rollup contribution."""
+        if obj_in.token_usage is None and (obj_in.status is None or obj_in.status.value not in TERMINAL_STATUSES):
+            return await super().update(session, obj_id, obj_in, context, **update_fields)
+        # Locked: a concurrent write of this execution must not subtract the same contribution again
+        before = await self.repo.get_execution_states(session, [obj_id], for_update=True)
+        usage = extract_usage(obj_in.token_usage)
+        execution = await super().update(session, obj_id, obj_in, context, **usage, **update_fields)
+        if execution is not None:
+            await self._sync_derived(session, {obj_id: before.get(obj_id)})
+        return execution
+
+    async def ingest(self, session: AsyncSession, rows: Sequence[Mapping[str, Any]]) -> list[Mapping[str, Any]]:
+        """Write coalesced execution changes drained from the ingestion buffer.
+
+        New executions are inserted first. The state of the others is then read under a row lock before
+        they are updated, so a concurrent write of the same execution (another replica's flush, a PUT)
+        waits and each rollup contribution is replaced exactly once. Returns the rows left unwritten
+        because their execution does not exist (yet).
+        """
+        if not rows:
+            return []
+        values = [{**row, **extract_usage(row["token_usage"])} if "token_usage" in row else row for row in rows]
+        inserted = await self.repo.bulk_insert_new(session, values)
+        changed = [row for row in values if row["id"] not in inserted]
+        before = await self.repo.get_execution_states(session, [row["id"] for row in changed], for_update=True)
+        await self.repo.bulk_update_changes(session, [row for row in changed if row["id"] in before])
+        written = inserted | set(before)
+        # Only a new token_usage or a terminal status changes the usage rollup or latency metrics
+        derived_ids = [
+            row["id"]
+            for row in rows
+            if row["id"] in written and ("token_usage" in row or row.get("status") in TERMINAL_STATUSES)
+        ]
+        if derived_ids:
+            await self._sync_derived(session, {obj_id: before.get(obj_id) for obj_id in derived_ids})
+        return [row for row in rows if row["id"] not in written]
+
+    async def ensure_event_references_exist(self, session: AsyncSession, events: Sequence[AgentExecutionEvent]) -> None:
+        """Reject events linking to unknown configured agents or tasks before they are buffered."""
+        configured_agent_ids = {event.configured_agent_id for event in events if event.configured_agent_id}
+        task_ids = {event.task_id for event in events if event.task_id}
+        if not await self.repo.references_exist(session, configured_agent_ids, task_ids):
+            raise BadRequestException("Events refer to an unknown configured_agent_id or task_id")
+
+    async def get_usage(
+        self, session: AsyncSession, granularity: Literal["hour", "day", "total"], where: Sequence | None = None
+    ) -> list[Row]:
+        return await self.repo.get_usage(session, granularity, where=where)
+
+    async def _sync_derived(self, session: AsyncSession, before: Mapping[UUID, Mapping[str, Any] | None]) -> None:
+        """Apply the usage rollup deltas and latency observations of executions written in this session."""
+        after = await self.repo.get_execution_states(session, list(before))
+        changes = [(state, after.get(obj_id)) for obj_id, state in before.items()]
+        await self.repo.apply_usage_deltas(session, usage_deltas(changes))
+        collector = get_execution_latency_collector()
+        for state_before, state_after in changes:
+            observation = completed_latency(state_before, state_after)
+            if observation is not None:
+                observe_after_commit(session, collector, *observation)
@@ -0,0 +1,81 @@
+"""Typed token usage extracted from `AgentExecution.token_usage`, and hourly rollup deltas.
+
+Rollup rows are keyed by the hour of the execution's `created_at`, the agent and the model. Every
+write computes each touched execution's contribution before and after the change and applies only
+the difference, so repeated usage reports for one execution are never double counted.
+"""
+
+import datetime
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
+from decimal import Decimal
+from typing import Any
+
+USAGE_COUNTERS = ("execution_count", "input_tokens", "output_tokens", "total_tokens", "cost")
+
+UsageKey = tuple[datetime.datetime, str, str, str]
+# Token counts are ints and cost a Decimal, so deltas of one execution cancel exactly
+UsageValue = int | Decimal
+
+
+def _first_number(usage: Mapping[str, Any], *keys: str) -> int | float | None:
+    for key in keys:
+        value = usage.get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return value
+    return None
+
+
+def extract_usage(token_usage: Mapping[str, Any] | None) -> dict[str, Any]:
+    """Typed usage columns from a provider usage blob (OpenAI- and Anthropic-style keys)."""
+    if not token_usage:
+        return {}
+    input_tokens = _first_number(token_usage, "input_tokens", "prompt_tokens")
+    output_tokens = _first_number(token_usage, "output_tokens", "completion_tokens")
+    total_tokens = _first_number(token_usage, "total_tokens")
+    if total_tokens is None and (input_tokens is not None or output_tokens is not None):
+        total_tokens = (input_tokens or 0) + (output_tokens or 0)
+    model_name = token_usage.get("model") or token_usage.get("model_name")
+    cost = _first_number(token_usage, "cost", "total_cost", "cost_usd")
+    return {
+        "input_tokens": int(input_tokens) if input_tokens is not None else None,
+        "output_tokens": int(output_tokens) if output_tokens is not None else None,
+        "total_tokens": int(total_tokens) if total_tokens is not None else None,
+        # Through str, so 0.1 becomes Decimal("0.1") rather than the binary float's expansion
+        "cost": Decimal(str(cost)) if cost is not None else None,
+        "model_name": str(model_name)[:100] if model_name else None,
+    }
+
+
+def hour_start(value: datetime.datetime) -> datetime.datetime:
+    value = value.astimezone(datetime.UTC) if value.tzinfo else value.replace(tzinfo=datetime.UTC)
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def agent_key(state: Mapping[str, Any]) -> str:
+    if state.get("configured_agent_id") is not None:
+        return str(state["configured_agent_id"])
+    return state.get("graph_agent_name") or ""
+
+
+def _contribution(state: Mapping[str, Any] | None) -> tuple[UsageKey, tuple[UsageValue, ...]] | None:
+    # Only executions that reported usage are counted
+    if state is None or all(state.get(name) is None for name in USAGE_COUNTERS[1:]):
+        return None
+    key = (hour_start(state["created_at"]), state["agent_type"], agent_key(state), state.get("model_name") or "")
+    return key, (1, *(state.get(name) or 0 for name in USAGE_COUNTERS[1:]))
+
+
+def usage_deltas(
+    changes: Iterable[tuple[Mapping[str, Any] | None, Mapping[str, Any] | None]],
+) -> dict[UsageKey, tuple[UsageValue, ...]]:
+    """Net rollup change for `(state before, state after)` pairs of executions, zero deltas dropped."""
+    deltas: dict[UsageKey, list[UsageValue]] = defaultdict(lambda: [0] * len(USAGE_COUNTERS))
+    for before, after in changes:
+        for state, sign in ((before, -1), (after, 1)):
+            contribution = _contribution(state)
+            if contribution is None:
+                continue
+            key, counters = contribution
+            deltas[key] = [total + sign * value for total, value in zip(deltas[key], counters, strict=True)]
+    return {key: tuple(values) for key, values in deltas.items() if any(values)}
@@ -3,6 +3,7 @@ from typing import Annotated
 from app.agents.agent_executions.models import AgentExecution
 from app.agents.agent_executions.schemas import AgentExecutionCreate, AgentExecutionUpdate
 from app.agents.agent_executions.services import AgentExecutionService, BaseContextKwargs
+from app.common.pagination import BaseGetMultiByCursorUseCase
 from app_base.base.usecases.crud import (
     BaseCreateUseCase,
     BaseDeleteUseCase,
@@ -23,6 +24,11 @@ class GetMultiAgentExecutionUseCase(BaseGetMultiUseCase[AgentExecutionService, A
         super().__init__(service)
 
 
+class GetMultiAgentExecutionByCursorUseCase(BaseGetMultiByCursorUseCase[AgentExecutionService]):
+    def __init__(self, service: Annotated[AgentExecutionService, Depends()]) -> None:
+        super().__init__(service)
+
+
 class CreateAgentExecutionUseCase(
     BaseCreateUseCase[AgentExecutionService, AgentExecution, AgentExecutionCreate, BaseContextKwargs]
 ):
@@ -0,0 +1,89 @@
+import asyncio
+from collections.abc import Sequence
+from typing import Annotated, Any
+
+from app.agents.agent_executions.ingest import get_agent_execution_ingest_buffer
+from app.agents.agent_executions.schemas import AgentExecutionEventBatch, AgentExecutionIngestResult
+from app.agents.agent_executions.services import AgentExecutionService
+from app.common.settings import get_hub_settings
+from app_base.base.usecases.base import BaseUseCase
+from app_base.core.database.transaction import AsyncTransaction
+from app_base.core.log import logger
+from fastapi import Depends
+from sqlalchemy.exc import DataError, DBAPIError, IntegrityError
+
+# Errors caused by the rows themselves: retrying them unchanged would fail again
+_INVALID_ROW_ERRORS = (IntegrityError, DataError)
+
+
+class FlushAgentExecutionEventsUseCase(BaseUseCase):
+    """Write everything buffered so far; returns the number of executions written.
+
+    The whole buffer goes in one transaction. If a row is invalid (e.g. its task was deleted after the
+    events were accepted), the rows are retried one savepoint each and only the invalid ones are dropped.
+    On a transient failure or cancellation nothing is lost: the rows go back into the buffer. Changes of
+    executions not created yet are deferred to a later flush (see `AgentExecutionIngestBuffer.defer`).
+    """
+
+    def __init__(self, service: Annotated[AgentExecutionService, Depends()]) -> None:
+        self.service = service
+
+    async def execute(self) -> int:
+        buffer = get_agent_execution_ingest_buffer()
+        async with buffer.flush_lock:
+            rows = buffer.drain()
+            if not rows:
+                return 0
+            try:
+                try:
+                    async with AsyncTransaction() as session:
+                        missing = await self.service.ingest(session, rows)
+                    written = len(rows) - len(missing)
+                except _INVALID_ROW_ERRORS:
+                    written, missing = await self._ingest_each(rows)
+            except (DBAPIError, OSError, asyncio.CancelledError):
+                # Rewriting a row that was in fact committed is harmless: ingestion is idempotent
+                buffer.restore(rows)
+                raise
+            except Exception:
+                logger.exception(f"Dropped {len(rows)} buffered agent execution changes")
+                raise
+            missing_ids = {row["id"] for row in missing}
+            buffer.written(row["id"] for row in rows if row["id"] not in missing_ids)
+            for row in buffer.defer(missing, get_hub_settings().AGENT_EXECUTION_INGEST_MAX_DEFERRALS):
+                logger.warning(f"Dropped agent execution change for '{row['id']}': the execution was never created")
+            return written
+
+    async def _ingest_each(self, rows: Sequence[dict[str, Any]]) -> tuple[int, list[dict[str, Any]]]:
+        """Write the rows one savepoint each, dropping invalid ones; returns how many were written and the
+        rows of executions that do not exist yet."""
+        written, missing = 0, []
+        async with AsyncTransaction() as session:
+            for row in rows:
+                try:
+                    async with session.begin_nested():
+                        unwritten = await self.service.ingest(session, [row])
+                    if unwritten:
+                        missing += unwritten
+                    else:
+                        written += 1
+                except _INVALID_ROW_ERRORS:
+                    logger.exception(f"Dropped invalid agent execution change for '{row['id']}'")
+        return written, missing
+
+
+class IngestAgentExecutionEventsUseCase(BaseUseCase):
+    """Buffer execution events; filling the buffer wakes the background flush."""
+
+    def __init__(self, service: Annotated[AgentExecutionService, Depends()]) -> None:
+        self.service = service
+
+    async def execute(self, batch: AgentExecutionEventBatch) -> AgentExecutionIngestResult:
+        if any(event.configured_agent_id or event.task_id for event in batch.events):
+            async with AsyncTransaction() as session:
+                await self.service.ensure_event_references_exist(session, batch.events)
+        buffer = get_agent_execution_ingest_buffer()
+        buffer.add(batch.events)
+        if len(buffer) >= get_hub_settings().AGENT_EXECUTION_INGEST_MAX_BUFFERED:
+            buffer.flush_requested.set()
+        return AgentExecutionIngestResult(accepted=len(batch.events), buffered=len(buffer))
@@ -0,0 +1,30 @@
+from collections.abc import Mapping
+
+from app.agents.agent_executions.latency import LATENCY_LABELS, get_execution_latency_collector
+from app.agents.agent_executions.schemas import AgentExecutionLatencyRead
+from app_base.base.usecases.base import BaseUseCase
+
+
+class GetAgentExecutionLatencyUseCase(BaseUseCase):
+    """Latency percentiles from the in-process histograms; no database access."""
+
+    async def execute(self, labels: Mapping[str, str] | None = None) -> list[AgentExecutionLatencyRead]:
+        labels = labels or {}
+        results = []
+        for summary in get_execution_latency_collector().summaries():
+            values = dict(zip(LATENCY_LABELS, summary.labels, strict=True))
+            if any(values[name] != value for name, value in labels.items()):
+                continue
+            results.append(
+                AgentExecutionLatencyRead(
+                    agent_key=values["agent"],
+                    execution_type=values["execution_type"],
+                    status=values["status"],
+                    count=summary.count,
+                    p50=summary.quantiles[0.5],
+                    p95=summary.quantiles[0.95],
+                    p99=summary.quantiles[0.99],
+                    max=summary.max_seconds,
+                )
+            )
+        return results
@@ -0,0 +1,22 @@
+from collections.abc import Sequence
+from typing import Annotated, Literal
+
+from app.agents.agent_executions.schemas import AgentExecutionUsageRead
+from app.agents.agent_executions.services import AgentExecutionService
+from app_base.base.usecases.base import BaseUseCase
+from app_base.core.database.transaction import AsyncTransaction
+from fastapi import Depends
+
+
+class GetAgentExecutionUsageUseCase(BaseUseCase):
+    """Token usage and cost read from the hourly rollup."""
+
+    def __init__(self, service: Annotated[AgentExecutionService, Depends()]) -> None:
+        self.service = service
+
+    async def execute(
+        self, granularity: Literal["hour", "day", "total"], where: Sequence | None = None
+    ) -> list[AgentExecutionUsageRead]:
+        async with AsyncTransaction() as session:
+            rows = await self.service.get_usage(session, granularity, where=where)
+        return [AgentExecutionUsageRead.model_validate(row) for row in rows]
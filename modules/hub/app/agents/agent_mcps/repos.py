@@ -1,7 +1,8 @@
 from app.agents.agent_mcps.models import AgentMCP
 from app.agents.agent_mcps.schemas import AgentMCPCreate, AgentMCPUpdate
+from app.common.database import NamedBulkRepositoryMixin
 from app_base.base.repos.base import BaseRepository
 
 
-class AgentMCPRepository(BaseRepository[AgentMCP, AgentMCPCreate, AgentMCPUpdate]):
+class AgentMCPRepository(BaseRepository[AgentMCP, AgentMCPCreate, AgentMCPUpdate], NamedBulkRepositoryMixin):
     model = AgentMCP
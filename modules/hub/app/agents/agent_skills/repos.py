@@ -1,7 +1,8 @@
 from app.agents.agent_skills.models import AgentSkill
 from app.agents.agent_skills.schemas import AgentSkillCreate, AgentSkillUpdate
+from app.common.database import NamedBulkRepositoryMixin
 from app_base.base.repos.base import BaseRepository
 
 
-class AgentSkillRepository(BaseRepository[AgentSkill, AgentSkillCreate, AgentSkillUpdate]):
+class AgentSkillRepository(BaseRepository[AgentSkill, AgentSkillCreate, AgentSkillUpdate], NamedBulkRepositoryMixin):
     model = AgentSkill
@@ -2,7 +2,7 @@ from typing import Annotated
 from uuid import UUID
 
 import yaml
-from app.agents.ai_model_catalogs.schemas import AIModelCatalogCreate, AIModelCatalogRead
+from app.agents.ai_model_catalogs.schemas import AIModelCatalogCreate, AIModelCatalogDiff, AIModelCatalogRead
 from app.agents.ai_model_catalogs.usecases.crud import (
     CreateAIModelCatalogUseCase,
     DeleteAIModelCatalogUseCase,
@@ -10,22 +10,33 @@ from app.agents.ai_model_catalogs.usecases.crud import (
     GetAIModelCatalogUseCase,
     GetMultiAIModelCatalogUseCase,
 )
+from app.agents.ai_model_catalogs.usecases.diff import DiffAIModelCatalogsUseCase
+from app.common.etag import IfNoneMatchHeader, etag_response
 from app_base.base.deps.params.page import PaginationParam
 from app_base.base.exceptions.basic import BadRequestException, NotFoundException
 from app_base.base.schemas.delete_resp import DeleteResponse
 from app_base.base.schemas.paginated import PaginatedList
-from fastapi import APIRouter, Depends, File, UploadFile, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, File, Query, UploadFile, status
+from fastapi.responses import Response, StreamingResponse
 
 router = APIRouter(prefix="/ai_model_catalogs", tags=["AIModelCatalog"], dependencies=[])
 
 
-@router.post("", status_code=status.HTTP_201_CREATED, response_model=AIModelCatalogRead)
+@router.post(
+    "",
+    status_code=status.HTTP_201_CREATED,
+    response_model=AIModelCatalogRead,
+    responses={status.HTTP_200_OK: {"description": "Catalog unchanged; the latest version is returned"}},
+)
 async def create_ai_model_catalog(
     use_case: Annotated[CreateAIModelCatalogUseCase, Depends()],
     ai_model_catalog_in: AIModelCatalogCreate,
+    response: Response,
 ):
-    return await use_case.execute(ai_model_catalog_in)
+    ai_model_catalog, created = await use_case.execute(ai_model_catalog_in)
+    if not created:
+        response.status_code = status.HTTP_200_OK
+    return ai_model_catalog
 
 
 @router.get("", response_model=PaginatedList[AIModelCatalogRead])
@@ -36,17 +47,26 @@ async def get_ai_model_catalogs(
     return await use_case.execute(**pagination)
 
 
-@router.post("/upload_yaml", status_code=status.HTTP_201_CREATED, response_model=AIModelCatalogRead)
+@router.post(
+    "/upload_yaml",
+    status_code=status.HTTP_201_CREATED,
+    response_model=AIModelCatalogRead,
+    responses={status.HTTP_200_OK: {"description": "Catalog unchanged; the latest version is returned"}},
+)
 async def upload_yaml_ai_model_catalog(
     use_case: Annotated[CreateAIModelCatalogUseCase, Depends()],
     file: Annotated[UploadFile, File(description="YAML file containing AI Model data")],
+    response: Response,
 ):
     file_content = await file.read()
     try:
         ai_model_catalog_in = AIModelCatalogCreate(data=yaml.safe_load(file_content))
     except yaml.YAMLError as e:
         raise BadRequestException(f"Invalid YAML file: {e}") from e
-    return await use_case.execute(ai_model_catalog_in)
+    ai_model_catalog, created = await use_case.execute(ai_model_catalog_in)
+    if not created:
+        response.status_code = status.HTTP_200_OK
+    return ai_model_catalog
 
 
 @router.get("/download_yaml", response_class=StreamingResponse)
@@ -60,24 +80,35 @@ async def download_yaml_ai_model_catalog(
     return StreamingResponse(yaml.dump(ai_model_catalog.data), media_type="text/yaml")
 
 
-@router.get("/download_yaml/latest", response_class=StreamingResponse)
+@router.get("/download_yaml/latest", response_class=Response)
 async def download_yaml_latest_ai_model_catalog(
     use_case: Annotated[GetAIModelCatalogLatestUseCase, Depends()],
+    if_none_match: IfNoneMatchHeader = None,
 ):
-    ai_model_catalog = await use_case.execute()
-    if not ai_model_catalog:
+    snapshot = await use_case.execute()
+    if not snapshot:
         raise NotFoundException()
-    return StreamingResponse(yaml.dump(ai_model_catalog.data), media_type="text/yaml")
+    return etag_response(snapshot.yaml_bytes, "text/yaml", snapshot.etag, if_none_match)
 
 
 @router.get("/latest", response_model=AIModelCatalogRead)
 async def get_latest_ai_model_catalog(
     use_case: Annotated[GetAIModelCatalogLatestUseCase, Depends()],
+    if_none_match: IfNoneMatchHeader = None,
 ):
-    ai_model_catalog = await use_case.execute()
-    if not ai_model_catalog:
+    snapshot = await use_case.execute()
+    if not snapshot:
         raise NotFoundException()
-    return ai_model_catalog
+    return etag_response(snapshot.json_bytes, "application/json", snapshot.etag, if_none_match)
+
+
+@router.get("/diff", response_model=AIModelCatalogDiff)
+async def diff_ai_model_catalogs(
+    use_case: Annotated[DiffAIModelCatalogsUseCase, Depends()],
+    from_version: Annotated[int, Query(description="Base catalog version")],
+    to_version: Annotated[int | None, Query(description="Compared catalog version; defaults to the latest")] = None,
+):
+    return await use_case.execute(from_version, to_version)
 
 
 @router.get("/{ai_model_catalog_id}", response_model=AIModelCatalogRead)
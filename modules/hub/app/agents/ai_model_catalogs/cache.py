@@ -0,0 +1,57 @@
+"""Process-local cache of the latest AI model catalog.
+
+Entries are keyed by catalog `(version, id)`. Readers first probe the newest version (one lookup on
+the unique version index) and only load and parse the JSON blob when that row is not cached yet, so
+a catalog uploaded or deleted through any worker is picked up on the next read without cross-process
+messaging. The id is part of the key because deleting the newest version lets the next upload reuse
+its number.
+Snapshots also keep the JSON and YAML renderings of the catalog, built on first use, so polling
+workers are answered from bytes (or a bare 304 via the ETag) instead of re-serializing the blob.
+"""
+
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import Any
+from uuid import UUID
+
+import yaml
+from app.agents.ai_model_catalogs.schemas import AIModelCatalogRead
+from cachetools import LRUCache
+
+
+@dataclass(frozen=True)
+class AIModelCatalogSnapshot:
+    """A parsed catalog together with its name-to-model index."""
+
+    catalog: AIModelCatalogRead
+    models: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    @property
+    def etag(self) -> str:
+        # Every version is its own row, so the row id identifies the content
+        return f'"{self.catalog.id}"'
+
+    @cached_property
+    def json_bytes(self) -> bytes:
+        return self.catalog.model_dump_json().encode()
+
+    @cached_property
+    def yaml_bytes(self) -> bytes:
+        return yaml.dump(self.catalog.data).encode()
+
+
+def index_models(data: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """Index the catalog's `models` entries by name.
+
+    Accepts both a list of model dicts carrying a `name` and a mapping of name to model dict.
+    """
+    models = data.get("models") or {}
+    if isinstance(models, dict):
+        return {str(name): spec for name, spec in models.items() if isinstance(spec, dict)}
+    return {str(spec["name"]): spec for spec in models if isinstance(spec, dict) and spec.get("name") is not None}
+
+
+@lru_cache
+def get_ai_model_catalog_cache() -> LRUCache[tuple[int, UUID], AIModelCatalogSnapshot]:
+    # A couple of versions is enough: readers only ever ask for the newest one
+    return LRUCache(maxsize=4)
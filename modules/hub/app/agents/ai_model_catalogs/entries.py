@@ -0,0 +1,61 @@
+"""Normalization of a catalog into named, content-hashed entries.
+
+Every list section of named dicts (`models: [{name: ...}]`) or mapping section of dicts
+(`models: {name: {...}}`) yields one entry per item; any other top-level key yields a single entry
+named after nothing (`""`). Hashes are taken over canonical JSON (sorted keys), and the catalog hash
+over the sorted entry hashes, so reordering entries or keys does not count as a change.
+"""
+
+import hashlib
+from typing import Any
+
+import orjson
+
+EntryKey = tuple[str, str]
+
+
+def content_hash(value: Any) -> str:
+    return hashlib.sha256(orjson.dumps(value, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def _named_items(value: Any) -> dict[str, dict[str, Any]] | None:
+    if isinstance(value, dict) and value and all(isinstance(item, dict) for item in value.values()):
+        return {str(name): item for name, item in value.items()}
+    if (
+        isinstance(value, list)
+        and value
+        and all(isinstance(item, dict) and item.get("name") is not None for item in value)
+    ):
+        return {str(item["name"]): item for item in value}
+    return None
+
+
+def normalize_catalog(data: dict[str, Any]) -> dict[EntryKey, dict[str, Any]]:
+    """Split catalog data into entries keyed by `(section, name)`."""
+    entries: dict[EntryKey, dict[str, Any]] = {}
+    for section, value in data.items():
+        items = _named_items(value)
+        if items is None:
+            entries[(str(section), "")] = {"value": value}
+            continue
+        for name, item in items.items():
+            entries[(str(section), name)] = item
+    return entries
+
+
+def hash_entries(entries: dict[EntryKey, dict[str, Any]]) -> dict[EntryKey, str]:
+    return {key: content_hash(item) for key, item in entries.items()}
+
+
+def catalog_hash(entry_hashes: dict[EntryKey, str]) -> str:
+    return content_hash(sorted([section, name, digest] for (section, name), digest in entry_hashes.items()))
+
+
+def diff_entry_hashes(
+    old: dict[EntryKey, str], new: dict[EntryKey, str]
+) -> tuple[list[EntryKey], list[EntryKey], list[EntryKey]]:
+    """Return the `(added, removed, changed)` entry keys going from `old` to `new`, sorted."""
+    added = sorted(new.keys() - old.keys())
+    removed = sorted(old.keys() - new.keys())
+    changed = sorted(key for key in new.keys() & old.keys() if new[key] != old[key])
+    return added, removed, changed
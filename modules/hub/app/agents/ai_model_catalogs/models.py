@@ -1,12 +1,15 @@
 """AI Model Catalog Model for Hub Module.
 
 AIModelCatalog: AI model catalog storage.
+AIModelCatalogEntry: One named entry (model, alias, ...) of a catalog version with its content hash.
 DB Schema Reference: docs/specification/DB_SCHEMA.md#2.1
 """
 
+from uuid import UUID
+
 from app.common.database import JSON_VARIANT
 from app_base.base.models.mixin import Base, TimestampMixin, UUIDMixin
-from sqlalchemy import Integer
+from sqlalchemy import ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -17,3 +20,19 @@ class AIModelCatalog(Base, UUIDMixin, TimestampMixin):
 
     version: Mapped[int] = mapped_column(Integer, nullable=False)
     data: Mapped[dict] = mapped_column(JSON_VARIANT, nullable=False)
+    # Order-insensitive hash over the entry hashes; null for versions stored before hashing existed
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+    __table_args__ = (Index("ix_ai_model_catalogs_version", "version", unique=True),)
+
+
+class AIModelCatalogEntry(Base):
+    """Normalized entry of a catalog version, keyed by its section (e.g. `models`) and name."""
+
+    __tablename__ = "ai_model_catalog_entries"
+
+    catalog_id: Mapped[UUID] = mapped_column(ForeignKey("ai_model_catalogs.id", ondelete="CASCADE"), primary_key=True)
+    section: Mapped[str] = mapped_column(String(50), primary_key=True)
+    name: Mapped[str] = mapped_column(String(255), primary_key=True)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    data: Mapped[dict] = mapped_column(JSON_VARIANT, nullable=False)
@@ -1,7 +1,51 @@
-from app.agents.ai_model_catalogs.models import AIModelCatalog
+from uuid import UUID
+
+from app.agents.ai_model_catalogs.entries import EntryKey
+from app.agents.ai_model_catalogs.models import AIModelCatalog, AIModelCatalogEntry
 from app.agents.ai_model_catalogs.schemas import AIModelCatalogDbCreate, AIModelCatalogDbUpdate
 from app_base.base.repos.base import BaseRepository
+from sqlalchemy import Row, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class AIModelCatalogRepository(BaseRepository[AIModelCatalog, AIModelCatalogDbCreate, AIModelCatalogDbUpdate]):
     model = AIModelCatalog
+
+    async def get_header(self, session: AsyncSession, version: int | None = None) -> Row | None:
+        """`(id, version, content_hash)` of a version (the latest when omitted), without loading the blob."""
+        stmt = select(self.model.id, self.model.version, self.model.content_hash)
+        if version is not None:
+            stmt = stmt.where(self.model.version == version)
+        return (await session.execute(stmt.order_by(self.model.version.desc()).limit(1))).first()
+
+    async def get_entry_hashes(self, session: AsyncSession, catalog_id: UUID) -> dict[EntryKey, str]:
+        rows = await session.execute(
+            select(AIModelCatalogEntry.section, AIModelCatalogEntry.name, AIModelCatalogEntry.content_hash).where(
+                AIModelCatalogEntry.catalog_id == catalog_id
+            )
+        )
+        return {(section, name): digest for section, name, digest in rows}
+
+    async def bulk_create_entries(
+        self,
+        session: AsyncSession,
+        catalog_id: UUID,
+        entries: dict[EntryKey, dict],
+        entry_hashes: dict[EntryKey, str],
+    ) -> None:
+        """Insert a version's entries with a single multi-row INSERT."""
+        if not entries:
+            return
+        await session.execute(
+            insert(AIModelCatalogEntry),
+            [
+                {
+                    "catalog_id": catalog_id,
+                    "section": section,
+                    "name": name,
+                    "content_hash": entry_hashes[(section, name)],
+                    "data": item,
+                }
+                for (section, name), item in entries.items()
+            ],
+        )
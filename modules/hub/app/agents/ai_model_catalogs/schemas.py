@@ -19,6 +19,7 @@ class AIModelCatalogDbCreate(AIModelCatalogCreate):
     """Schema for creating a new AI Model in the database (Internal)."""
 
     version: int = Field(..., description="Catalog version")
+    content_hash: str | None = Field(default=None, description="Hash of the catalog entries")
 
 
 class AIModelCatalogUpdate(BaseModel):
@@ -38,5 +39,23 @@ class AIModelCatalogRead(UUIDSchemaMixin, TimestampSchemaMixin, BaseModel):
 
     version: int = Field(..., description="Catalog version")
     data: dict[str, Any] = Field(..., description="YAML catalog data as JSON")
+    content_hash: str | None = Field(default=None, description="Hash of the catalog entries")
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class AIModelCatalogEntryRef(BaseModel):
+    """Reference to a catalog entry."""
+
+    section: str = Field(..., description="Top-level catalog key, e.g. `models` or `aliases`")
+    name: str = Field(..., description="Entry name; empty for a section holding a single value")
+
+
+class AIModelCatalogDiff(BaseModel):
+    """Entries that differ between two catalog versions."""
+
+    from_version: int = Field(..., description="Base catalog version")
+    to_version: int = Field(..., description="Compared catalog version")
+    added: list[AIModelCatalogEntryRef] = Field(default_factory=list, description="Entries only in `to_version`")
+    removed: list[AIModelCatalogEntryRef] = Field(default_factory=list, description="Entries only in `from_version`")
+    changed: list[AIModelCatalogEntryRef] = Field(default_factory=list, description="Entries whose content differs")
@@ -1,8 +1,23 @@
-from typing import Annotated
+from typing import Annotated, Any
 
+from app.agents.ai_model_catalogs.cache import AIModelCatalogSnapshot, get_ai_model_catalog_cache, index_models
+from app.agents.ai_model_catalogs.entries import (
+    EntryKey,
+    catalog_hash,
+    diff_entry_hashes,
+    hash_entries,
+    normalize_catalog,
+)
 from app.agents.ai_model_catalogs.models import AIModelCatalog
 from app.agents.ai_model_catalogs.repos import AIModelCatalogRepository
-from app.agents.ai_model_catalogs.schemas import AIModelCatalogCreate, AIModelCatalogDbCreate
+from app.agents.ai_model_catalogs.schemas import (
+    AIModelCatalogCreate,
+    AIModelCatalogDbCreate,
+    AIModelCatalogDiff,
+    AIModelCatalogEntryRef,
+    AIModelCatalogRead,
+)
+from app_base.base.exceptions.basic import BadRequestException, NotFoundException
 from app_base.base.services.base import (
     BaseContextKwargs,
     BaseCreateServiceMixin,
@@ -11,8 +26,13 @@ from app_base.base.services.base import (
     BaseGetServiceMixin,
 )
 from fastapi import Depends
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# Attempts at taking the next version number when other uploads keep taking it first
+VERSION_CONFLICT_RETRIES = 3
+
 
 class AIModelCatalogContextKwargs(BaseContextKwargs):
     pass
@@ -39,11 +59,29 @@ class AIModelCatalogService(
     async def get_latest_ai_model(
         self,
         session: AsyncSession,
-    ) -> AIModelCatalog | None:
-        latest = await self.repo.get_multi(session, order_by=AIModelCatalog.version.desc(), limit=1)
-        if not latest.items:
+    ) -> AIModelCatalogSnapshot | None:
+        """Latest catalog, served from the process cache unless a newer version exists."""
+        header = await self.repo.get_header(session)
+        if header is None:
             return None
-        return latest.items[0]
+        cache = get_ai_model_catalog_cache()
+        key = (header.version, header.id)
+        snapshot = cache.get(key)
+        if snapshot is None:
+            latest = await self.repo.get(session, where=[self.repo.model.id == header.id])
+            if latest is None:
+                return None
+            catalog = AIModelCatalogRead.model_validate(latest)
+            snapshot = AIModelCatalogSnapshot(catalog=catalog, models=index_models(catalog.data))
+            cache[key] = snapshot
+        return snapshot
+
+    async def get_latest_model_spec(self, session: AsyncSession, model_name: str) -> dict[str, Any] | None:
+        """Look a model up by name in the latest catalog."""
+        snapshot = await self.get_latest_ai_model(session)
+        if snapshot is None:
+            return None
+        return snapshot.models.get(model_name)
 
     async def create(
         self,
@@ -51,18 +89,64 @@ class AIModelCatalogService(
         schema: AIModelCatalogCreate,
         context: AIModelCatalogContextKwargs | None = None,
     ) -> AIModelCatalog:
-        """Create a new AI Model with an incremented version."""
-        # Get the latest version from the database
-        latest = await self.get_latest_ai_model(session)
-        if latest:
-            next_version = latest.version + 1
-        else:
-            next_version = 1
-
-        # Create DB schema with the injected version
-        db_schema = AIModelCatalogDbCreate(
-            data=schema.data,
-            version=next_version,
+        """Create a new AI Model with an incremented version, or return the latest one when unchanged."""
+        catalog, _ = await self.create_if_changed(session, schema)
+        return catalog
+
+    async def create_if_changed(
+        self,
+        session: AsyncSession,
+        schema: AIModelCatalogCreate,
+    ) -> tuple[AIModelCatalog, bool]:
+        """Store the catalog as a new version unless its content matches the latest version.
+
+        Returns the stored (or latest) catalog and whether a new version was created. Versions are unique:
+        an upload racing another one for the same number re-reads the latest version and tries again.
+        """
+        entries = normalize_catalog(schema.data)
+        entry_hashes = hash_entries(entries)
+        digest = catalog_hash(entry_hashes)
+
+        for _ in range(VERSION_CONFLICT_RETRIES):
+            latest = await self.repo.get_header(session)
+            if latest is not None and latest.content_hash == digest:
+                return await self.repo.get(session, where=[self.repo.model.id == latest.id]), False
+
+            # Create DB schema with the injected version
+            db_schema = AIModelCatalogDbCreate(
+                data=schema.data,
+                version=(latest.version if latest is not None else 0) + 1,
+                content_hash=digest,
+            )
+            try:
+                async with session.begin_nested():
+                    catalog = await self.repo.create(session, db_schema)
+            except IntegrityError:
+                continue
+            await self.repo.bulk_create_entries(session, catalog.id, entries, entry_hashes)
+            return catalog, True
+        raise BadRequestException("Catalog versions are being uploaded concurrently; retry the upload")
+
+    async def diff(self, session: AsyncSession, from_version: int, to_version: int | None = None) -> AIModelCatalogDiff:
+        """Compare two versions entry by entry; `to_version` defaults to the latest version."""
+        old = await self.repo.get_header(session, from_version)
+        new = await self.repo.get_header(session, to_version)
+        if old is None or new is None or (to_version is not None and new.version != to_version):
+            raise NotFoundException()
+        added, removed, changed = diff_entry_hashes(
+            await self._get_entry_hashes(session, old), await self._get_entry_hashes(session, new)
+        )
+        return AIModelCatalogDiff(
+            from_version=old.version,
+            to_version=new.version,
+            added=[AIModelCatalogEntryRef(section=section, name=name) for section, name in added],
+            removed=[AIModelCatalogEntryRef(section=section, name=name) for section, name in removed],
+            changed=[AIModelCatalogEntryRef(section=section, name=name) for section, name in changed],
         )
 
-        return await self.repo.create(session, db_schema)
+    async def _get_entry_hashes(self, session: AsyncSession, header: Row) -> dict[EntryKey, str]:
+        if header.content_hash is not None:
+            return await self.repo.get_entry_hashes(session, header.id)
+        # Versions stored before entries were normalized: hash the blob on the fly
+        catalog = await self.repo.get(session, where=[self.repo.model.id == header.id])
+        return hash_entries(normalize_catalog(catalog.data))
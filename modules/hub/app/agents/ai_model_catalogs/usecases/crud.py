@@ -1,11 +1,11 @@
 from typing import Annotated, Optional
 
+from app.agents.ai_model_catalogs.cache import AIModelCatalogSnapshot
 from app.agents.ai_model_catalogs.models import AIModelCatalog
 from app.agents.ai_model_catalogs.schemas import AIModelCatalogCreate
 from app.agents.ai_model_catalogs.services import AIModelCatalogContextKwargs, AIModelCatalogService
 from app_base.base.usecases.base import BaseUseCase
 from app_base.base.usecases.crud import (
-    BaseCreateUseCase,
     BaseDeleteUseCase,
     BaseGetMultiUseCase,
     BaseGetUseCase,
@@ -23,7 +23,7 @@ class GetAIModelCatalogLatestUseCase(BaseUseCase):
     def __init__(self, service: Annotated[AIModelCatalogService, Depends()]) -> None:
         self.service = service
 
-    async def execute(self, context: Optional[AIModelCatalogContextKwargs] = None) -> Optional[AIModelCatalog]:
+    async def execute(self, context: Optional[AIModelCatalogContextKwargs] = None) -> Optional[AIModelCatalogSnapshot]:
         async with AsyncTransaction() as session:
             return await self.service.get_latest_ai_model(session)
 
@@ -35,11 +35,18 @@ class GetMultiAIModelCatalogUseCase(
         super().__init__(service)
 
 
-class CreateAIModelCatalogUseCase(
-    BaseCreateUseCase[AIModelCatalogService, AIModelCatalog, AIModelCatalogCreate, AIModelCatalogContextKwargs]
-):
+class CreateAIModelCatalogUseCase(BaseUseCase):
+    """Store a catalog as a new version unless it matches the latest one."""
+
     def __init__(self, service: Annotated[AIModelCatalogService, Depends()]) -> None:
-        super().__init__(service)
+        self.service = service
+
+    async def execute(
+        self, obj_data: AIModelCatalogCreate, context: Optional[AIModelCatalogContextKwargs] = None
+    ) -> tuple[AIModelCatalog, bool]:
+        """Returns the stored (or unchanged latest) catalog and whether a new version was created."""
+        async with AsyncTransaction() as session:
+            return await self.service.create_if_changed(session, obj_data)
 
 
 class DeleteAIModelCatalogUseCase(
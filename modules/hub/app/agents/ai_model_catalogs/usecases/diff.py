@@ -0,0 +1,18 @@
+from typing import Annotated, Optional
+
+from app.agents.ai_model_catalogs.schemas import AIModelCatalogDiff
+from app.agents.ai_model_catalogs.services import AIModelCatalogService
+from app_base.base.usecases.base import BaseUseCase
+from app_base.core.database.transaction import AsyncTransaction
+from fastapi import Depends
+
+
+class DiffAIModelCatalogsUseCase(BaseUseCase):
+    """Compare two catalog versions using their stored entry hashes."""
+
+    def __init__(self, service: Annotated[AIModelCatalogService, Depends()]) -> None:
+        self.service = service
+
+    async def execute(self, from_version: int, to_version: Optional[int] = None) -> AIModelCatalogDiff:
+        async with AsyncTransaction() as session:
+            return await self.service.diff(session, from_version, to_version)
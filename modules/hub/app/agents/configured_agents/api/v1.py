@@ -1,7 +1,12 @@
 from typing import Annotated
 from uuid import UUID
 
-from app.agents.configured_agents.schemas import ConfiguredAgentCreate, ConfiguredAgentRead, ConfiguredAgentUpdate
+from app.agents.configured_agents.schemas import (
+    ConfiguredAgentCreate,
+    ConfiguredAgentRead,
+    ConfiguredAgentUpdate,
+    ResolvedConfiguredAgent,
+)
 from app.agents.configured_agents.usecases.crud import (
     CreateConfiguredAgentUseCase,
     DeleteConfiguredAgentUseCase,
@@ -9,6 +14,7 @@ from app.agents.configured_agents.usecases.crud import (
     GetMultiConfiguredAgentUseCase,
     UpdateConfiguredAgentUseCase,
 )
+from app.agents.configured_agents.usecases.resolve import GetResolvedConfiguredAgentUseCase
 from app_base.base.deps.params.page import PaginationParam
 from app_base.base.exceptions.basic import NotFoundException
 from app_base.base.schemas.delete_resp import DeleteResponse
@@ -45,6 +51,17 @@ async def get_configured_agent(
     return configured_agent
 
 
+@router.get("/{configured_agent_id}/resolved", response_model=ResolvedConfiguredAgent)
+async def get_resolved_configured_agent(
+    use_case: Annotated[GetResolvedConfiguredAgentUseCase, Depends()],
+    configured_agent_id: UUID,
+):
+    resolved = await use_case.execute(configured_agent_id)
+    if not resolved:
+        raise NotFoundException()
+    return resolved
+
+
 @router.put("/{configured_agent_id}", response_model=ConfiguredAgentRead)
 async def update_configured_agent(
     use_case: Annotated[UpdateConfiguredAgentUseCase, Depends()],
@@ -0,0 +1,25 @@
+"""Process-local TTL+LRU cache of resolved configured agents, keyed by agent id.
+
+An entry is only served while the agent's `updated_at` and the latest catalog (version and id) still
+match the ones it was built from (checked with a single probe query); the TTL bounds staleness
+from changes that touch neither, such as editing a linked skill through the API (applying the agent
+catalog bumps `updated_at` of the agents it affects). Update and delete use cases evict the agent's
+entry once they commit.
+"""
+
+from functools import lru_cache
+from uuid import UUID
+
+from app.agents.configured_agents.schemas import ResolvedConfiguredAgent
+from app.common.settings import get_hub_settings
+from cachetools import TTLCache
+
+
+@lru_cache
+def get_resolved_agent_cache() -> TTLCache[UUID, ResolvedConfiguredAgent]:
+    settings = get_hub_settings()
+    return TTLCache(maxsize=settings.CONFIGURED_AGENT_CACHE_MAXSIZE, ttl=settings.CONFIGURED_AGENT_CACHE_TTL_SECONDS)
+
+
+def invalidate_resolved_agent(agent_id: UUID) -> None:
+    get_resolved_agent_cache().pop(agent_id, None)
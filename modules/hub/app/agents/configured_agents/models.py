@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING
 
 from app.common.database import JSON_VARIANT
 from app_base.base.models.mixin import Base, TimestampMixin, UUIDMixin
-from sqlalchemy import Boolean, ForeignKey, String, Text
+from sqlalchemy import Boolean, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -24,6 +24,8 @@ class ConfiguredAgentSkill(Base):
     agent_id: Mapped[str] = mapped_column(ForeignKey("configured_agents.id", ondelete="CASCADE"), primary_key=True)
     skill_id: Mapped[str] = mapped_column(ForeignKey("agent_skills.id", ondelete="CASCADE"), primary_key=True)
 
+    __table_args__ = (Index("ix_configured_agent_skills_skill_id", "skill_id"),)
+
 
 class ConfiguredAgentMCP(Base):
     """Association table for ConfiguredAgent and AgentMCP."""
@@ -33,6 +35,8 @@ class ConfiguredAgentMCP(Base):
     agent_id: Mapped[str] = mapped_column(ForeignKey("configured_agents.id", ondelete="CASCADE"), primary_key=True)
     mcp_id: Mapped[str] = mapped_column(ForeignKey("agent_mcps.id", ondelete="CASCADE"), primary_key=True)
 
+    __table_args__ = (Index("ix_configured_agent_mcps_mcp_id", "mcp_id"),)
+
 
 class ConfiguredAgent(Base, UUIDMixin, TimestampMixin):
     """Hub-defined Agent configuration."""
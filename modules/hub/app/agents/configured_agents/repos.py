@@ -1,7 +1,114 @@
-from app.agents.configured_agents.models import ConfiguredAgent
+import datetime
+from collections.abc import Collection
+from uuid import UUID
+
+from app.agents.agent_mcps.models import AgentMCP
+from app.agents.agent_skills.models import AgentSkill
+from app.agents.ai_model_catalogs.models import AIModelCatalog
+from app.agents.configured_agents.models import ConfiguredAgent, ConfiguredAgentMCP, ConfiguredAgentSkill
 from app.agents.configured_agents.schemas import ConfiguredAgentCreate, ConfiguredAgentUpdate
+from app.common.database import NamedBulkRepositoryMixin
 from app_base.base.repos.base import BaseRepository
+from sqlalchemy import delete, insert, literal, select, tuple_, union_all, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
-class ConfiguredAgentRepository(BaseRepository[ConfiguredAgent, ConfiguredAgentCreate, ConfiguredAgentUpdate]):
+class ConfiguredAgentRepository(
+    BaseRepository[ConfiguredAgent, ConfiguredAgentCreate, ConfiguredAgentUpdate], NamedBulkRepositoryMixin
+):
     model = ConfiguredAgent
+
+    async def get_resolution_stamp(
+        self, session: AsyncSession, obj_id: UUID
+    ) -> tuple[datetime.datetime, int | None, UUID | None] | None:
+        """`(updated_at, latest catalog version, latest catalog id)` of an agent in one round trip.
+
+        None if the agent does not exist. The id tells a re-upload apart from a deleted catalog that had
+        the same version number.
+        """
+        latest = select(AIModelCatalog.version, AIModelCatalog.id).order_by(AIModelCatalog.version.desc()).limit(1)
+        latest_version = latest.with_only_columns(AIModelCatalog.version).scalar_subquery()
+        latest_id = latest.with_only_columns(AIModelCatalog.id).scalar_subquery()
+        row = (
+            await session.execute(
+                select(self.model.updated_at, latest_version, latest_id).where(self.model.id == obj_id)
+            )
+        ).one_or_none()
+        return (row[0], row[1], row[2]) if row is not None else None
+
+    async def touch(self, session: AsyncSession, obj_ids: Collection[UUID]) -> None:
+        """Bump `updated_at` of the given agents, so resolved snapshots built before are no longer served."""
+        if obj_ids:
+            await session.execute(
+                update(self.model)
+                .where(self.model.id.in_(obj_ids))
+                .values(updated_at=datetime.datetime.now(datetime.UTC))
+            )
+
+    async def get_existing_link_ids(
+        self, session: AsyncSession, skill_ids: Collection[UUID], mcp_ids: Collection[UUID]
+    ) -> tuple[set[UUID], set[UUID]]:
+        """Which of the given skill and MCP ids exist, checked with a single query."""
+        queries = []
+        if skill_ids:
+            queries.append(select(literal("skill").label("kind"), AgentSkill.id).where(AgentSkill.id.in_(skill_ids)))
+        if mcp_ids:
+            queries.append(select(literal("mcp").label("kind"), AgentMCP.id).where(AgentMCP.id.in_(mcp_ids)))
+        if not queries:
+            return set(), set()
+        rows = (await session.execute(union_all(*queries))).all()
+        return {row.id for row in rows if row.kind == "skill"}, {row.id for row in rows if row.kind == "mcp"}
+
+    async def replace_skill_links(self, session: AsyncSession, agent_id: UUID, skill_ids: Collection[UUID]) -> bool:
+        return await self._replace_links(
+            session, ConfiguredAgentSkill, ConfiguredAgentSkill.skill_id, agent_id, skill_ids
+        )
+
+    async def replace_mcp_links(self, session: AsyncSession, agent_id: UUID, mcp_ids: Collection[UUID]) -> bool:
+        return await self._replace_links(session, ConfiguredAgentMCP, ConfiguredAgentMCP.mcp_id, agent_id, mcp_ids)
+
+    @staticmethod
+    async def _replace_links(session: AsyncSession, association, target_col, agent_id: UUID, target_ids) -> bool:
+        """Make the agent's association rows match `target_ids`, touching only the rows that differ.
+
+        Returns whether anything changed.
+        """
+        existing = set(await session.scalars(select(target_col).where(association.agent_id == agent_id)))
+        wanted = set(target_ids)
+        removed, added = existing - wanted, wanted - existing
+        if removed:
+            await session.execute(delete(association).where(association.agent_id == agent_id, target_col.in_(removed)))
+        if added:
+            await session.execute(
+                insert(association), [{"agent_id": agent_id, target_col.key: target_id} for target_id in added]
+            )
+        return bool(removed or added)
+
+    async def get_all_links(self, session: AsyncSession) -> tuple[set[tuple[UUID, UUID]], set[tuple[UUID, UUID]]]:
+        """Every `(agent_id, skill_id)` and `(agent_id, mcp_id)` association."""
+        skill_links = (
+            await session.execute(select(ConfiguredAgentSkill.agent_id, ConfiguredAgentSkill.skill_id))
+        ).all()
+        mcp_links = (await session.execute(select(ConfiguredAgentMCP.agent_id, ConfiguredAgentMCP.mcp_id))).all()
+        return {tuple(row) for row in skill_links}, {tuple(row) for row in mcp_links}
+
+    async def bulk_replace_links(
+        self,
+        session: AsyncSession,
+        skill_links: tuple[set[tuple[UUID, UUID]], set[tuple[UUID, UUID]]],
+        mcp_links: tuple[set[tuple[UUID, UUID]], set[tuple[UUID, UUID]]],
+    ) -> None:
+        """Apply `(removed, added)` association diffs for skills and MCPs across many agents."""
+        for association, target_col, (removed, added) in (
+            (ConfiguredAgentSkill, ConfiguredAgentSkill.skill_id, skill_links),
+            (ConfiguredAgentMCP, ConfiguredAgentMCP.mcp_id, mcp_links),
+        ):
+            if removed:
+                await session.execute(
+                    delete(association).where(tuple_(association.agent_id, target_col).in_(list(removed)))
+                )
+            if added:
+                await session.execute(
+                    insert(association),
+                    [{"agent_id": agent_id, target_col.key: target_id} for agent_id, target_id in added],
+                )
@@ -3,6 +3,8 @@
 Pydantic schemas for ConfiguredAgent CRUD operations.
 """
 
+import datetime
+from typing import Any
 from uuid import UUID
 
 from app.agents.agent_mcps.schemas import AgentMCPRead
@@ -51,3 +53,41 @@ class ConfiguredAgentRead(UUIDSchemaMixin, TimestampSchemaMixin, ConfiguredAgent
     mcps: list[AgentMCPRead] = Field(default_factory=list, description="Linked MCPs")
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class ResolvedSkill(BaseModel):
+    """Skill as needed to run an agent."""
+
+    name: str = Field(..., description="Skill Name")
+    skill_path: str = Field(..., description="Skill Path")
+    version: str = Field(..., description="Skill Version")
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class ResolvedMCP(BaseModel):
+    """MCP server as needed to run an agent."""
+
+    name: str = Field(..., description="MCP Name")
+    mcp_endpoint: str = Field(..., description="MCP Endpoint")
+    version: str = Field(..., description="MCP Version")
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class ResolvedConfiguredAgent(BaseModel):
+    """Immutable, dispatch-ready view of a ConfiguredAgent with its catalog model and active links."""
+
+    id: UUID = Field(..., description="Agent ID")
+    name: str = Field(..., description="Agent Name")
+    updated_at: datetime.datetime = Field(..., description="Agent last update time the snapshot was built from")
+    catalog_version: int | None = Field(..., description="AI model catalog version the model was resolved from")
+    catalog_id: UUID | None = Field(..., description="AI model catalog ID the model was resolved from")
+    model_name: str = Field(..., description="Model Name")
+    model_spec: dict[str, Any] | None = Field(..., description="Catalog entry of the model; null if not in the catalog")
+    model_args: dict[str, JsonSerializableType] = Field(..., description="Agent configuration")
+    system_prompt: str | None = Field(default=None, description="System Prompt")
+    skills: tuple[ResolvedSkill, ...] = Field(default=(), description="Active Skills")
+    mcps: tuple[ResolvedMCP, ...] = Field(default=(), description="Active MCPs")
+
+    model_config = ConfigDict(frozen=True)
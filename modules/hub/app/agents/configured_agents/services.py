@@ -1,8 +1,19 @@
+import datetime
+from collections.abc import Collection
 from typing import Annotated
+from uuid import UUID
 
+from app.agents.ai_model_catalogs.services import AIModelCatalogService
+from app.agents.configured_agents.cache import get_resolved_agent_cache
 from app.agents.configured_agents.models import ConfiguredAgent
 from app.agents.configured_agents.repos import ConfiguredAgentRepository
-from app.agents.configured_agents.schemas import ConfiguredAgentCreate, ConfiguredAgentUpdate
+from app.agents.configured_agents.schemas import (
+    ConfiguredAgentCreate,
+    ConfiguredAgentUpdate,
+    ResolvedConfiguredAgent,
+    ResolvedMCP,
+    ResolvedSkill,
+)
 from app_base.base.services.base import (
     BaseContextKwargs,
     BaseCreateServiceMixin,
@@ -12,6 +23,7 @@ from app_base.base.services.base import (
     BaseUpdateServiceMixin,
 )
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class ConfiguredAgentContextKwargs(BaseContextKwargs):
@@ -29,8 +41,13 @@ class ConfiguredAgentService(
     ],
     BaseDeleteServiceMixin[ConfiguredAgentRepository, ConfiguredAgent, ConfiguredAgentContextKwargs],
 ):
-    def __init__(self, repo: Annotated[ConfiguredAgentRepository, Depends()]):
+    def __init__(
+        self,
+        repo: Annotated[ConfiguredAgentRepository, Depends()],
+        catalog_service: Annotated[AIModelCatalogService, Depends()],
+    ):
         self._repo = repo
+        self.catalog_service = catalog_service
 
     @property
     def repo(self) -> ConfiguredAgentRepository:
@@ -39,3 +56,63 @@ class ConfiguredAgentService(
     @property
     def context_model(self):
         return ConfiguredAgentContextKwargs
+
+    async def get_resolved(self, session: AsyncSession, obj_id: UUID) -> ResolvedConfiguredAgent | None:
+        """Resolved agent snapshot, rebuilt only when the agent or the latest catalog changed."""
+        cache = get_resolved_agent_cache()
+        stamp = await self.repo.get_resolution_stamp(session, obj_id)
+        if stamp is None:
+            cache.pop(obj_id, None)
+            return None
+        updated_at, catalog_version, catalog_id = stamp
+        cached = cache.get(obj_id)
+        if cached is not None and (cached.updated_at, cached.catalog_version, cached.catalog_id) == stamp:
+            return cached
+
+        agent = await self.repo.get(session, where=[self.repo.model.id == obj_id])
+        if agent is None:
+            return None
+        resolved = ResolvedConfiguredAgent(
+            id=agent.id,
+            name=agent.name,
+            updated_at=agent.updated_at,
+            catalog_version=catalog_version,
+            catalog_id=catalog_id,
+            model_name=agent.model_name,
+            model_spec=await self.catalog_service.get_latest_model_spec(session, agent.model_name),
+            model_args=agent.config,
+            system_prompt=agent.system_prompt,
+            skills=tuple(ResolvedSkill.model_validate(skill) for skill in agent.skills if skill.is_active),
+            mcps=tuple(ResolvedMCP.model_validate(mcp) for mcp in agent.mcps if mcp.is_active),
+        )
+        cache[obj_id] = resolved
+        return resolved
+
+    async def validate_link_ids(
+        self, session: AsyncSession, skill_ids: Collection[UUID], mcp_ids: Collection[UUID]
+    ) -> None:
+        found_skill_ids, found_mcp_ids = await self.repo.get_existing_link_ids(session, skill_ids, mcp_ids)
+        if found_mcp_ids != set(mcp_ids):
+            raise ValueError("One or more AgentMCP IDs are invalid.")
+        if found_skill_ids != set(skill_ids):
+            raise ValueError("One or more AgentSkill IDs are invalid.")
+
+    async def replace_links(
+        self,
+        session: AsyncSession,
+        agent: ConfiguredAgent,
+        skill_ids: Collection[UUID] | None,
+        mcp_ids: Collection[UUID] | None,
+    ) -> bool:
+        """Diff the agent's skill/MCP association rows against the given ids; `None` leaves a side as is."""
+        changed = []
+        if skill_ids is not None and await self.repo.replace_skill_links(session, agent.id, skill_ids):
+            changed.append("skills")
+        if mcp_ids is not None and await self.repo.replace_mcp_links(session, agent.id, mcp_ids):
+            changed.append("mcps")
+        if changed:
+            await session.refresh(agent, attribute_names=changed)
+            # Link-only changes leave the row untouched; bump updated_at so other workers' cached
+            # resolved snapshots of this agent go stale too.
+            agent.updated_at = datetime.datetime.now(datetime.UTC)
+        return bool(changed)
@@ -1,14 +1,10 @@
 from typing import Annotated, Optional
 from uuid import UUID
 
-from app.agents.agent_mcps.filters import filter_ids as mcp_filter_ids
-from app.agents.agent_mcps.services import AgentMCPService
-from app.agents.agent_skills.filters import filter_ids as skill_filter_ids
-from app.agents.agent_skills.services import AgentSkillService
+from app.agents.configured_agents.cache import invalidate_resolved_agent
 from app.agents.configured_agents.models import ConfiguredAgent
 from app.agents.configured_agents.schemas import ConfiguredAgentCreate, ConfiguredAgentUpdate
 from app.agents.configured_agents.services import ConfiguredAgentContextKwargs, ConfiguredAgentService
-from app_base.base.deps.filters.resolver import resolve_filter
 from app_base.base.usecases.crud import (
     BaseCreateUseCase,
     BaseDeleteUseCase,
@@ -35,15 +31,8 @@ class GetMultiConfiguredAgentUseCase(
 class CreateConfiguredAgentUseCase(
     BaseCreateUseCase[ConfiguredAgentService, ConfiguredAgent, ConfiguredAgentCreate, ConfiguredAgentContextKwargs]
 ):
-    def __init__(
-        self,
-        service: Annotated[ConfiguredAgentService, Depends()],
-        service_skill: Annotated[AgentSkillService, Depends()],
-        service_mcp: Annotated[AgentMCPService, Depends()],
-    ) -> None:
+    def __init__(self, service: Annotated[ConfiguredAgentService, Depends()]) -> None:
         super().__init__(service)
-        self.service_skill = service_skill
-        self.service_mcp = service_mcp
 
     async def _execute(
         self,
@@ -51,38 +40,19 @@ class CreateConfiguredAgentUseCase(
         obj_data: ConfiguredAgentCreate,
         context: Optional[ConfiguredAgentContextKwargs],
     ) -> ConfiguredAgent:
-        update_fields = {}
-        if obj_data.mcp_ids:
-            mcps = await self.service_mcp.get_multi(
-                session, limit=None, where=resolve_filter(mcp_filter_ids, obj_data.mcp_ids)
-            )
-            if len(mcps.items) != len(obj_data.mcp_ids):
-                raise ValueError("One or more AgentMCP IDs are invalid.")
-            update_fields["mcps"] = mcps.items
-
-        if obj_data.skill_ids:
-            skills = await self.service_skill.get_multi(
-                session, limit=None, where=resolve_filter(skill_filter_ids, obj_data.skill_ids)
-            )
-            if len(skills.items) != len(obj_data.skill_ids):
-                raise ValueError("One or more AgentSkill IDs are invalid.")
-            update_fields["skills"] = skills.items
-
-        return await self.service.create(session, obj_data, context, **update_fields)
+        skill_ids, mcp_ids = set(obj_data.skill_ids), set(obj_data.mcp_ids)
+        await self.service.validate_link_ids(session, skill_ids, mcp_ids)
+
+        agent = await self.service.create(session, obj_data, context)
+        await self.service.replace_links(session, agent, skill_ids, mcp_ids)
+        return agent
 
 
 class UpdateConfiguredAgentUseCase(
     BaseUpdateUseCase[ConfiguredAgentService, ConfiguredAgent, ConfiguredAgentUpdate, ConfiguredAgentContextKwargs]
 ):
-    def __init__(
-        self,
-        service: Annotated[ConfiguredAgentService, Depends()],
-        service_skill: Annotated[AgentSkillService, Depends()],
-        service_mcp: Annotated[AgentMCPService, Depends()],
-    ) -> None:
+    def __init__(self, service: Annotated[ConfiguredAgentService, Depends()]) -> None:
         super().__init__(service)
-        self.service_skill = service_skill
-        self.service_mcp = service_mcp
 
     async def _execute(
         self,
@@ -91,23 +61,21 @@ class UpdateConfiguredAgentUseCase(
         obj_data: ConfiguredAgentUpdate,
         context: Optional[ConfiguredAgentContextKwargs],
     ) -> ConfiguredAgent:
-        update_fields = {}
-        if obj_data.mcp_ids:
-            mcps = await self.service_mcp.get_multi(
-                session, limit=None, where=resolve_filter(mcp_filter_ids, obj_data.mcp_ids)
-            )
-            if len(mcps.items) != len(obj_data.mcp_ids):
-                raise ValueError("One or more AgentMCP IDs are invalid.")
-            update_fields["mcps"] = mcps.items
-
-        if obj_data.skill_ids:
-            skills = await self.service_skill.get_multi(
-                session, limit=None, where=resolve_filter(skill_filter_ids, obj_data.skill_ids)
-            )
-            if len(skills.items) != len(obj_data.skill_ids):
-                raise ValueError("One or more AgentSkill IDs are invalid.")
-            update_fields["skills"] = skills.items
-        return await self.service.update(session, object_id, obj_data, context, **update_fields)
+        skill_ids = set(obj_data.skill_ids) if obj_data.skill_ids is not None else None
+        mcp_ids = set(obj_data.mcp_ids) if obj_data.mcp_ids is not None else None
+        await self.service.validate_link_ids(session, skill_ids or (), mcp_ids or ())
+
+        agent = await self.service.update(session, object_id, obj_data, context)
+        if agent is not None:
+            await self.service.replace_links(session, agent, skill_ids, mcp_ids)
+        return agent
+
+    async def execute(
+        self, obj_id: UUID, obj_data: ConfiguredAgentUpdate, context: Optional[ConfiguredAgentContextKwargs] = None
+    ) -> ConfiguredAgent | None:
+        result = await super().execute(obj_id, obj_data, context=context)
+        invalidate_resolved_agent(obj_id)
+        return result
 
 
 class DeleteConfiguredAgentUseCase(
@@ -115,3 +83,8 @@ class DeleteConfiguredAgentUseCase(
 ):
     def __init__(self, service: Annotated[ConfiguredAgentService, Depends()]) -> None:
         super().__init__(service)
+
+    async def execute(self, obj_id: UUID, context: Optional[ConfiguredAgentContextKwargs] = None):
+        result = await super().execute(obj_id, context=context)
+        invalidate_resolved_agent(obj_id)
+        return result
@@ -0,0 +1,17 @@
+from typing import Annotated
+from uuid import UUID
+
+from app.agents.configured_agents.schemas import ResolvedConfiguredAgent
+from app.agents.configured_agents.services import ConfiguredAgentService
+from app_base.base.usecases.base import BaseUseCase
+from app_base.core.database.transaction import AsyncTransaction
+from fastapi import Depends
+
+
+class GetResolvedConfiguredAgentUseCase(BaseUseCase):
+    def __init__(self, service: Annotated[ConfiguredAgentService, Depends()]) -> None:
+        self.service = service
+
+    async def execute(self, obj_id: UUID) -> ResolvedConfiguredAgent | None:
+        async with AsyncTransaction() as session:
+            return await self.service.get_resolved(session, obj_id)
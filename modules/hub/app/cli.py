@@ -0,0 +1,81 @@
+"""Hub management commands.
+
+Usage: python -m app.cli catalog apply agent_catalog.yml [--dry-run] [--prune]
+"""
+
+import asyncio
+from pathlib import Path
+
+import click
+import yaml
+from app.agents.agent_catalogs.schemas import AgentCatalog, CatalogPlan
+from app.agents.agent_catalogs.services import AgentCatalogService
+from app.agents.agent_catalogs.usecases.apply import ApplyAgentCatalogUseCase
+from app.agents.agent_mcps.repos import AgentMCPRepository
+from app.agents.agent_skills.repos import AgentSkillRepository
+from app.agents.configured_agents.repos import ConfiguredAgentRepository
+from app.main import create_app  # noqa: F401  # registers every model so mappers can be configured
+from app_base.core.database.engine import get_async_engine
+
+PLAN_SYMBOLS = {"create": "+", "update": "~", "delete": "-"}
+
+
+@click.group()
+def cli():
+    """JobRunner Hub management commands."""
+
+
+@cli.group()
+def catalog():
+    """Agent catalog (skills, MCPs and configured agents)."""
+
+
+@catalog.command("apply")
+@click.argument("path", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--dry-run", is_flag=True, help="Print the plan without writing anything.")
+@click.option("--prune", is_flag=True, help="Delete skills, MCPs and agents that are not in the catalog.")
+def apply_catalog(path: Path, dry_run: bool, prune: bool):
+    """Make the database match the agent catalog at PATH."""
+    try:
+        agent_catalog = AgentCatalog.model_validate(yaml.safe_load(path.read_text()) or {})
+    except yaml.YAMLError as e:
+        raise click.ClickException(f"Invalid YAML in {path}: {e}") from e
+    except ValueError as e:
+        raise click.ClickException(f"Invalid catalog {path}: {e}") from e
+
+    try:
+        plan = asyncio.run(_apply(agent_catalog, dry_run, prune))
+    except ValueError as e:
+        raise click.ClickException(str(e)) from e
+    click.echo(render_plan(plan, dry_run))
+
+
+def render_plan(plan: CatalogPlan, dry_run: bool) -> str:
+    lines = []
+    for change in plan.changes:
+        line = f"{PLAN_SYMBOLS[change.action]} {change.kind} {change.name}"
+        if change.fields:
+            line += f" ({', '.join(change.fields)})"
+        lines.append(line)
+    counts = {action: sum(change.action == action for change in plan.changes) for action in PLAN_SYMBOLS}
+    summary = f"Plan: {counts['create']} to create, {counts['update']} to update, {counts['delete']} to delete."
+    if plan.is_empty:
+        summary = "No changes. The database matches the catalog."
+    elif dry_run:
+        summary += " Dry run: nothing was applied."
+    lines.append(summary)
+    return "\n".join(lines)
+
+
+async def _apply(agent_catalog: AgentCatalog, dry_run: bool, prune: bool) -> CatalogPlan:
+    use_case = ApplyAgentCatalogUseCase(
+        AgentCatalogService(AgentSkillRepository(), AgentMCPRepository(), ConfiguredAgentRepository())
+    )
+    try:
+        return await use_case.execute(agent_catalog, dry_run=dry_run, prune=prune)
+    finally:
+        await get_async_engine().dispose()
+
+
+if __name__ == "__main__":
+    cli(prog_name="jr-hub")
@@ -0,0 +1,58 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from app_base.core.log import logger
+
+
+class PeriodicTask:
+    """Run an async callable on a fixed interval inside the app lifespan.
+
+    Setting `wake` runs it right away instead of waiting for the rest of the interval.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        interval_seconds: float,
+        func: Callable[[], Awaitable[object]],
+        wake: asyncio.Event | None = None,
+    ):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.func = func
+        self.wake = wake
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.func()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception(f"Periodic task '{self.name}' failed")
+            await self._sleep()
+
+    async def _sleep(self) -> None:
+        if self.wake is None:
+            await asyncio.sleep(self.interval_seconds)
+            return
+        try:
+            await asyncio.wait_for(self.wake.wait(), self.interval_seconds)
+        except TimeoutError:
+            pass
+        self.wake.clear()
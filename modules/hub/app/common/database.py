@@ -1,4 +1,112 @@
+from collections.abc import Collection, Mapping, Sequence
+from typing import Any
+
+import orjson
+from sqlalchemy import Boolean, Insert, and_, delete, func, select, true, type_coerce
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ColumnElement
 from sqlalchemy.types import JSON
 
 JSON_VARIANT = JSON().with_variant(JSONB, "postgresql")
+
+
+class json_contains(ColumnElement[bool]):
+    """`column @> value` for a JSON_VARIANT column, so a GIN index on it can serve the filter.
+
+    Other dialects (SQLite in tests/dev) compare every scalar leaf of `value` with `json_extract`;
+    arrays there match only as a whole.
+    """
+
+    type = Boolean()
+    # The fallback's SQL depends on the shape of `value`, so statements using it are not cached
+    inherit_cache = False
+
+    def __init__(self, column: Any, value: Mapping[str, Any]):
+        self.column = column
+        self.value = value
+
+
+def _json_leaves(value: Any, path: str) -> list[tuple[str, Any]]:
+    if isinstance(value, Mapping):
+        leaves = []
+        for key, child in value.items():
+            leaves.extend(_json_leaves(child, f'{path}."{key}"'))
+        return leaves
+    return [(path, value)]
+
+
+@compiles(json_contains, "postgresql")
+def _compile_json_contains_postgresql(element: json_contains, compiler, **kw) -> str:
+    return compiler.process(type_coerce(element.column, JSONB).contains(element.value), **kw)
+
+
+@compiles(json_contains)
+def _compile_json_contains(element: json_contains, compiler, **kw) -> str:
+    clauses = []
+    for path, leaf in _json_leaves(element.value, "$"):
+        if leaf is None or isinstance(leaf, bool):
+            # json_extract maps null to NULL and booleans to 0/1; json_type tells them apart
+            clauses.append(func.json_type(element.column, path) == orjson.dumps(leaf).decode())
+        elif isinstance(leaf, list):
+            clauses.append(func.json_extract(element.column, path) == func.json(orjson.dumps(leaf).decode()))
+        else:
+            clauses.append(func.json_extract(element.column, path) == leaf)
+    return compiler.process(and_(true(), *clauses), **kw)
+
+
+def dialect_name(session: AsyncSession) -> str:
+    return session.get_bind().dialect.name
+
+
+async def advisory_xact_lock(session: AsyncSession, name: str) -> None:
+    """Wait for the PostgreSQL advisory lock `name`, held until the transaction ends; no-op on other dialects."""
+    if dialect_name(session) == "postgresql":
+        await session.execute(select(func.pg_advisory_xact_lock(func.hashtext(name))))
+
+
+async def try_advisory_xact_lock(session: AsyncSession, name: str) -> bool:
+    """Take the PostgreSQL advisory lock `name` until the transaction ends; False if another session holds it.
+
+    Lets one replica run a periodic job while the others skip it. Other dialects have a single process
+    and always get the lock.
+    """
+    if dialect_name(session) != "postgresql":
+        return True
+    return bool(await session.scalar(select(func.pg_try_advisory_xact_lock(func.hashtext(name)))))
+
+
+def upsert_insert(session: AsyncSession, model) -> Insert:
+    """Return an INSERT for `model` that supports ON CONFLICT clauses on the session's dialect."""
+    name = dialect_name(session)
+    if name == "postgresql":
+        return pg_insert(model)
+    if name == "sqlite":
+        return sqlite_insert(model)
+    raise NotImplementedError(f"ON CONFLICT inserts are not supported for dialect '{name}'")
+
+
+class NamedBulkRepositoryMixin:
+    """Repository mixin for bulk sync of tables keyed by a unique `name` column."""
+
+    model: Any
+
+    async def get_all_by_name(self, session: AsyncSession) -> dict[str, Any]:
+        return {obj.name: obj for obj in (await session.scalars(select(self.model))).all()}
+
+    async def bulk_upsert(self, session: AsyncSession, rows: Sequence[Mapping[str, Any]]) -> None:
+        """Insert or update `rows` (dicts with identical keys, including `id`) in one statement, matching on name."""
+        if not rows:
+            return
+        stmt = upsert_insert(session, self.model)
+        set_ = {key: stmt.excluded[key] for key in rows[0] if key not in ("id", "name")}
+        if hasattr(self.model, "updated_at"):
+            set_["updated_at"] = func.now()
+        await session.execute(stmt.on_conflict_do_update(index_elements=["name"], set_=set_), list(rows))
+
+    async def delete_by_names(self, session: AsyncSession, names: Collection[str]) -> None:
+        if names:
+            await session.execute(delete(self.model).where(self.model.name.in_(names)))
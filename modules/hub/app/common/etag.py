@@ -0,0 +1,28 @@
+"""Conditional GET support for endpoints serving pre-rendered bytes.
+
+Responses carry an `ETag` and `Cache-Control: no-cache`, so clients revalidate on every poll and a
+matching `If-None-Match` is answered with an empty 304.
+"""
+
+from typing import Annotated
+
+from fastapi import Header
+from fastapi.responses import Response
+
+IfNoneMatchHeader = Annotated[str | None, Header(description="ETag of the representation the client holds")]
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as RFC 9110 prescribes for If-None-Match
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def etag_response(content: bytes, media_type: str, etag: str, if_none_match: str | None) -> Response:
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type=media_type, headers=headers)
@@ -0,0 +1,186 @@
+"""Change events fanned out to Server-Sent Events subscribers.
+
+Events are published inside the writing transaction and delivered only once it commits:
+- PostgreSQL: `pg_notify` on EVENTS_CHANNEL (transactional by nature); a dedicated LISTEN connection kept
+  up by the app lifespan (reconnecting with backoff) feeds every hub process's local broker, so all
+  replicas see all events.
+- Other dialects (SQLite in tests/dev): events are queued on the session and handed to the local broker
+  from an `after_commit` hook; they are dropped on rollback.
+"""
+
+import asyncio
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any
+
+import asyncpg
+import orjson
+from app.common.database import dialect_name
+from app_base.core.database.engine import get_async_engine
+from app_base.core.log import logger
+from fastapi.responses import StreamingResponse
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+EVENTS_CHANNEL = "hub_events"
+_PENDING_EVENTS_KEY = "hub_pending_events"
+
+
+class EventBroker:
+    """In-process fan-out of events to subscribers of a topic (a workspace id)."""
+
+    def __init__(self, max_queue_size: int = 1000):
+        self.max_queue_size = max_queue_size
+        self._subscribers: dict[str, set[asyncio.Queue]] = defaultdict(set)
+
+    @asynccontextmanager
+    async def subscribe(self, topic: str) -> AsyncIterator[asyncio.Queue]:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._subscribers[topic].add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers[topic].discard(queue)
+            if not self._subscribers[topic]:
+                del self._subscribers[topic]
+
+    def publish(self, topic: str, payload: dict[str, Any]) -> None:
+        for queue in self._subscribers.get(topic, ()):
+            if queue.full():
+                # Slow consumer: drop its oldest event rather than block publishers
+                queue.get_nowait()
+            queue.put_nowait(payload)
+
+
+@lru_cache
+def get_event_broker() -> EventBroker:
+    return EventBroker()
+
+
+async def publish_event(session: AsyncSession, topic: str, event_type: str, data: dict[str, Any]) -> None:
+    """Publish an event that subscribers receive once the session's transaction commits."""
+    message = orjson.dumps({"topic": topic, "type": event_type, "data": data})
+    if dialect_name(session) == "postgresql":
+        await session.execute(select(func.pg_notify(EVENTS_CHANNEL, message.decode())))
+    else:
+        # Round-trip through JSON so subscribers see the same payload shape as with NOTIFY
+        session.sync_session.info.setdefault(_PENDING_EVENTS_KEY, []).append(orjson.loads(message))
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_pending_events(session: Session) -> None:
+    broker = get_event_broker()
+    for payload in session.info.pop(_PENDING_EVENTS_KEY, []):
+        broker.publish(payload["topic"], payload)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_events(session: Session) -> None:
+    session.info.pop(_PENDING_EVENTS_KEY, None)
+
+
+class PostgresEventListener:
+    """LISTENs on EVENTS_CHANNEL over a dedicated connection and feeds the local broker.
+
+    The connection is opened outside the engine's pool so it never holds a pooled slot. When it drops
+    (server restart, failover, network), the listener logs the outage and reconnects with exponential
+    backoff; events published while it is down are not replayed.
+    """
+
+    RECONNECT_MIN_SECONDS = 0.5
+    RECONNECT_MAX_SECONDS = 30.0
+    # A silent peer (no FIN) is only noticed by talking to it
+    HEALTH_CHECK_SECONDS = 30.0
+
+    def __init__(self, broker: EventBroker, dsn: str):
+        self.broker = broker
+        self.dsn = dsn
+        self._task: asyncio.Task | None = None
+        self._listening = False
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="event-listener")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        delay = self.RECONNECT_MIN_SECONDS
+        while True:
+            self._listening = False
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Event listener disconnected ({e!r}); SSE streams miss events until it reconnects")
+            if self._listening:
+                # The connection worked for a while: start the backoff over
+                delay = self.RECONNECT_MIN_SECONDS
+            logger.info(f"Event listener reconnecting in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.RECONNECT_MAX_SECONDS)
+
+    async def _listen(self) -> None:
+        conn = await asyncpg.connect(self.dsn)
+        try:
+            lost = asyncio.Event()
+            conn.add_termination_listener(lambda _: lost.set())
+            await conn.add_listener(EVENTS_CHANNEL, self._on_notify)
+            self._listening = True
+            logger.info(f"Event listener listening on channel '{EVENTS_CHANNEL}'")
+            while not lost.is_set():
+                try:
+                    await asyncio.wait_for(lost.wait(), self.HEALTH_CHECK_SECONDS)
+                except TimeoutError:
+                    await asyncio.wait_for(conn.execute("SELECT 1"), self.HEALTH_CHECK_SECONDS)
+            raise ConnectionError("LISTEN connection closed")
+        finally:
+            conn.terminate()
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            event_payload = orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            logger.warning(f"Ignoring malformed event on channel '{channel}'")
+            return
+        self.broker.publish(event_payload["topic"], event_payload)
+
+
+async def start_event_listener() -> PostgresEventListener | None:
+    """Start the cross-process LISTEN connection when running on PostgreSQL."""
+    url = get_async_engine().url
+    if url.get_backend_name() != "postgresql":
+        return None
+    # asyncpg takes a plain libpq URL, without the SQLAlchemy driver suffix
+    listener = PostgresEventListener(
+        get_event_broker(), url.set(drivername="postgresql").render_as_string(hide_password=False)
+    )
+    await listener.start()
+    return listener
+
+
+SSE_KEEPALIVE = b": keep-alive\n\n"
+
+
+def format_sse(payload: dict[str, Any]) -> bytes:
+    return b"event: " + payload["type"].encode() + b"\ndata: " + orjson.dumps(payload["data"]) + b"\n\n"
+
+
+def sse_response(content: AsyncIterator[bytes]) -> StreamingResponse:
+    return StreamingResponse(
+        content,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
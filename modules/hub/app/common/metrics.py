@@ -0,0 +1,169 @@
+"""In-process latency histograms with percentile queries and Prometheus text exposition.
+
+Histograms use HDR-style log-linear buckets over integer milliseconds: exact below 2^SUB_BUCKET_BITS,
+then 2^(SUB_BUCKET_BITS-1) linear sub-buckets per power of two, so any recorded value is reported
+within ~1/2^(SUB_BUCKET_BITS-1) of its true value (6% with the default) in constant memory per range.
+Collectors are per process; each hub replica exposes its own `/metrics` for the scraper to aggregate.
+"""
+
+import threading
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+SUB_BUCKET_BITS = 5
+_SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+_HALF = _SUB_BUCKETS // 2
+_PENDING_OBSERVATIONS_KEY = "hub_pending_observations"
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+
+def bucket_index(value: int) -> int:
+    if value < _SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return shift * _HALF + (value >> shift)
+
+
+def bucket_upper_value(index: int) -> int:
+    """Highest value falling into bucket `index`."""
+    if index < _SUB_BUCKETS:
+        return index
+    shift, offset = divmod(index - _SUB_BUCKETS, _HALF)
+    shift += 1
+    return ((_HALF + offset + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Counts of millisecond values in log-linear buckets."""
+
+    def __init__(self) -> None:
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total_ms = 0
+        self.max_ms = 0
+
+    def record(self, value_ms: int) -> None:
+        value_ms = max(int(value_ms), 0)
+        index = bucket_index(value_ms)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def percentile(self, quantile: float) -> int:
+        """Value (ms) at or below which `quantile` of the recorded values fall; 0 when empty."""
+        if not self.count:
+            return 0
+        rank = max(1, round(quantile * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(bucket_upper_value(index), self.max_ms)
+        return self.max_ms
+
+
+@dataclass(frozen=True)
+class LatencySummary:
+    labels: tuple[str, ...]
+    count: int
+    sum_seconds: float
+    max_seconds: float
+    quantiles: dict[float, float]
+
+
+class LatencyCollector:
+    """Latency histograms keyed by label values."""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._histograms: dict[tuple[str, ...], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Sequence[str], seconds: float) -> None:
+        key = tuple(labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.record(round(seconds * 1000))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+    def summaries(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> list[LatencySummary]:
+        quantiles = tuple(quantiles)
+        with self._lock:
+            return [
+                LatencySummary(
+                    labels=labels,
+                    count=histogram.count,
+                    sum_seconds=histogram.total_ms / 1000,
+                    max_seconds=histogram.max_ms / 1000,
+                    quantiles={q: histogram.percentile(q) / 1000 for q in quantiles},
+                )
+                for labels, histogram in sorted(self._histograms.items())
+            ]
+
+    def render_prometheus(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} summary"]
+        for summary in self.summaries():
+            labels = ",".join(
+                f'{name}="{_escape_label(value)}"' for name, value in zip(self.label_names, summary.labels, strict=True)
+            )
+            for quantile, value in summary.quantiles.items():
+                lines.append(f'{self.name}{{{labels},quantile="{quantile}"}} {value}')
+            lines.append(f"{self.name}_sum{{{labels}}} {summary.sum_seconds}")
+            lines.append(f"{self.name}_count{{{labels}}} {summary.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self.collectors: list[LatencyCollector] = []
+
+    def register(self, collector: LatencyCollector) -> LatencyCollector:
+        self.collectors.append(collector)
+        return collector
+
+    def render_prometheus(self) -> str:
+        return "".join(collector.render_prometheus() for collector in self.collectors)
+
+
+@lru_cache
+def get_metrics_registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def observe_after_commit(
+    session: AsyncSession, collector: LatencyCollector, labels: Sequence[str], seconds: float
+) -> None:
+    """Record an observation once the session's transaction commits; dropped on rollback."""
+    session.sync_session.info.setdefault(_PENDING_OBSERVATIONS_KEY, []).append((collector, tuple(labels), seconds))
+
+
+@event.listens_for(Session, "after_commit")
+def _record_pending_observations(session: Session) -> None:
+    for collector, labels, seconds in session.info.pop(_PENDING_OBSERVATIONS_KEY, []):
+        collector.observe(labels, seconds)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_observations(session: Session) -> None:
+    session.info.pop(_PENDING_OBSERVATIONS_KEY, None)
@@ -0,0 +1,138 @@
+"""Keyset (cursor) pagination shared by list endpoints.
+
+Pages are ordered newest first on `(created_at, id)` and the cursor is an opaque token holding
+the key of the last row of the previous page, so fetching a page costs O(page) regardless of depth
+and no COUNT(*) is issued.
+"""
+
+import base64
+import binascii
+import datetime
+from collections.abc import Sequence
+from typing import Annotated, Any, Generic, TypeVar
+from uuid import UUID
+
+import orjson
+from app.common.database import dialect_name
+from app_base.base.exceptions.basic import BadRequestException
+from app_base.base.usecases.base import BaseUseCase
+from app_base.core.database.transaction import AsyncTransaction
+from fastapi import Query
+from pydantic import BaseModel, Field
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+T = TypeVar("T")
+
+CursorParam = Annotated[
+    str | None,
+    Query(
+        description="Opaque cursor for keyset pagination. Pass an empty value for the first page, "
+        "then the returned `next_cursor`. When omitted, offset pagination is used."
+    ),
+]
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """A page of results in cursor mode."""
+
+    items: list[T] = Field(..., description="Items of this page")
+    next_cursor: str | None = Field(..., description="Cursor for the next page; null on the last page")
+
+
+def encode_cursor(created_at: datetime.datetime, obj_id: UUID) -> str:
+    payload = orjson.dumps([created_at.isoformat(), str(obj_id)])
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime.datetime, UUID]:
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, obj_id = orjson.loads(payload)
+        return datetime.datetime.fromisoformat(created_at), UUID(obj_id)
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError) as e:
+        raise BadRequestException("Invalid cursor") from e
+
+
+def normalize_where(where: Any) -> list:
+    if where is None:
+        return []
+    if isinstance(where, (list, tuple)):
+        return list(where)
+    return [where]
+
+
+class CursorPaginationRepositoryMixin:
+    """Repository mixin adding keyset pagination on `(created_at, id)`."""
+
+    model: Any
+
+    async def get_multi_by_cursor(
+        self,
+        session: AsyncSession,
+        limit: int,
+        cursor: str | None,
+        where: Sequence | None = None,
+        options: Sequence | None = None,
+    ) -> tuple[list, str | None]:
+        """`options` are loader options (eager loads) applied to the page query."""
+        is_sqlite = dialect_name(session) == "sqlite"
+        created_at, obj_id = self.model.created_at, self.model.id
+        if is_sqlite:
+            # SQLite stores timestamps as text in mixed precisions ('...:05' vs '...:05.000000');
+            # compare on julianday so equal instants sort as equal.
+            created_at = func.julianday(created_at)
+
+        stmt = select(self.model).where(*normalize_where(where)).options(*(options or ()))
+        if cursor:
+            after_created_at, after_id = decode_cursor(cursor)
+            if is_sqlite:
+                after_created_at = func.julianday(after_created_at)
+            stmt = stmt.where(tuple_(created_at, obj_id) < tuple_(after_created_at, after_id))
+        stmt = stmt.order_by(created_at.desc(), obj_id.desc()).limit(limit + 1)
+
+        items = list((await session.scalars(stmt)).all())
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+        return items, next_cursor
+
+
+class CursorPaginationServiceMixin:
+    """Service mixin exposing cursor pagination, scoped to the parent resource when nested."""
+
+    async def get_multi_by_cursor(
+        self,
+        session: AsyncSession,
+        limit: int,
+        cursor: str | None,
+        context: dict | None = None,
+        where: Sequence | None = None,
+        options: Sequence | None = None,
+    ) -> tuple[list, str | None]:
+        where = normalize_where(where)
+        fk_name = getattr(self, "fk_name", None)
+        if fk_name and context:
+            where.append(getattr(self.repo.model, fk_name) == context["parent_id"])
+        return await self.repo.get_multi_by_cursor(session, limit, cursor, where=where, options=options)
+
+
+class BaseGetMultiByCursorUseCase(BaseUseCase, Generic[T]):
+    """List use case in cursor mode; `T` is the service type."""
+
+    def __init__(self, service: T) -> None:
+        self.service = service
+
+    async def execute(
+        self,
+        limit: int,
+        cursor: str | None,
+        context: dict | None = None,
+        where: Sequence | None = None,
+    ) -> CursorPage:
+        async with AsyncTransaction() as session:
+            items, next_cursor = await self.service.get_multi_by_cursor(
+                session, limit, cursor, context=context, where=where
+            )
+        return CursorPage(items=items, next_cursor=next_cursor)
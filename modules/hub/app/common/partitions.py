@@ -0,0 +1,120 @@
+"""Monthly range partitions on `created_at` (PostgreSQL).
+
+Partitions are named `<table>_pYYYYMM` and cover one UTC calendar month; a `<table>_default`
+partition catches rows outside the pre-created range. Creating a month's partition moves that month's
+rows out of the default partition. Retention drops whole partitions, which frees space immediately and
+leaves no dead tuples behind for vacuum, and purges the expired rows left in the default partition.
+"""
+
+import datetime
+import re
+from typing import Any
+
+from app_base.core.log import logger
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def month_start(value: datetime.datetime) -> datetime.datetime:
+    value = value.astimezone(datetime.UTC) if value.tzinfo else value.replace(tzinfo=datetime.UTC)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime.datetime, months: int) -> datetime.datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(table: str, month: datetime.datetime) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+def default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+class MonthlyPartitionRepositoryMixin:
+    """Repository mixin maintaining the monthly partitions of the model's table."""
+
+    model: Any
+
+    async def create_month_partitions(self, session: AsyncSession, start: datetime.datetime, months: int) -> list[str]:
+        """Create the partitions of `months` months from `start`'s month on; returns the ones created."""
+        table = self.model.__tablename__
+        existing = set(await self._list_partitions(session))
+        has_default = default_partition_name(table) in existing
+        created = []
+        month = month_start(start)
+        for _ in range(months):
+            name = partition_name(table, month)
+            if name not in existing:
+                try:
+                    # A savepoint per partition: one failing must not undo the others
+                    async with session.begin_nested():
+                        await self._create_month_partition(session, name, month, has_default)
+                    created.append(name)
+                except DBAPIError:
+                    logger.exception(f"Could not create partition '{name}'")
+            month = add_months(month, 1)
+        return created
+
+    async def drop_month_partitions_before(self, session: AsyncSession, cutoff: datetime.datetime) -> list[str]:
+        """Drop the partitions whose month ends on or before `cutoff`'s month; returns the ones dropped."""
+        table = self.model.__tablename__
+        pattern = re.compile(rf"^{re.escape(table)}_p(\d{{4}})(\d{{2}})$")
+        cutoff_month = month_start(cutoff)
+        dropped = []
+        for name in await self._list_partitions(session):
+            match = pattern.match(name)
+            if match is None:
+                continue
+            month = datetime.datetime(int(match[1]), int(match[2]), 1, tzinfo=datetime.UTC)
+            if add_months(month, 1) <= cutoff_month:
+                await session.execute(text(f'DROP TABLE "{name}"'))
+                dropped.append(name)
+        return dropped
+
+    async def purge_default_partition_before(self, session: AsyncSession, cutoff: datetime.datetime) -> int:
+        """Delete the rows of the default partition created before `cutoff`'s month; returns how many."""
+        table = self.model.__tablename__
+        default = default_partition_name(table)
+        if default not in await self._list_partitions(session):
+            return 0
+        result = await session.execute(
+            text(f'DELETE FROM "{default}" WHERE created_at < :cutoff'), {"cutoff": month_start(cutoff)}
+        )
+        return result.rowcount
+
+    async def _create_month_partition(
+        self, session: AsyncSession, name: str, month: datetime.datetime, has_default: bool
+    ) -> None:
+        table = self.model.__tablename__
+        bounds = f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+        if not has_default:
+            await session.execute(text(f'CREATE TABLE "{name}" PARTITION OF "{table}" {bounds}'))
+            return
+        # The default partition may already hold rows of this month, which would make a plain
+        # PARTITION OF fail: build the partition standalone, move the rows into it, then attach it.
+        await session.execute(text(f'CREATE TABLE "{name}" (LIKE "{table}" INCLUDING DEFAULTS)'))
+        await session.execute(
+            text(
+                f'WITH moved AS (DELETE FROM "{default_partition_name(table)}" '
+                "WHERE created_at >= :lower AND created_at < :upper RETURNING *) "
+                f'INSERT INTO "{name}" SELECT * FROM moved'
+            ),
+            {"lower": month, "upper": add_months(month, 1)},
+        )
+        await session.execute(text(f'ALTER TABLE "{table}" ATTACH PARTITION "{name}" {bounds}'))
+
+    async def _list_partitions(self, session: AsyncSession) -> list[str]:
+        result = await session.scalars(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE parent.relname = :table ORDER BY child.relname"
+            ),
+            {"table": self.model.__tablename__},
+        )
+        return list(result.all())
@@ -0,0 +1,37 @@
+from functools import lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class HubSettings(BaseSettings):
+    """Hub-specific runtime settings (environment variables prefixed with HUB_)."""
+
+    model_config = SettingsConfigDict(env_prefix="HUB_", env_file=".env", extra="ignore")
+
+    # Task leases
+    TASK_LEASE_SECONDS: int = 300
+    TASK_LEASE_REAPER_ENABLED: bool = True
+    TASK_LEASE_REAPER_INTERVAL_SECONDS: float = 30.0
+
+    # Task history partitions (PostgreSQL)
+    TASK_HISTORY_PARTITION_MAINTENANCE_ENABLED: bool = True
+    TASK_HISTORY_PARTITION_MAINTENANCE_INTERVAL_SECONDS: float = 3600.0
+    TASK_HISTORY_PARTITIONS_AHEAD_MONTHS: int = 3
+    TASK_HISTORY_RETENTION_MONTHS: int | None = None  # None keeps history forever
+
+    # Resolved configured agent cache
+    CONFIGURED_AGENT_CACHE_TTL_SECONDS: float = 60.0
+    CONFIGURED_AGENT_CACHE_MAXSIZE: int = 1024
+
+    # Agent execution event ingestion
+    AGENT_EXECUTION_INGEST_MAX_BUFFERED: int = 1000  # executions buffered before the flush runs early
+    AGENT_EXECUTION_INGEST_FLUSH_INTERVAL_SECONDS: float = 1.0
+    AGENT_EXECUTION_INGEST_MAX_DEFERRALS: int = 10  # flushes a change waits for its execution to be created
+
+    # Task event stream (SSE)
+    TASK_EVENTS_KEEPALIVE_SECONDS: float = 15.0
+
+
+@lru_cache
+def get_hub_settings() -> HubSettings:
+    return HubSettings()
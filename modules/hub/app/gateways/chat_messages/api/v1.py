@@ -1,12 +1,17 @@
 from typing import Annotated
 from uuid import UUID
 
+from app.common.export import ndjson_response
+from app.common.pagination import CursorPage, CursorParam
+from app.gateways.chat_messages.filters import ChatMessageFilterDepend
 from app.gateways.chat_messages.schemas import ChatMessageCreate, ChatMessageRead, ChatMessageUpdate
 from app.gateways.chat_messages.services import ChatMessageContextKwargs
 from app.gateways.chat_messages.usecases.crud import (
     CreateChatMessageUseCase,
     DeleteChatMessageUseCase,
+    ExportChatMessageUseCase,
     GetChatMessageUseCase,
+    GetMultiChatMessageByCursorUseCase,
     GetMultiChatMessageUseCase,
     UpdateChatMessageUseCase,
 )
@@ -15,6 +20,7 @@ from app_base.base.exceptions.basic import NotFoundException
 from app_base.base.schemas.delete_resp import DeleteResponse
 from app_base.base.schemas.paginated import PaginatedList
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
 
 router = APIRouter(
     prefix="/workspaces/{workspace_id}/conversations/{conversation_id}/chat_messages",
@@ -33,14 +39,29 @@ async def create_chat_message(
     return await use_case.execute(chat_message_in, context=context)
 
 
-@router.get("", response_model=PaginatedList[ChatMessageRead])
+@router.get("", response_model=PaginatedList[ChatMessageRead] | CursorPage[ChatMessageRead])
 async def get_chat_messages(
     conversation_id: UUID,
     use_case: Annotated[GetMultiChatMessageUseCase, Depends()],
+    cursor_use_case: Annotated[GetMultiChatMessageByCursorUseCase, Depends()],
     pagination: PaginationParam,
+    filters: ChatMessageFilterDepend,
+    cursor: CursorParam = None,
 ):
     context: ChatMessageContextKwargs = {"parent_id": conversation_id}
-    return await use_case.execute(**pagination, context=context)
+    if cursor is not None:
+        return await cursor_use_case.execute(pagination["limit"], cursor, context=context, where=filters)
+    return await use_case.execute(**pagination, context=context, where=filters)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_chat_messages(
+    conversation_id: UUID,
+    use_case: Annotated[ExportChatMessageUseCase, Depends()],
+    filters: ChatMessageFilterDepend,
+):
+    context: ChatMessageContextKwargs = {"parent_id": conversation_id}
+    return ndjson_response(await use_case.execute(context=context, where=filters))
 
 
 @router.get("/{chat_message_id}", response_model=ChatMessageRead)
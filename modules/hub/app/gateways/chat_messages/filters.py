@@ -0,0 +1,28 @@
+from typing import Annotated
+
+import orjson
+from app.common.database import json_contains
+from app.gateways.chat_messages.models import ChatMessage
+from app_base.base.exceptions.basic import BadRequestException
+from fastapi import Depends, Query
+
+
+def filter_metadata(
+    filter_metadata: Annotated[
+        str | None,
+        Query(description='Only messages whose metadata contains this JSON object, e.g. {"channel_message_id": "42"}'),
+    ] = None,
+) -> list:
+    """Containment on `metadata`; on PostgreSQL it is served by the GIN index."""
+    if filter_metadata is None:
+        return []
+    try:
+        value = orjson.loads(filter_metadata)
+    except orjson.JSONDecodeError as e:
+        raise BadRequestException("filter_metadata must be a JSON object") from e
+    if not isinstance(value, dict):
+        raise BadRequestException("filter_metadata must be a JSON object")
+    return [json_contains(ChatMessage.metadata_, value)]
+
+
+ChatMessageFilterDepend = Annotated[list, Depends(filter_metadata)]
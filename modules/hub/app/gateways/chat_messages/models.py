@@ -7,14 +7,15 @@ DB Schema Reference: docs/specification/DB_SCHEMA.md#3.2
 from typing import TYPE_CHECKING
 from uuid import UUID
 
+from app.common.database import JSON_VARIANT
 from app_base.base.models.mixin import Base, TimestampMixin, UUIDMixin
-from sqlalchemy import ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy import ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
     from app.agents.agent_executions.models import AgentExecution
     from app.gateways.conversations.models import Conversation
+    from app.gateways.routing_logs.models import RoutingLog
 
 
 class ChatMessage(Base, UUIDMixin, TimestampMixin):
@@ -26,9 +27,25 @@ class ChatMessage(Base, UUIDMixin, TimestampMixin):
     role: Mapped[str] = mapped_column(String(20), nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     content_type: Mapped[str] = mapped_column(String(50), nullable=False, default="text")
-    metadata_: Mapped[dict] = mapped_column("metadata", JSON, nullable=False, default={})
+    metadata_: Mapped[dict] = mapped_column("metadata", JSON_VARIANT, nullable=False, default={})
     agent_execution_id: Mapped[UUID | None] = mapped_column(ForeignKey("agent_executions.id"), nullable=True)
 
     # Relationships
     conversation: Mapped["Conversation"] = relationship("Conversation", back_populates="messages")
     agent_execution: Mapped["AgentExecution"] = relationship("AgentExecution")
+    # Read side only: routing logs are written through their own resource
+    routing_logs: Mapped[list["RoutingLog"]] = relationship(
+        "RoutingLog", viewonly=True, order_by="RoutingLog.created_at"
+    )
+
+    __table_args__ = (
+        Index("ix_chat_messages_conversation_id_created_at", "conversation_id", "created_at", "id"),
+        Index("ix_chat_messages_agent_execution_id", "agent_execution_id"),
+        # Serves `metadata @> ...` containment lookups (e.g. by channel message id)
+        Index(
+            "ix_chat_messages_metadata",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
+    )
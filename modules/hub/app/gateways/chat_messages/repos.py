@@ -1,7 +1,13 @@
+from app.common.export import ExportRepositoryMixin
+from app.common.pagination import CursorPaginationRepositoryMixin
 from app.gateways.chat_messages.models import ChatMessage
 from app.gateways.chat_messages.schemas import ChatMessageCreate, ChatMessageUpdate
 from app_base.base.repos.base import BaseRepository
 
 
-class ChatMessageRepository(BaseRepository[ChatMessage, ChatMessageCreate, ChatMessageUpdate]):
+class ChatMessageRepository(
+    BaseRepository[ChatMessage, ChatMessageCreate, ChatMessageUpdate],
+    CursorPaginationRepositoryMixin,
+    ExportRepositoryMixin,
+):
     model = ChatMessage
@@ -1,5 +1,7 @@
 from typing import Annotated
 
+from app.common.export import ExportServiceMixin
+from app.common.pagination import CursorPaginationServiceMixin
 from app.gateways.chat_messages.models import ChatMessage
 from app.gateways.chat_messages.repos import ChatMessageRepository
 from app.gateways.chat_messages.schemas import ChatMessageCreate, ChatMessageUpdate
@@ -20,6 +22,8 @@ class ChatMessageContextKwargs(NestedResourceContextKwargs):
 
 
 class ChatMessageService(
+    CursorPaginationServiceMixin,  # Keyset pagination for list endpoints
+    ExportServiceMixin,  # Streaming NDJSON export
     NestedResourceHooksMixin,  # Relationship with Conversation
     BaseCreateServiceMixin[ChatMessageRepository, ChatMessage, ChatMessageCreate, ChatMessageContextKwargs],
     BaseGetMultiServiceMixin[ChatMessageRepository, ChatMessage, ChatMessageContextKwargs],
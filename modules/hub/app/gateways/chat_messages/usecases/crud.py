@@ -1,5 +1,7 @@
 from typing import Annotated
 
+from app.common.export import BaseExportUseCase
+from app.common.pagination import BaseGetMultiByCursorUseCase
 from app.gateways.chat_messages.models import ChatMessage
 from app.gateways.chat_messages.schemas import ChatMessageCreate, ChatMessageUpdate
 from app.gateways.chat_messages.services import ChatMessageContextKwargs, ChatMessageService
@@ -23,6 +25,16 @@ class GetMultiChatMessageUseCase(BaseGetMultiUseCase[ChatMessageService, ChatMes
         super().__init__(service)
 
 
+class GetMultiChatMessageByCursorUseCase(BaseGetMultiByCursorUseCase[ChatMessageService]):
+    def __init__(self, service: Annotated[ChatMessageService, Depends()]) -> None:
+        super().__init__(service)
+
+
+class ExportChatMessageUseCase(BaseExportUseCase[ChatMessageService]):
+    def __init__(self, service: Annotated[ChatMessageService, Depends()]) -> None:
+        super().__init__(service)
+
+
 class CreateChatMessageUseCase(
     BaseCreateUseCase[ChatMessageService, ChatMessage, ChatMessageCreate, ChatMessageContextKwargs]
 ):
@@ -1,7 +1,13 @@
 from typing import Annotated
 from uuid import UUID
 
-from app.gateways.conversations.schemas import ConversationCreate, ConversationRead, ConversationUpdate
+from app.common.pagination import CursorParam
+from app.gateways.conversations.schemas import (
+    ConversationCreate,
+    ConversationRead,
+    ConversationTranscript,
+    ConversationUpdate,
+)
 from app.gateways.conversations.services import ConversationContextKwargs
 from app.gateways.conversations.usecases.crud import (
     CreateConversationUseCase,
@@ -10,11 +16,12 @@ from app.gateways.conversations.usecases.crud import (
     GetMultiConversationUseCase,
     UpdateConversationUseCase,
 )
+from app.gateways.conversations.usecases.transcript import GetConversationTranscriptUseCase
 from app_base.base.deps.params.page import PaginationParam
 from app_base.base.exceptions.basic import NotFoundException
 from app_base.base.schemas.delete_resp import DeleteResponse
 from app_base.base.schemas.paginated import PaginatedList
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 
 router = APIRouter(prefix="/workspaces/{workspace_id}/conversations", tags=["Conversation"], dependencies=[])
 
@@ -52,6 +59,18 @@ async def get_conversation(
     return conversation
 
 
+@router.get("/{conversation_id}/transcript", response_model=ConversationTranscript)
+async def get_conversation_transcript(
+    workspace_id: UUID,
+    use_case: Annotated[GetConversationTranscriptUseCase, Depends()],
+    conversation_id: UUID,
+    limit: Annotated[int, Query(ge=1, le=200, description="Number of messages in the window")] = 50,
+    cursor: CursorParam = None,
+):
+    context: ConversationContextKwargs = {"parent_id": workspace_id}
+    return await use_case.execute(conversation_id, limit, cursor, context=context)
+
+
 @router.put("/{conversation_id}", response_model=ConversationRead)
 async def update_conversation(
     workspace_id: UUID,
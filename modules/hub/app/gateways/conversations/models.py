@@ -10,7 +10,7 @@ from uuid import UUID
 
 from app.common.database import JSON_VARIANT
 from app_base.base.models.mixin import Base, TimestampMixin, UUIDMixin
-from sqlalchemy import DateTime, ForeignKey, String, func
+from sqlalchemy import DateTime, ForeignKey, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -36,3 +36,5 @@ class Conversation(Base, UUIDMixin, TimestampMixin):
     messages: Mapped[list["ChatMessage"]] = relationship(
         "ChatMessage", back_populates="conversation", cascade="all, delete-orphan"
     )
+
+    __table_args__ = (Index("ix_conversations_workspace_id_created_at", "workspace_id", "created_at"),)
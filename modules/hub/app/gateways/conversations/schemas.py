@@ -6,6 +6,8 @@ Pydantic schemas for Conversation CRUD operations.
 from datetime import datetime
 from uuid import UUID
 
+from app.gateways.chat_messages.schemas import ChatMessageRead
+from app.gateways.routing_logs.schemas import RoutingLogRead
 from app_base.base.schemas.mixin import TimestampSchemaMixin, UUIDSchemaMixin
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -42,3 +44,35 @@ class ConversationRead(UUIDSchemaMixin, TimestampSchemaMixin, ConversationBase):
     ended_at: datetime | None = Field(default=None, description="Ended At")
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class TranscriptExecutionSummary(BaseModel):
+    """Summary of the agent execution that produced a message."""
+
+    id: UUID = Field(..., description="Agent Execution ID")
+    agent_type: str = Field(..., description="Type of agent")
+    configured_agent_id: UUID | None = Field(default=None, description="Configured Agent ID")
+    graph_agent_name: str | None = Field(default=None, description="Graph Agent Name")
+    execution_type: str = Field(..., description="Type of execution")
+    status: str = Field(..., description="Execution status")
+    started_at: datetime | None = Field(default=None, description="Start timestamp")
+    completed_at: datetime | None = Field(default=None, description="Completion timestamp")
+    total_tokens: int | None = Field(default=None, description="Total tokens")
+    error_message: str | None = Field(default=None, description="Error message")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TranscriptMessage(ChatMessageRead):
+    """Chat message with its routing decisions and execution summary."""
+
+    routing_logs: list[RoutingLogRead] = Field(default_factory=list, description="Routing decisions, oldest first")
+    agent_execution: TranscriptExecutionSummary | None = Field(default=None, description="Producing execution")
+
+
+class ConversationTranscript(BaseModel):
+    """A window of a conversation's messages, oldest first."""
+
+    conversation: ConversationRead = Field(..., description="Conversation")
+    messages: list[TranscriptMessage] = Field(..., description="Messages of this window, oldest first")
+    next_cursor: str | None = Field(..., description="Cursor for the window of older messages; null when none")
@@ -0,0 +1,57 @@
+from typing import Annotated, Optional
+from uuid import UUID
+
+from app.gateways.chat_messages.models import ChatMessage
+from app.gateways.chat_messages.services import ChatMessageService
+from app.gateways.conversations.models import Conversation
+from app.gateways.conversations.schemas import ConversationRead, ConversationTranscript, TranscriptMessage
+from app.gateways.conversations.services import ConversationContextKwargs, ConversationService
+from app_base.base.exceptions.basic import NotFoundException
+from app_base.base.usecases.base import BaseUseCase
+from app_base.core.database.transaction import AsyncTransaction
+from fastapi import Depends
+from sqlalchemy.orm import joinedload, selectinload
+
+
+class GetConversationTranscriptUseCase(BaseUseCase):
+    """A window of messages with their routing logs and execution summaries.
+
+    Three queries whatever the window size: the conversation, the message page with its execution
+    joined in, and one IN query for the routing logs of the whole page.
+    """
+
+    def __init__(
+        self,
+        service: Annotated[ConversationService, Depends()],
+        chat_message_service: Annotated[ChatMessageService, Depends()],
+    ) -> None:
+        self.service = service
+        self.chat_message_service = chat_message_service
+
+    async def execute(
+        self,
+        conversation_id: UUID,
+        limit: int,
+        cursor: str | None = None,
+        context: Optional[ConversationContextKwargs] = None,
+    ) -> ConversationTranscript:
+        async with AsyncTransaction() as session:
+            where = [Conversation.id == conversation_id]
+            if context:
+                where.append(Conversation.workspace_id == context["parent_id"])
+            conversation = await self.service.repo.get(session, where=where)
+            if conversation is None:
+                raise NotFoundException()
+            # Newest first, so the window ends at the cursor; returned oldest first below
+            messages, next_cursor = await self.chat_message_service.get_multi_by_cursor(
+                session,
+                limit,
+                cursor,
+                context={"parent_id": conversation_id},
+                options=[joinedload(ChatMessage.agent_execution), selectinload(ChatMessage.routing_logs)],
+            )
+            return ConversationTranscript(
+                conversation=ConversationRead.model_validate(conversation),
+                messages=[TranscriptMessage.model_validate(message) for message in reversed(messages)],
+                next_cursor=next_cursor,
+            )
@@ -1,10 +1,12 @@
 from typing import Annotated
 from uuid import UUID
 
+from app.common.pagination import CursorPage, CursorParam
 from app.gateways.routing_logs.schemas import RoutingLogCreate, RoutingLogRead
 from app.gateways.routing_logs.usecases.crud import (
     CreateRoutingLogUseCase,
     DeleteRoutingLogUseCase,
+    GetMultiRoutingLogByCursorUseCase,
     GetMultiRoutingLogUseCase,
     GetRoutingLogUseCase,
 )
@@ -25,11 +27,15 @@ async def create_routing_log(
     return await use_case.execute(routing_log_in)
 
 
-@router.get("", response_model=PaginatedList[RoutingLogRead])
+@router.get("", response_model=PaginatedList[RoutingLogRead] | CursorPage[RoutingLogRead])
 async def get_routing_logs(
     use_case: Annotated[GetMultiRoutingLogUseCase, Depends()],
+    cursor_use_case: Annotated[GetMultiRoutingLogByCursorUseCase, Depends()],
     pagination: PaginationParam,
+    cursor: CursorParam = None,
 ):
+    if cursor is not None:
+        return await cursor_use_case.execute(pagination["limit"], cursor)
     return await use_case.execute(**pagination)
 
 
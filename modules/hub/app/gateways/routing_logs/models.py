@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING
 from uuid import UUID
 
 from app_base.base.models.mixin import Base, TimestampMixin, UUIDMixin
-from sqlalchemy import Float, ForeignKey, String, Text
+from sqlalchemy import Float, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -33,3 +33,10 @@ class RoutingLog(Base, UUIDMixin, TimestampMixin):
     message: Mapped["ChatMessage"] = relationship("ChatMessage")
     target_task: Mapped["Task"] = relationship("Task")
     target_agent: Mapped["ConfiguredAgent"] = relationship("ConfiguredAgent")
+
+    __table_args__ = (
+        Index("ix_routing_logs_message_id", "message_id"),
+        Index("ix_routing_logs_target_task_id", "target_task_id"),
+        Index("ix_routing_logs_target_agent_id", "target_agent_id"),
+        Index("ix_routing_logs_created_at", "created_at", "id"),
+    )
@@ -1,7 +1,10 @@
+from app.common.pagination import CursorPaginationRepositoryMixin
 from app.gateways.routing_logs.models import RoutingLog
 from app.gateways.routing_logs.schemas import RoutingLogCreate, RoutingLogUpdate
 from app_base.base.repos.base import BaseRepository
 
 
-class RoutingLogRepository(BaseRepository[RoutingLog, RoutingLogCreate, RoutingLogUpdate]):
+class RoutingLogRepository(
+    BaseRepository[RoutingLog, RoutingLogCreate, RoutingLogUpdate], CursorPaginationRepositoryMixin
+):
     model = RoutingLog
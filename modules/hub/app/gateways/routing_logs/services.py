@@ -1,5 +1,6 @@
 from typing import Annotated
 
+from app.common.pagination import CursorPaginationServiceMixin
 from app.gateways.routing_logs.models import RoutingLog
 from app.gateways.routing_logs.repos import RoutingLogRepository
 from app.gateways.routing_logs.schemas import RoutingLogCreate
@@ -14,6 +15,7 @@ from fastapi import Depends
 
 
 class RoutingLogService(
+    CursorPaginationServiceMixin,
     BaseCreateServiceMixin[RoutingLogRepository, RoutingLog, RoutingLogCreate, BaseContextKwargs],
     BaseGetMultiServiceMixin[RoutingLogRepository, RoutingLog, BaseContextKwargs],
     BaseGetServiceMixin[RoutingLogRepository, RoutingLog, BaseContextKwargs],
@@ -1,5 +1,6 @@
 from typing import Annotated
 
+from app.common.pagination import BaseGetMultiByCursorUseCase
 from app.gateways.routing_logs.models import RoutingLog
 from app.gateways.routing_logs.schemas import RoutingLogCreate, RoutingLogUpdate
 from app.gateways.routing_logs.services import BaseContextKwargs, RoutingLogService
@@ -23,6 +24,11 @@ class GetMultiRoutingLogUseCase(BaseGetMultiUseCase[RoutingLogService, RoutingLo
         super().__init__(service)
 
 
+class GetMultiRoutingLogByCursorUseCase(BaseGetMultiByCursorUseCase[RoutingLogService]):
+    def __init__(self, service: Annotated[RoutingLogService, Depends()]) -> None:
+        super().__init__(service)
+
+
 class CreateRoutingLogUseCase(BaseCreateUseCase[RoutingLogService, RoutingLog, RoutingLogCreate, BaseContextKwargs]):
     def __init__(self, service: Annotated[RoutingLogService, Depends()]) -> None:
         super().__init__(service)
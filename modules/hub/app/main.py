@@ -1,6 +1,20 @@
 from contextlib import asynccontextmanager
 
+from app.agents.agent_executions.ingest import get_agent_execution_ingest_buffer
+from app.agents.agent_executions.repos import AgentExecutionRepository
+from app.agents.agent_executions.services import AgentExecutionService
+from app.agents.agent_executions.usecases.ingest import FlushAgentExecutionEventsUseCase
+from app.common.background import PeriodicTask
+from app.common.events import start_event_listener
+from app.common.settings import get_hub_settings
+from app.platform.workspaces.repos import WorkspaceRepository
 from app.router import router
+from app.tasks.task_histories.repos import TaskHistoryRepository
+from app.tasks.task_histories.services import TaskHistoryService
+from app.tasks.task_histories.usecases.partitions import MaintainTaskHistoryPartitionsUseCase
+from app.tasks.tasks.repos import TaskRepository
+from app.tasks.tasks.services import TaskService
+from app.tasks.tasks.usecases.lease import ReleaseExpiredTaskLeasesUseCase
 from app_base.base.exceptions.handler import set_exception_handler
 from app_base.core import middlewares
 from app_base.core.log import logger
@@ -13,7 +27,43 @@ def get_lifespan():
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         logger.info("Starting app lifespan")
+        settings = get_hub_settings()
+        background_tasks: list[PeriodicTask] = []
+        ingest_flush = FlushAgentExecutionEventsUseCase(AgentExecutionService(AgentExecutionRepository()))
+        background_tasks.append(
+            PeriodicTask(
+                "agent-execution-ingest",
+                settings.AGENT_EXECUTION_INGEST_FLUSH_INTERVAL_SECONDS,
+                ingest_flush.execute,
+                wake=get_agent_execution_ingest_buffer().flush_requested,
+            )
+        )
+        if settings.TASK_LEASE_REAPER_ENABLED:
+            reaper = ReleaseExpiredTaskLeasesUseCase(TaskService(TaskRepository(), WorkspaceRepository()))
+            background_tasks.append(
+                PeriodicTask("task-lease-reaper", settings.TASK_LEASE_REAPER_INTERVAL_SECONDS, reaper.execute)
+            )
+        if settings.TASK_HISTORY_PARTITION_MAINTENANCE_ENABLED:
+            maintenance = MaintainTaskHistoryPartitionsUseCase(
+                TaskHistoryService(TaskHistoryRepository(), WorkspaceRepository())
+            )
+            background_tasks.append(
+                PeriodicTask(
+                    "task-history-partitions",
+                    settings.TASK_HISTORY_PARTITION_MAINTENANCE_INTERVAL_SECONDS,
+                    maintenance.execute,
+                )
+            )
+        for task in background_tasks:
+            task.start()
+        event_listener = await start_event_listener()
         yield
+        if event_listener is not None:
+            await event_listener.stop()
+        for task in background_tasks:
+            await task.stop()
+        # Write what is still buffered before the process exits
+        await ingest_flush.execute()
         logger.info("End of app lifespan")
 
     return lifespan
@@ -5,6 +5,7 @@ from app.agents.agent_mcps.api.v1 import router as v1_agent_mcps_router
 from app.agents.agent_skills.api.v1 import router as v1_agent_skills_router
 from app.agents.ai_model_catalogs.api.v1 import router as v1_ai_models_router
 from app.agents.configured_agents.api.v1 import router as v1_configured_agents_router
+from app.common.metrics import PROMETHEUS_MEDIA_TYPE, get_metrics_registry
 from app.gateways.chat_messages.api.v1 import router as v1_chat_messages_router
 from app.gateways.conversations.api.v1 import router as v1_conversations_router
 from app.gateways.routing_logs.api.v1 import router as v1_routing_logs_router
@@ -38,6 +39,11 @@ async def deep_health_check(session: Annotated[AsyncSession, Depends(get_session
         )
 
 
+@router.get("/metrics", response_class=Response)
+async def metrics():
+    return Response(content=get_metrics_registry().render_prometheus(), media_type=PROMETHEUS_MEDIA_TYPE)
+
+
 # Feature routers
 v1_router.include_router(v1_tasks_router)
 v1_router.include_router(v1_task_tags_router)
@@ -1,20 +1,23 @@
 from typing import Annotated
 from uuid import UUID
 
-from app.tasks.task_histories.schemas import TaskHistoryCreate, TaskHistoryRead, TaskHistoryUpdate
+from app.common.export import ndjson_response
+from app.common.pagination import CursorPage, CursorParam
+from app.tasks.task_histories.filters import TaskHistoryFilterDepend
+from app.tasks.task_histories.schemas import TaskHistoryCreate, TaskHistoryRead
 from app.tasks.task_histories.services import TaskHistoryContextKwargs
 from app.tasks.task_histories.usecases.crud import (
     CreateTaskHistoryUseCase,
-    DeleteTaskHistoryUseCase,
+    ExportTaskHistoryUseCase,
+    GetMultiTaskHistoryByCursorUseCase,
     GetMultiTaskHistoryUseCase,
     GetTaskHistoryUseCase,
-    UpdateTaskHistoryUseCase,
 )
 from app_base.base.deps.params.page import PaginationParam
 from app_base.base.exceptions.basic import NotFoundException
-from app_base.base.schemas.delete_resp import DeleteResponse
 from app_base.base.schemas.paginated import PaginatedList
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
 
 router = APIRouter(prefix="/workspaces/{workspace_id}/task_histories", tags=["TaskHistories"], dependencies=[])
 
@@ -29,48 +32,39 @@ async def create_task_history(
     return await use_case.execute(task_history_in, context=context)
 
 
-@router.get("", response_model=PaginatedList[TaskHistoryRead])
+@router.get("", response_model=PaginatedList[TaskHistoryRead] | CursorPage[TaskHistoryRead])
 async def get_task_histories(
     workspace_id: UUID,
     use_case: Annotated[GetMultiTaskHistoryUseCase, Depends()],
+    cursor_use_case: Annotated[GetMultiTaskHistoryByCursorUseCase, Depends()],
     pagination: PaginationParam,
+    filters: TaskHistoryFilterDepend,
+    cursor: CursorParam = None,
 ):
     context: TaskHistoryContextKwargs = {"parent_id": workspace_id}
-    return await use_case.execute(**pagination, context=context)
+    if cursor is not None:
+        return await cursor_use_case.execute(pagination["limit"], cursor, context=context, where=filters)
+    return await use_case.execute(**pagination, context=context, where=filters)
 
 
-@router.get("/{task_history_id}", response_model=TaskHistoryRead)
-async def get_task_history(
+@router.get("/export", response_class=StreamingResponse)
+async def export_task_histories(
     workspace_id: UUID,
-    use_case: Annotated[GetTaskHistoryUseCase, Depends()],
-    task_history_id: UUID,
+    use_case: Annotated[ExportTaskHistoryUseCase, Depends()],
+    filters: TaskHistoryFilterDepend,
 ):
     context: TaskHistoryContextKwargs = {"parent_id": workspace_id}
-    task_history = await use_case.execute(task_history_id, context=context)
-    if not task_history:
-        raise NotFoundException()
-    return task_history
+    return ndjson_response(await use_case.execute(context=context, where=filters))
 
 
-@router.put("/{task_history_id}", response_model=TaskHistoryRead)
-async def update_task_history(
+@router.get("/{task_history_id}", response_model=TaskHistoryRead)
+async def get_task_history(
     workspace_id: UUID,
-    use_case: Annotated[UpdateTaskHistoryUseCase, Depends()],
+    use_case: Annotated[GetTaskHistoryUseCase, Depends()],
     task_history_id: UUID,
-    task_history_in: TaskHistoryUpdate,
 ):
     context: TaskHistoryContextKwargs = {"parent_id": workspace_id}
-    task_history = await use_case.execute(task_history_id, task_history_in, context=context)
+    task_history = await use_case.execute(task_history_id, context=context)
     if not task_history:
         raise NotFoundException()
     return task_history
-
-
-@router.delete("/{task_history_id}", response_model=DeleteResponse)
-async def delete_task_history(
-    workspace_id: UUID,
-    use_case: Annotated[DeleteTaskHistoryUseCase, Depends()],
-    task_history_id: UUID,
-):
-    context: TaskHistoryContextKwargs = {"parent_id": workspace_id}
-    return await use_case.execute(task_history_id, context=context)
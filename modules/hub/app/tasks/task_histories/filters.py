@@ -0,0 +1,25 @@
+import datetime
+from typing import Annotated
+
+from app.tasks.task_histories.models import TaskHistory
+from fastapi import Depends, Query
+
+
+def filter_created_at(
+    filter_created_after: Annotated[
+        datetime.datetime | None, Query(description="Only entries created at or after this time")
+    ] = None,
+    filter_created_before: Annotated[
+        datetime.datetime | None, Query(description="Only entries created before this time")
+    ] = None,
+) -> list:
+    """Time bounds on `created_at`; on PostgreSQL they let the planner skip whole monthly partitions."""
+    where = []
+    if filter_created_after is not None:
+        where.append(TaskHistory.created_at >= filter_created_after)
+    if filter_created_before is not None:
+        where.append(TaskHistory.created_at < filter_created_before)
+    return where
+
+
+TaskHistoryFilterDepend = Annotated[list, Depends(filter_created_at)]
@@ -1,6 +1,9 @@
 """TaskHistory Model for Hub Module.
 
 TaskHistory: History of task status changes and assignments.
+Append-only; on PostgreSQL the table is range-partitioned by month on `created_at` (see the
+task_history_partitioning migration and `MaintainTaskHistoryPartitionsUseCase`). Entries are kept
+when their task is deleted, so `task_id` is not a foreign key.
 DB Schema Reference: docs/specification/DB_SCHEMA.md#1.3
 """
 
@@ -10,7 +13,7 @@ from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 from app_base.base.models.mixin import Base, UUIDMixin
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -35,7 +38,7 @@ class TaskHistory(Base, UUIDMixin):
 
     # Foreign keys
     workspace_id: Mapped[UUID] = mapped_column(ForeignKey("workspaces.id"), nullable=False)
-    task_id: Mapped[UUID] = mapped_column(ForeignKey("tasks.id"), nullable=False)
+    task_id: Mapped[UUID] = mapped_column(nullable=False)
     assigned_agent_id: Mapped[UUID | None] = mapped_column(ForeignKey("configured_agents.id"), nullable=True)
 
     # Event details
@@ -52,5 +55,14 @@ class TaskHistory(Base, UUIDMixin):
 
     # Relationships
     workspace: Mapped["Workspace"] = relationship("Workspace")
-    task: Mapped["Task"] = relationship("Task", back_populates="histories")
+    task: Mapped["Task | None"] = relationship(
+        "Task", primaryjoin="foreign(TaskHistory.task_id) == Task.id", back_populates="histories", viewonly=True
+    )
     assigned_agent: Mapped[Optional["ConfiguredAgent"]] = relationship("ConfiguredAgent")
+
+    __table_args__ = (
+        Index("ix_task_history_workspace_id_created_at", "workspace_id", "created_at", "id"),
+        Index("ix_task_history_task_id_created_at", "task_id", "created_at"),
+        Index("ix_task_history_assigned_agent_id", "assigned_agent_id"),
+        Index("ix_task_history_created_at_brin", "created_at", postgresql_using="brin"),
+    )
@@ -1,11 +1,34 @@
 """TaskHistory Repository for Hub Module."""
 
+from collections.abc import Sequence
+from uuid import UUID
+
+from app.common.export import ExportRepositoryMixin
+from app.common.pagination import CursorPaginationRepositoryMixin
+from app.common.partitions import MonthlyPartitionRepositoryMixin
 from app.tasks.task_histories.models import TaskHistory
 from app.tasks.task_histories.schemas import TaskHistoryCreate, TaskHistoryUpdate
 from app_base.base.repos.base import BaseRepository
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
-class TaskHistoryRepository(BaseRepository[TaskHistory, TaskHistoryCreate, TaskHistoryUpdate]):
+class TaskHistoryRepository(
+    BaseRepository[TaskHistory, TaskHistoryCreate, TaskHistoryUpdate],
+    CursorPaginationRepositoryMixin,
+    ExportRepositoryMixin,
+    MonthlyPartitionRepositoryMixin,
+):
     """Repository for TaskHistory CRUD operations."""
 
     model = TaskHistory
+
+    async def bulk_create(
+        self, session: AsyncSession, workspace_id: UUID, objs: Sequence[TaskHistoryCreate]
+    ) -> list[UUID]:
+        """Insert many history entries with a single multi-row INSERT; returns their ids in `objs` order."""
+        result = await session.execute(
+            insert(self.model).returning(self.model.id, sort_by_parameter_order=True),
+            [{**obj.model_dump(), "workspace_id": workspace_id} for obj in objs],
+        )
+        return list(result.scalars().all())
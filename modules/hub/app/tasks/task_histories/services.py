@@ -1,21 +1,32 @@
 """TaskHistory Service for Hub Module."""
 
+import datetime
+from collections.abc import Mapping
 from typing import Annotated
+from uuid import UUID
 
+from app.common.export import ExportServiceMixin
+from app.common.pagination import CursorPaginationServiceMixin
 from app.platform.workspaces.repos import WorkspaceRepository
-from app.tasks.task_histories.models import TaskHistory
+from app.tasks.task_histories.models import TaskHistory, TaskHistoryEventType
 from app.tasks.task_histories.repos import TaskHistoryRepository
-from app.tasks.task_histories.schemas import TaskHistoryCreate, TaskHistoryUpdate
+from app.tasks.task_histories.schemas import TaskHistoryCreate
 from app_base.base.repos.base import BaseRepository
 from app_base.base.services.base import (
     BaseCreateServiceMixin,
-    BaseDeleteServiceMixin,
     BaseGetMultiServiceMixin,
     BaseGetServiceMixin,
-    BaseUpdateServiceMixin,
 )
 from app_base.base.services.nested_resource_hook import NestedResourceContextKwargs, NestedResourceHooksMixin
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Task fields whose changes are recorded automatically, and the history event each one produces
+TRACKED_TASK_FIELDS: dict[str, TaskHistoryEventType] = {
+    "status": TaskHistoryEventType.STATUS_CHANGE,
+    "queue": TaskHistoryEventType.QUEUE_CHANGE,
+    "priority": TaskHistoryEventType.PRIORITY_CHANGE,
+}
 
 
 class TaskHistoryContextKwargs(NestedResourceContextKwargs):
@@ -23,14 +34,14 @@ class TaskHistoryContextKwargs(NestedResourceContextKwargs):
 
 
 class TaskHistoryService(
+    CursorPaginationServiceMixin,
+    ExportServiceMixin,
     NestedResourceHooksMixin,
     BaseCreateServiceMixin[TaskHistoryRepository, TaskHistory, TaskHistoryCreate, TaskHistoryContextKwargs],
     BaseGetMultiServiceMixin[TaskHistoryRepository, TaskHistory, TaskHistoryContextKwargs],
     BaseGetServiceMixin[TaskHistoryRepository, TaskHistory, TaskHistoryContextKwargs],
-    BaseUpdateServiceMixin[TaskHistoryRepository, TaskHistory, TaskHistoryUpdate, TaskHistoryContextKwargs],
-    BaseDeleteServiceMixin[TaskHistoryRepository, TaskHistory, TaskHistoryContextKwargs],
 ):
-    """Service for TaskHistory business logic."""
+    """Service for TaskHistory business logic. History is append-only: no update or delete."""
 
     def __init__(
         self,
@@ -55,3 +66,43 @@ class TaskHistoryService(
     @property
     def fk_name(self) -> str:
         return "workspace_id"
+
+    async def record_task_changes(
+        self,
+        session: AsyncSession,
+        task_id: UUID,
+        workspace_id: UUID,
+        previous: Mapping[str, str],
+        current: Mapping[str, str],
+        changed_by: str,
+    ) -> dict[UUID, TaskHistoryCreate]:
+        """Write one history entry per tracked field whose value differs between `previous` and `current`;
+        returns the entries by id.
+
+        Only changes made through the task API are recorded. The claim path and the lease reaper move
+        tasks between pending and in_progress with bulk UPDATEs and write no status_change entries: they
+        publish their own `task.claimed` / `task.lease_expired` events instead.
+        """
+        objs = [
+            TaskHistoryCreate(
+                task_id=task_id,
+                event_type=event_type.value,
+                previous_value=previous[field],
+                new_value=current[field],
+                changed_by=changed_by,
+            )
+            for field, event_type in TRACKED_TASK_FIELDS.items()
+            if field in current and current[field] != previous[field]
+        ]
+        if not objs:
+            return {}
+        return dict(zip(await self.repo.bulk_create(session, workspace_id, objs), objs, strict=True))
+
+    async def create_partitions(self, session: AsyncSession, start: datetime.datetime, months: int) -> list[str]:
+        return await self.repo.create_month_partitions(session, start, months)
+
+    async def drop_partitions_before(self, session: AsyncSession, cutoff: datetime.datetime) -> list[str]:
+        return await self.repo.drop_month_partitions_before(session, cutoff)
+
+    async def purge_default_partition_before(self, session: AsyncSession, cutoff: datetime.datetime) -> int:
+        return await self.repo.purge_default_partition_before(session, cutoff)
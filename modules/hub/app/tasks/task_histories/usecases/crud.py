@@ -1,16 +1,21 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
+from app.common.export import BaseExportUseCase
+from app.common.pagination import BaseGetMultiByCursorUseCase
 from app.tasks.task_histories.models import TaskHistory
-from app.tasks.task_histories.schemas import TaskHistoryCreate, TaskHistoryUpdate
+from app.tasks.task_histories.schemas import TaskHistoryCreate
 from app.tasks.task_histories.services import TaskHistoryContextKwargs, TaskHistoryService
+from app.tasks.tasks.enum import TaskEventType
+from app.tasks.tasks.events import publish_task_event
+from app.tasks.tasks.services import TaskService
+from app_base.base.exceptions.basic import NotFoundException
 from app_base.base.usecases.crud import (
     BaseCreateUseCase,
-    BaseDeleteUseCase,
     BaseGetMultiUseCase,
     BaseGetUseCase,
-    BaseUpdateUseCase,
 )
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 class GetTaskHistoryUseCase(BaseGetUseCase[TaskHistoryService, TaskHistory, TaskHistoryContextKwargs]):
@@ -23,20 +28,41 @@ class GetMultiTaskHistoryUseCase(BaseGetMultiUseCase[TaskHistoryService, TaskHis
         super().__init__(service)
 
 
-class CreateTaskHistoryUseCase(
-    BaseCreateUseCase[TaskHistoryService, TaskHistory, TaskHistoryCreate, TaskHistoryContextKwargs]
-):
+class GetMultiTaskHistoryByCursorUseCase(BaseGetMultiByCursorUseCase[TaskHistoryService]):
     def __init__(self, service: Annotated[TaskHistoryService, Depends()]) -> None:
         super().__init__(service)
 
 
-class UpdateTaskHistoryUseCase(
-    BaseUpdateUseCase[TaskHistoryService, TaskHistory, TaskHistoryUpdate, TaskHistoryContextKwargs]
-):
+class ExportTaskHistoryUseCase(BaseExportUseCase[TaskHistoryService]):
     def __init__(self, service: Annotated[TaskHistoryService, Depends()]) -> None:
         super().__init__(service)
 
 
-class DeleteTaskHistoryUseCase(BaseDeleteUseCase[TaskHistoryService, TaskHistory, TaskHistoryContextKwargs]):
-    def __init__(self, service: Annotated[TaskHistoryService, Depends()]) -> None:
+class CreateTaskHistoryUseCase(
+    BaseCreateUseCase[TaskHistoryService, TaskHistory, TaskHistoryCreate, TaskHistoryContextKwargs]
+):
+    def __init__(
+        self,
+        service: Annotated[TaskHistoryService, Depends()],
+        task_service: Annotated[TaskService, Depends()],
+    ) -> None:
         super().__init__(service)
+        self.task_service = task_service
+
+    async def _execute(
+        self, session: AsyncSession, obj_data: TaskHistoryCreate, context: Optional[TaskHistoryContextKwargs]
+    ) -> TaskHistory:
+        # task_id is not a foreign key (history outlives its task), so check it here
+        if await self.task_service.get_field_values(session, obj_data.task_id, ["id"], context) is None:
+            raise NotFoundException()
+        task_history = await super()._execute(session, obj_data, context)
+        await publish_task_event(
+            session,
+            TaskEventType.HISTORY_CREATED,
+            task_history.workspace_id,
+            task_id=task_history.task_id,
+            task_history_id=task_history.id,
+            event_type=task_history.event_type,
+            new_value=task_history.new_value,
+        )
+        return task_history
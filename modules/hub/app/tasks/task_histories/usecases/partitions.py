@@ -0,0 +1,45 @@
+import datetime
+from typing import Annotated
+
+from app.common.database import dialect_name, try_advisory_xact_lock
+from app.common.partitions import add_months, month_start
+from app.common.settings import get_hub_settings
+from app.tasks.task_histories.services import TaskHistoryService
+from app_base.base.usecases.base import BaseUseCase
+from app_base.core.database.transaction import AsyncTransaction
+from app_base.core.log import logger
+from fastapi import Depends
+
+MAINTENANCE_LOCK = "task_history_partitions"
+
+
+class MaintainTaskHistoryPartitionsUseCase(BaseUseCase):
+    """Pre-create upcoming monthly partitions of task_history and drop those past retention.
+
+    Every replica schedules it; an advisory lock lets one of them run it at a time.
+    """
+
+    def __init__(self, service: Annotated[TaskHistoryService, Depends()]) -> None:
+        self.service = service
+
+    async def execute(self) -> None:
+        settings = get_hub_settings()
+        async with AsyncTransaction() as session:
+            if dialect_name(session) != "postgresql":
+                return
+            if not await try_advisory_xact_lock(session, MAINTENANCE_LOCK):
+                return
+            now = datetime.datetime.now(datetime.UTC)
+            created = await self.service.create_partitions(
+                session, now, settings.TASK_HISTORY_PARTITIONS_AHEAD_MONTHS + 1
+            )
+            dropped, purged = [], 0
+            if settings.TASK_HISTORY_RETENTION_MONTHS is not None:
+                cutoff = add_months(month_start(now), -settings.TASK_HISTORY_RETENTION_MONTHS)
+                dropped = await self.service.drop_partitions_before(session, cutoff)
+                purged = await self.service.purge_default_partition_before(session, cutoff)
+        if created or dropped or purged:
+            logger.info(
+                f"task_history partitions created: {created}, dropped: {dropped}; "
+                f"rows purged from the default partition: {purged}"
+            )
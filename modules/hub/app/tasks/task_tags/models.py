@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING
 from uuid import UUID
 
 from app_base.base.models.mixin import Base, TimestampMixin, UUIDMixin
-from sqlalchemy import Column, ForeignKey, String, Table
+from sqlalchemy import Column, ForeignKey, Index, String, Table
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -23,6 +23,8 @@ task_tag_associations = Table(
     Base.metadata,
     Column("task_id", PG_UUID(as_uuid=True), ForeignKey("tasks.id"), primary_key=True),
     Column("tag_id", PG_UUID(as_uuid=True), ForeignKey("task_tags.id"), primary_key=True),
+    # The primary key serves task -> tags lookups; this one serves tag -> tasks
+    Index("ix_task_tag_associations_tag_id_task_id", "tag_id", "task_id"),
 )
 
 
@@ -45,3 +47,5 @@ class TaskTag(Base, UUIDMixin, TimestampMixin):
         secondary=task_tag_associations,
         back_populates="tags",
     )
+
+    __table_args__ = (Index("ix_task_tags_workspace_id_name", "workspace_id", "name"),)
@@ -1,10 +1,13 @@
 """TaskTag Repository for Hub Module."""
 
+from collections.abc import Sequence
 from uuid import UUID
 
+from app.common.database import upsert_insert
 from app.tasks.task_tags.models import TaskTag
 from app.tasks.task_tags.schemas import TaskTagCreate, TaskTagUpdate
 from app_base.base.repos.base import BaseRepository
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -21,3 +24,38 @@ class TaskTagRepository(BaseRepository[TaskTag, TaskTagCreate, TaskTagUpdate]):
     ) -> TaskTag | None:
         """Get a tag by name."""
         return await self.get(session, where=[self.model.name == name, self.model.workspace_id == workspace_id])
+
+    async def get_by_names(
+        self,
+        session: AsyncSession,
+        names: Sequence[str],
+        workspace_id: UUID,
+    ) -> Sequence[TaskTag]:
+        """Get all tags of a workspace whose name is in `names` with a single query."""
+        if not names:
+            return []
+        stmt = select(self.model).where(self.model.name.in_(names), self.model.workspace_id == workspace_id)
+        result = await session.scalars(stmt)
+        return result.all()
+
+    async def insert_missing(
+        self,
+        session: AsyncSession,
+        objs: Sequence[TaskTagCreate],
+        workspace_id: UUID,
+    ) -> Sequence[TaskTag]:
+        """Insert tags in one statement, skipping names that already exist.
+
+        Uses INSERT ... ON CONFLICT (name) DO NOTHING RETURNING, so only the rows actually
+        inserted by this call are returned; names created concurrently by another transaction
+        are silently skipped and must be re-read by the caller.
+        """
+        if not objs:
+            return []
+        stmt = (
+            upsert_insert(session, self.model)
+            .on_conflict_do_nothing(index_elements=[self.model.name])
+            .returning(self.model)
+        )
+        result = await session.scalars(stmt, [{**obj.model_dump(), "workspace_id": workspace_id} for obj in objs])
+        return result.all()
@@ -6,6 +6,7 @@ from app.platform.workspaces.repos import WorkspaceRepository
 from app.tasks.task_tags.models import TaskTag
 from app.tasks.task_tags.repos import TaskTagRepository
 from app.tasks.task_tags.schemas import TaskTagCreate, TaskTagUpdate
+from app_base.base.exceptions.basic import BadRequestException, NotFoundException
 from app_base.base.repos.base import BaseRepository
 from app_base.base.services.base import (
     BaseCreateServiceMixin,
@@ -74,20 +75,36 @@ class TaskTagService(
     async def get_or_create_tags(
         self, session: AsyncSession, tag_names: list[str], context: TaskTagContextKwargs | None
     ) -> list[TaskTag]:
-        """Get existing tags or create new ones from a list of names."""
-        tags = []
-        for name in tag_names:
-            normalized_name = name.strip()
-            if not normalized_name:
-                continue
-
-            if context is None:
-                raise ValueError("Context is required for get_or_create_tags")
-
-            tag = await self.repo.get_by_name(session, normalized_name, context["parent_id"])
-            if not tag:
-                # Create new tag
-                tag_create = TaskTagCreate(name=normalized_name)
-                tag = await self.create(session, tag_create, context)
-            tags.append(tag)
-        return tags
+        """Get existing tags or create new ones from a list of names.
+
+        Set-based: one SELECT for the known names and one INSERT ... ON CONFLICT DO NOTHING for
+        the rest. Tags are returned once per distinct name, in input order.
+        """
+        names = list(dict.fromkeys(name.strip() for name in tag_names if name.strip()))
+        if not names:
+            return []
+        if context is None:
+            raise ValueError("Context is required for get_or_create_tags")
+
+        workspace_id = context["parent_id"]
+        tags_by_name = {tag.name: tag for tag in await self.repo.get_by_names(session, names, workspace_id)}
+        missing = [name for name in names if name not in tags_by_name]
+        if missing:
+            workspace = await self.parent_repo.get(session, where=[self.parent_repo.model.id == workspace_id])
+            if workspace is None:
+                raise NotFoundException()
+
+            objs = [TaskTagCreate(name=name) for name in missing]
+            for tag in await self.repo.insert_missing(session, objs, workspace_id):
+                tags_by_name[tag.name] = tag
+
+            # Names skipped by ON CONFLICT were committed by a concurrent request in the meantime
+            leftover = [name for name in missing if name not in tags_by_name]
+            if leftover:
+                for tag in await self.repo.get_by_names(session, leftover, workspace_id):
+                    tags_by_name[tag.name] = tag
+                conflicting = [name for name in leftover if name not in tags_by_name]
+                if conflicting:
+                    raise BadRequestException(f"TaskTag names already used by another workspace: {conflicting}")
+
+        return [tags_by_name[name] for name in names]
@@ -1,21 +1,48 @@
 from typing import Annotated
 from uuid import UUID
 
-from app.tasks.tasks.filters import TaskFilterDepend
-from app.tasks.tasks.schemas import TaskCreate, TaskRead, TaskUpdate
+from app.common.events import sse_response
+from app.common.export import ndjson_response
+from app.common.pagination import CursorPage, CursorParam
+from app.tasks.tasks.enum import TaskQueue
+from app.tasks.tasks.filters import TaskFilterDepend, TaskOrderParam, TaskSearchParam
+from app.tasks.tasks.schemas import (
+    TaskBatchCreate,
+    TaskCreate,
+    TaskDependencyCreate,
+    TaskHeartbeat,
+    TaskRead,
+    TaskTreeNode,
+    TaskUpdate,
+)
 from app.tasks.tasks.services import TaskContextKwargs
+from app.tasks.tasks.usecases.batch import CreateBatchTaskUseCase
+from app.tasks.tasks.usecases.claim import ClaimTaskUseCase
 from app.tasks.tasks.usecases.crud import (
     CreateTaskUseCase,
     DeleteTaskUseCase,
+    ExportTaskUseCase,
+    GetMultiTaskByCursorUseCase,
     GetMultiTaskUseCase,
     GetTaskUseCase,
     UpdateTaskUseCase,
 )
+from app.tasks.tasks.usecases.dependencies import (
+    AddTaskDependenciesUseCase,
+    GetTaskDependenciesUseCase,
+    RemoveTaskDependencyUseCase,
+)
+from app.tasks.tasks.usecases.events import StreamTaskEventsUseCase
+from app.tasks.tasks.usecases.lease import HeartbeatTaskUseCase
+from app.tasks.tasks.usecases.schedule import GetMultiTaskByScheduleUseCase
+from app.tasks.tasks.usecases.search import SearchTaskUseCase
+from app.tasks.tasks.usecases.tree import GetTaskTreeUseCase
 from app_base.base.deps.params.page import PaginationParam
-from app_base.base.exceptions.basic import NotFoundException
+from app_base.base.exceptions.basic import BadRequestException, NotFoundException
 from app_base.base.schemas.delete_resp import DeleteResponse
 from app_base.base.schemas.paginated import PaginatedList
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
 router = APIRouter(prefix="/workspaces/{workspace_id}/tasks", tags=["Task"], dependencies=[])
 
@@ -30,17 +57,75 @@ async def create_task(
     return await use_case.execute(task_in, context)
 
 
-@router.get("", response_model=PaginatedList[TaskRead])
+@router.post(":batch", status_code=status.HTTP_201_CREATED, response_model=list[TaskRead])
+async def create_tasks_batch(
+    workspace_id: UUID,
+    use_case: Annotated[CreateBatchTaskUseCase, Depends()],
+    tasks_in: TaskBatchCreate,
+):
+    context: TaskContextKwargs = {"parent_id": workspace_id}
+    return await use_case.execute(tasks_in, context)
+
+
+@router.post("/claim", response_model=list[TaskRead])
+async def claim_tasks(
+    workspace_id: UUID,
+    use_case: Annotated[ClaimTaskUseCase, Depends()],
+    worker_id: Annotated[str, Query(max_length=100, description="Worker that will hold the lease")],
+    queue: Annotated[TaskQueue, Query(description="Queue to claim pending tasks from")] = TaskQueue.DEFAULT,
+    limit: Annotated[int, Query(ge=1, le=100, description="Maximum number of tasks to claim")] = 1,
+    lease_seconds: Annotated[int | None, Query(ge=1, le=86400, description="Lease duration in seconds")] = None,
+):
+    context: TaskContextKwargs = {"parent_id": workspace_id}
+    return await use_case.execute(queue, limit, worker_id, lease_seconds, context=context)
+
+
+@router.get("", response_model=PaginatedList[TaskRead] | CursorPage[TaskRead])
 async def get_tasks(
     workspace_id: UUID,
     use_case: Annotated[GetMultiTaskUseCase, Depends()],
+    cursor_use_case: Annotated[GetMultiTaskByCursorUseCase, Depends()],
+    schedule_use_case: Annotated[GetMultiTaskByScheduleUseCase, Depends()],
+    search_use_case: Annotated[SearchTaskUseCase, Depends()],
     pagination: PaginationParam,
     filters: TaskFilterDepend,
+    cursor: CursorParam = None,
+    order: TaskOrderParam = "default",
+    search: TaskSearchParam = None,
 ):
     context: TaskContextKwargs = {"parent_id": workspace_id}
+    if search is not None:
+        if cursor is not None:
+            raise BadRequestException("Cursor pagination is not available with search")
+        return await search_use_case.execute(search, **pagination, context=context, where=filters)
+    if order == "schedule":
+        if cursor is not None:
+            raise BadRequestException("Cursor pagination is not available in schedule order")
+        return await schedule_use_case.execute(**pagination, context=context, where=filters)
+    if cursor is not None:
+        return await cursor_use_case.execute(pagination["limit"], cursor, context=context, where=filters)
     return await use_case.execute(**pagination, context=context, where=filters)
 
 
+@router.get("/events", response_class=StreamingResponse)
+async def stream_task_events(
+    workspace_id: UUID,
+    use_case: Annotated[StreamTaskEventsUseCase, Depends()],
+):
+    context: TaskContextKwargs = {"parent_id": workspace_id}
+    return sse_response(await use_case.execute(context=context))
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_tasks(
+    workspace_id: UUID,
+    use_case: Annotated[ExportTaskUseCase, Depends()],
+    filters: TaskFilterDepend,
+):
+    context: TaskContextKwargs = {"parent_id": workspace_id}
+    return ndjson_response(await use_case.execute(context=context, where=filters))
+
+
 @router.get("/{task_id}", response_model=TaskRead)
 async def get_task(
     workspace_id: UUID,
@@ -54,6 +139,52 @@ async def get_task(
     return task
 
 
+@router.get("/{task_id}/tree", response_model=TaskTreeNode)
+async def get_task_tree(
+    workspace_id: UUID,
+    use_case: Annotated[GetTaskTreeUseCase, Depends()],
+    task_id: UUID,
+    max_depth: Annotated[int, Query(ge=0, le=20, description="Levels of subtasks to return")] = 10,
+):
+    context: TaskContextKwargs = {"parent_id": workspace_id}
+    tree = await use_case.execute(task_id, max_depth, context=context)
+    if not tree:
+        raise NotFoundException()
+    return tree
+
+
+@router.get("/{task_id}/dependencies", response_model=list[TaskRead])
+async def get_task_dependencies(
+    workspace_id: UUID,
+    use_case: Annotated[GetTaskDependenciesUseCase, Depends()],
+    task_id: UUID,
+):
+    context: TaskContextKwargs = {"parent_id": workspace_id}
+    return await use_case.execute(task_id, context=context)
+
+
+@router.post("/{task_id}/dependencies", response_model=TaskRead)
+async def add_task_dependencies(
+    workspace_id: UUID,
+    use_case: Annotated[AddTaskDependenciesUseCase, Depends()],
+    task_id: UUID,
+    dependency_in: TaskDependencyCreate,
+):
+    context: TaskContextKwargs = {"parent_id": workspace_id}
+    return await use_case.execute(task_id, dependency_in, context=context)
+
+
+@router.delete("/{task_id}/dependencies/{depends_on_task_id}", response_model=TaskRead)
+async def remove_task_dependency(
+    workspace_id: UUID,
+    use_case: Annotated[RemoveTaskDependencyUseCase, Depends()],
+    task_id: UUID,
+    depends_on_task_id: UUID,
+):
+    context: TaskContextKwargs = {"parent_id": workspace_id}
+    return await use_case.execute(task_id, depends_on_task_id, context=context)
+
+
 @router.put("/{task_id}", response_model=TaskRead)
 async def update_task(
     workspace_id: UUID,
@@ -68,6 +199,20 @@ async def update_task(
     return task
 
 
+@router.post("/{task_id}/heartbeat", response_model=TaskRead)
+async def heartbeat_task(
+    workspace_id: UUID,
+    use_case: Annotated[HeartbeatTaskUseCase, Depends()],
+    task_id: UUID,
+    heartbeat_in: TaskHeartbeat,
+):
+    context: TaskContextKwargs = {"parent_id": workspace_id}
+    task = await use_case.execute(task_id, heartbeat_in, context=context)
+    if not task:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Task lease is not held by this worker")
+    return task
+
+
 @router.delete("/{task_id}", response_model=DeleteResponse)
 async def delete_task(
     workspace_id: UUID,
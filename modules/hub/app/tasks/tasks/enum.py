@@ -54,3 +54,16 @@ class TaskSource(str, enum.Enum):
     GATEWAY = "gateway"
     WORKFLOW = "workflow"
     SYSTEM = "system"
+
+
+class TaskEventType(str, enum.Enum):
+    """Event types pushed on the workspace task event stream."""
+
+    CREATED = "task.created"
+    UPDATED = "task.updated"
+    DELETED = "task.deleted"
+    BATCH_CREATED = "task.batch_created"
+    CLAIMED = "task.claimed"
+    LEASE_EXPIRED = "task.lease_expired"
+    UNBLOCKED = "task.unblocked"
+    HISTORY_CREATED = "task_history.created"
@@ -0,0 +1,32 @@
+"""Task change events for the workspace event stream (see app.common.events)."""
+
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+from app.common.events import publish_event
+from app.tasks.tasks.enum import TaskEventType
+from app.tasks.tasks.models import Task
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# NOTIFY payloads are capped at 8000 bytes and a UUID takes 39 bytes of JSON: 100 ids leave ample room
+TASK_IDS_PER_EVENT = 100
+
+
+async def publish_task_event(session: AsyncSession, event_type: TaskEventType, workspace_id: UUID, **data: Any) -> None:
+    await publish_event(session, str(workspace_id), event_type.value, {"workspace_id": workspace_id, **data})
+
+
+async def publish_task_ids_event(
+    session: AsyncSession, event_type: TaskEventType, workspace_id: UUID, task_ids: Sequence[UUID], **data: Any
+) -> None:
+    """Publish an event about any number of tasks, split into events of at most TASK_IDS_PER_EVENT ids."""
+    for start in range(0, len(task_ids), TASK_IDS_PER_EVENT):
+        await publish_task_event(
+            session, event_type, workspace_id, task_ids=task_ids[start : start + TASK_IDS_PER_EVENT], **data
+        )
+
+
+def task_event_data(task: Task) -> dict[str, Any]:
+    """Small snapshot of a task; subscribers fetch the full resource when they need it."""
+    return {"task_id": task.id, "status": task.status, "queue": task.queue}
@@ -1,10 +1,13 @@
-from typing import Annotated
+from typing import Annotated, Literal
 
+from app.common.pagination import normalize_where
+from app.tasks.task_tags.models import TaskTag, task_tag_associations
 from app.tasks.tasks.enum import TaskComplexity, TaskPriority, TaskStatus, TaskUrgency
 from app.tasks.tasks.models import Task
 from app_base.base.deps.filters.combine import create_combined_filter_dependency
 from app_base.base.deps.filters.prebuilt.filter_string import EnumFilter, StringILikeFilter
-from fastapi import Depends
+from fastapi import Depends, Query
+from sqlalchemy import Select, exists, func, select
 
 filter_title = StringILikeFilter(Task, "title")
 filter_status = EnumFilter(Task, "status", enum_type=TaskStatus)
@@ -12,11 +15,63 @@ filter_priority = EnumFilter(Task, "priority", enum_type=TaskPriority)
 filter_urgency = EnumFilter(Task, "urgency", enum_type=TaskUrgency)
 filter_complexity = EnumFilter(Task, "complexity", enum_type=TaskComplexity)
 
-TaskFilterDepend = Annotated[
-    ...,
-    Depends(
-        create_combined_filter_dependency(
-            filter_title, filter_status, filter_priority, filter_urgency, filter_complexity
+filter_columns = create_combined_filter_dependency(
+    filter_title, filter_status, filter_priority, filter_urgency, filter_complexity
+)
+
+
+def _tagged_with(names: list[str]) -> Select:
+    """Associations of the tags named `names`; tag lookups go through the (tag_id, task_id) index."""
+    return (
+        select(task_tag_associations.c.task_id)
+        .join(TaskTag, TaskTag.id == task_tag_associations.c.tag_id)
+        .where(TaskTag.name.in_(names))
+    )
+
+
+def filter_tags(
+    filter_tags_any: Annotated[
+        list[str] | None, Query(description="Only tasks with at least one of these tags")
+    ] = None,
+    filter_tags_all: Annotated[list[str] | None, Query(description="Only tasks with every one of these tags")] = None,
+    filter_tags_none: Annotated[list[str] | None, Query(description="Only tasks with none of these tags")] = None,
+) -> list:
+    """Tag conditions as semi-joins on `task_tag_associations`; tags are never loaded to filter."""
+    where = []
+    if filter_tags_any:
+        where.append(exists(_tagged_with(filter_tags_any).where(task_tag_associations.c.task_id == Task.id)))
+    if filter_tags_all:
+        names = set(filter_tags_all)
+        tagged_with_all = (
+            _tagged_with(list(names))
+            .group_by(task_tag_associations.c.task_id)
+            .having(func.count(TaskTag.name.distinct()) == len(names))
         )
+        where.append(Task.id.in_(tagged_with_all))
+    if filter_tags_none:
+        where.append(~exists(_tagged_with(filter_tags_none).where(task_tag_associations.c.task_id == Task.id)))
+    return where
+
+
+def filter_tasks(
+    columns: Annotated[list, Depends(filter_columns)],
+    tags: Annotated[list, Depends(filter_tags)],
+) -> list:
+    return [*normalize_where(columns), *tags]
+
+
+TaskFilterDepend = Annotated[list, Depends(filter_tasks)]
+
+TaskOrderParam = Annotated[
+    Literal["default", "schedule"],
+    Query(description="`schedule`: most important work first (priority, urgency, due date and waiting time)"),
+]
+TaskSearchParam = Annotated[
+    str | None,
+    Query(
+        min_length=1,
+        max_length=200,
+        description="Full-text search in title, description and result summary (fuzzy on title); "
+        "results are ranked best match first, whatever `order` is",
     ),
 ]
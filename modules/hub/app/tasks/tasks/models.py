@@ -1,6 +1,7 @@
 """Task Model for Hub Module.
 
 Task: Task item managed by Host Agent or User.
+TaskDependency: "Blocked by" edges between tasks.
 DB Schema Reference: docs/specification/DB_SCHEMA.md#1.1
 """
 
@@ -9,8 +10,11 @@ from typing import TYPE_CHECKING
 from uuid import UUID
 
 from app.tasks.tasks.enum import TaskComplexity, TaskPriority, TaskQueue, TaskSource, TaskStatus, TaskUrgency
+from app.tasks.tasks.scheduling import default_schedule_at
+from app.tasks.tasks.search import POSTGRESQL_DDL, SQLITE_DDL, SQLITE_DROP_DDL
 from app_base.base.models.mixin import Base, TimestampMixin, UUIDMixin
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import DDL, Column, DateTime, ForeignKey, Index, Integer, String, Table, Text, event
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 if TYPE_CHECKING:
@@ -18,6 +22,16 @@ if TYPE_CHECKING:
     from app.tasks.task_histories.models import TaskHistory
     from app.tasks.task_tags.models import TaskTag
 
+# "Blocked by" edges: `task_id` is ready only once `depends_on_task_id` is done
+task_dependencies = Table(
+    "task_dependencies",
+    Base.metadata,
+    Column("task_id", PG_UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True),
+    Column("depends_on_task_id", PG_UUID(as_uuid=True), ForeignKey("tasks.id", ondelete="CASCADE"), primary_key=True),
+    # The primary key serves task -> predecessors; this one serves predecessor -> dependents on completion
+    Index("ix_task_dependencies_depends_on_task_id_task_id", "depends_on_task_id", "task_id"),
+)
+
 
 class Task(Base, UUIDMixin, TimestampMixin):
     """Task entity for Host Agent's persistent memory."""
@@ -43,13 +57,24 @@ class Task(Base, UUIDMixin, TimestampMixin):
     source: Mapped[str] = mapped_column(String(50), nullable=False, default=TaskSource.USER.value)
     external_ref: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
+    # Dependencies: predecessors not done yet, maintained on writes so ready tasks are found by index
+    unresolved_dependency_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
     # Timeline
     due_date: Mapped[datetime.datetime | None] = mapped_column(nullable=True)
     completed_at: Mapped[datetime.datetime | None] = mapped_column(nullable=True)
+    # Scheduling order (see app.tasks.tasks.scheduling); recomputed when priority, urgency or due date change
+    schedule_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=default_schedule_at
+    )
 
     # Result
     result_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
 
+    # Lease (held by the worker that claimed the task while it is in_progress)
+    lease_owner: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    lease_expires_at: Mapped[datetime.datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
     # Relationships
     workspace: Mapped["Workspace"] = relationship("Workspace")
     parent_task: Mapped["Task | None"] = relationship("Task", remote_side="Task.id", back_populates="subtasks")
@@ -61,6 +86,45 @@ class Task(Base, UUIDMixin, TimestampMixin):
         lazy="selectin",
         order_by="TaskTag.created_at",
     )
+    # History is append-only and outlives the task: no cascade, and no FK for a delete to trip over
     histories: Mapped[list["TaskHistory"]] = relationship(
-        "TaskHistory", back_populates="task", cascade="all, delete-orphan"
+        "TaskHistory",
+        primaryjoin="Task.id == foreign(TaskHistory.task_id)",
+        back_populates="task",
+        viewonly=True,
     )
+
+    __table_args__ = (
+        # List / claim access paths within a workspace
+        Index("ix_tasks_workspace_id_status_queue_created_at", "workspace_id", "status", "queue", "created_at"),
+        Index("ix_tasks_workspace_id_created_at", "workspace_id", "created_at", "id"),
+        Index("ix_tasks_parent_task_id", "parent_task_id"),
+        Index("ix_tasks_workspace_id_schedule_at", "workspace_id", "schedule_at", "id"),
+        # Partial index: the claim path reads the top ready tasks (pending, no unresolved predecessor)
+        # in scheduling order straight from it
+        Index(
+            "ix_tasks_ready_workspace_id_queue_schedule_at",
+            "workspace_id",
+            "queue",
+            "schedule_at",
+            "id",
+            postgresql_where=(status == TaskStatus.PENDING.value) & (unresolved_dependency_count == 0),
+            sqlite_where=(status == TaskStatus.PENDING.value) & (unresolved_dependency_count == 0),
+        ),
+        # Partial index: the lease reaper only scans in_progress tasks by deadline
+        Index(
+            "ix_tasks_in_progress_lease_expires_at",
+            "lease_expires_at",
+            postgresql_where=status == TaskStatus.IN_PROGRESS.value,
+            sqlite_where=status == TaskStatus.IN_PROGRESS.value,
+        ),
+    )
+
+
+# Full-text search structures that are not mapped (see app.tasks.tasks.search)
+for _statement in POSTGRESQL_DDL:
+    event.listen(Task.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in SQLITE_DDL:
+    event.listen(Task.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+for _statement in SQLITE_DROP_DDL:
+    event.listen(Task.__table__, "after_drop", DDL(_statement).execute_if(dialect="sqlite"))
@@ -1,11 +1,313 @@
 """Task Repository for Hub Module."""
 
-from app.tasks.tasks.models import Task
+import datetime
+import uuid
+from collections.abc import Collection, Sequence
+from uuid import UUID
+
+from app.common.database import dialect_name, upsert_insert
+from app.common.export import ExportRepositoryMixin
+from app.common.pagination import CursorPaginationRepositoryMixin, normalize_where
+from app.tasks.task_tags.models import TaskTag, task_tag_associations
+from app.tasks.tasks.enum import TaskQueue, TaskStatus
+from app.tasks.tasks.models import Task, task_dependencies
 from app.tasks.tasks.schemas import TaskDbCreate, TaskDbUpdate
+from app.tasks.tasks.search import search_statement
 from app_base.base.repos.base import BaseRepository
+from sqlalchemy import Integer, delete, exists, func, insert, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
-class TaskRepository(BaseRepository[Task, TaskDbCreate, TaskDbUpdate]):
+class TaskRepository(
+    BaseRepository[Task, TaskDbCreate, TaskDbUpdate], CursorPaginationRepositoryMixin, ExportRepositoryMixin
+):
     """Repository for Task CRUD operations."""
 
     model = Task
+
+    async def bulk_create(
+        self,
+        session: AsyncSession,
+        workspace_id: UUID,
+        objs: Sequence[TaskDbCreate],
+        tag_ids: Sequence[Sequence[UUID]],
+    ) -> list[UUID]:
+        """Insert many tasks and their tag associations with multi-row INSERTs.
+
+        `tag_ids[i]` holds the tag ids of `objs[i]`. Returns the new task ids in input order.
+        """
+        ids = [uuid.uuid4() for _ in objs]
+        await session.execute(
+            insert(self.model),
+            [
+                {**obj.model_dump(), "id": obj_id, "workspace_id": workspace_id}
+                for obj_id, obj in zip(ids, objs, strict=True)
+            ],
+        )
+        associations = [
+            {"task_id": obj_id, "tag_id": tag_id}
+            for obj_id, obj_tag_ids in zip(ids, tag_ids, strict=True)
+            for tag_id in obj_tag_ids
+        ]
+        if associations:
+            await session.execute(insert(task_tag_associations), associations)
+        return ids
+
+    async def get_by_ids(self, session: AsyncSession, ids: Sequence[UUID]) -> list[Task]:
+        """Get tasks by id, preserving the order of `ids`."""
+        if not ids:
+            return []
+        result = await session.scalars(select(self.model).where(self.model.id.in_(ids)))
+        tasks_by_id = {task.id: task for task in result.all()}
+        return [tasks_by_id[obj_id] for obj_id in ids if obj_id in tasks_by_id]
+
+    async def get_field_values(
+        self, session: AsyncSession, obj_id: UUID, fields: Sequence[str], workspace_id: UUID, for_update: bool = False
+    ) -> dict[str, str] | None:
+        """Read a few columns of one task without loading the entity.
+
+        `for_update` locks the row until the transaction ends, for callers deriving a change from these values.
+        """
+        stmt = select(*(getattr(self.model, field) for field in fields)).where(
+            self.model.id == obj_id, self.model.workspace_id == workspace_id
+        )
+        if for_update:
+            stmt = stmt.with_for_update()
+        row = (await session.execute(stmt)).mappings().one_or_none()
+        return {str(key): value for key, value in row.items()} if row is not None else None
+
+    async def get_tag_names_by_task_ids(self, session: AsyncSession, ids: Sequence[UUID]) -> dict[UUID, list[str]]:
+        """Map task ids to their tag names with a single query."""
+        if not ids:
+            return {}
+        stmt = (
+            select(task_tag_associations.c.task_id, TaskTag.name)
+            .join(TaskTag, TaskTag.id == task_tag_associations.c.tag_id)
+            .where(task_tag_associations.c.task_id.in_(ids))
+            .order_by(TaskTag.created_at)
+        )
+        tag_names: dict[UUID, list[str]] = {}
+        for task_id, name in await session.execute(stmt):
+            tag_names.setdefault(task_id, []).append(name)
+        return tag_names
+
+    async def get_subtree(
+        self, session: AsyncSession, workspace_id: UUID, root_id: UUID, max_depth: int
+    ) -> list[tuple[Task, int]]:
+        """Load a task and its descendants down to `max_depth` levels with one recursive CTE.
+
+        Returns (task, depth) pairs, root first; the depth bound also stops the walk on a parent cycle.
+        """
+        tree = (
+            select(self.model.id, literal(0, Integer).label("depth"))
+            .where(self.model.id == root_id, self.model.workspace_id == workspace_id)
+            .cte("task_tree", recursive=True)
+        )
+        tree = tree.union_all(
+            select(self.model.id, (tree.c.depth + 1).label("depth"))
+            .join(tree, self.model.parent_task_id == tree.c.id)
+            .where(tree.c.depth < max_depth)
+        )
+        stmt = (
+            select(self.model, tree.c.depth)
+            .join(tree, self.model.id == tree.c.id)
+            .order_by(tree.c.depth, self.model.created_at, self.model.id)
+        )
+        return [(task, depth) for task, depth in await session.execute(stmt)]
+
+    async def get_multi_by_schedule(
+        self, session: AsyncSession, offset: int, limit: int | None, where: Sequence | None = None
+    ) -> list[Task]:
+        """Tasks in scheduling order, most important first."""
+        stmt = (
+            select(self.model)
+            .where(*normalize_where(where))
+            .order_by(self.model.schedule_at, self.model.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        return list((await session.scalars(stmt)).all())
+
+    async def search(
+        self, session: AsyncSession, term: str, offset: int, limit: int | None, where: Sequence | None = None
+    ) -> list[Task]:
+        """Tasks matching `term` in title, description or result summary, best match first."""
+        stmt = (
+            search_statement(self.model, term, dialect_name(session))
+            .where(*normalize_where(where))
+            .offset(offset)
+            .limit(limit)
+        )
+        return list((await session.scalars(stmt)).all())
+
+    async def get_existing_ids(
+        self, session: AsyncSession, workspace_id: UUID, ids: Collection[UUID], for_update: bool = False
+    ) -> set[UUID]:
+        """The subset of `ids` that are tasks of the workspace; `for_update` locks them in id order."""
+        if not ids:
+            return set()
+        stmt = select(self.model.id).where(self.model.id.in_(ids), self.model.workspace_id == workspace_id)
+        if for_update:
+            stmt = stmt.order_by(self.model.id).with_for_update()
+        return set((await session.scalars(stmt)).all())
+
+    async def get_dependencies(self, session: AsyncSession, task_id: UUID) -> list[Task]:
+        """The tasks `task_id` is blocked by, oldest first."""
+        stmt = (
+            select(self.model)
+            .join(task_dependencies, task_dependencies.c.depends_on_task_id == self.model.id)
+            .where(task_dependencies.c.task_id == task_id)
+            .order_by(self.model.created_at, self.model.id)
+        )
+        return list((await session.scalars(stmt)).all())
+
+    async def add_dependencies(self, session: AsyncSession, edges: Sequence[tuple[UUID, UUID]]) -> None:
+        """Insert (task id, predecessor id) edges, skipping existing ones, and refresh the tasks' counts."""
+        if not edges:
+            return
+        stmt = upsert_insert(session, task_dependencies).on_conflict_do_nothing()
+        await session.execute(stmt, [{"task_id": task_id, "depends_on_task_id": dep_id} for task_id, dep_id in edges])
+        await self.refresh_dependency_counts(session, {task_id for task_id, _ in edges})
+
+    async def remove_dependency(self, session: AsyncSession, task_id: UUID, depends_on_task_id: UUID) -> bool:
+        """Delete one edge and refresh the task's count; returns whether the edge existed."""
+        stmt = delete(task_dependencies).where(
+            task_dependencies.c.task_id == task_id, task_dependencies.c.depends_on_task_id == depends_on_task_id
+        )
+        result = await session.execute(stmt)
+        await self.refresh_dependency_counts(session, [task_id])
+        return result.rowcount > 0
+
+    async def has_dependency_cycle(self, session: AsyncSession, task_id: UUID) -> bool:
+        """Whether `task_id` is, transitively, blocked by itself; one recursive CTE over the edges."""
+        reachable = (
+            select(task_dependencies.c.depends_on_task_id.label("id"))
+            .where(task_dependencies.c.task_id == task_id)
+            .cte("reachable", recursive=True)
+        )
+        # UNION (not UNION ALL) stops the walk on the cycle it is looking for
+        reachable = reachable.union(
+            select(task_dependencies.c.depends_on_task_id).join(
+                reachable, task_dependencies.c.task_id == reachable.c.id
+            )
+        )
+        return bool(await session.scalar(select(exists().where(reachable.c.id == task_id))))
+
+    async def refresh_dependency_counts(self, session: AsyncSession, task_ids: Collection[UUID]) -> None:
+        """Recount the predecessors not done yet of `task_ids` from the edges."""
+        predecessor = self.model.__table__.alias("predecessor")
+        unresolved = (
+            select(func.count())
+            .select_from(task_dependencies)
+            .join(predecessor, predecessor.c.id == task_dependencies.c.depends_on_task_id)
+            .where(
+                task_dependencies.c.task_id == self.model.id,
+                predecessor.c.status != TaskStatus.DONE.value,
+            )
+            .scalar_subquery()
+        )
+        stmt = update(self.model).where(self.model.id.in_(task_ids)).values(unresolved_dependency_count=unresolved)
+        await session.execute(stmt, execution_options={"synchronize_session": False})
+
+    async def shift_dependent_counts(self, session: AsyncSession, task_id: UUID, delta: int) -> list[UUID]:
+        """Add `delta` to the counts of every task blocked by `task_id` in one UPDATE.
+
+        Returns the dependents left with no unresolved predecessor.
+        """
+        dependents = select(task_dependencies.c.task_id).where(task_dependencies.c.depends_on_task_id == task_id)
+        stmt = (
+            update(self.model)
+            .where(self.model.id.in_(dependents))
+            .values(unresolved_dependency_count=self.model.unresolved_dependency_count + delta)
+            .returning(self.model.id, self.model.unresolved_dependency_count)
+        )
+        result = await session.execute(stmt, execution_options={"synchronize_session": False})
+        return [row.id for row in result if row.unresolved_dependency_count == 0]
+
+    async def claim_pending(
+        self,
+        session: AsyncSession,
+        workspace_id: UUID,
+        queue: TaskQueue,
+        limit: int,
+        lease_owner: str,
+        lease_expires_at: datetime.datetime,
+    ) -> Sequence[Task]:
+        """Atomically move up to `limit` ready tasks of a queue to in_progress under a lease.
+
+        Ready means pending with no unresolved predecessor; the most important ready tasks (lowest
+        `schedule_at`) are read from the top of the partial ready index. Candidate rows are locked with
+        FOR UPDATE SKIP LOCKED, so concurrent workers never receive the same task and never wait on each
+        other's locks.
+        """
+        candidates = (
+            select(self.model.id)
+            .where(
+                self.model.workspace_id == workspace_id,
+                self.model.queue == queue.value,
+                # Literals, not bind parameters, so PostgreSQL matches the partial ready index in generic plans too
+                self.model.status == literal(TaskStatus.PENDING.value, literal_execute=True),
+                self.model.unresolved_dependency_count == literal(0, literal_execute=True),
+            )
+            .order_by(self.model.schedule_at, self.model.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(self.model)
+            .where(self.model.id.in_(candidates))
+            .values(
+                status=TaskStatus.IN_PROGRESS.value,
+                lease_owner=lease_owner,
+                lease_expires_at=lease_expires_at,
+            )
+            .returning(self.model)
+        )
+        result = await session.scalars(
+            stmt, execution_options={"synchronize_session": False, "populate_existing": True}
+        )
+        return result.all()
+
+    async def extend_lease(
+        self,
+        session: AsyncSession,
+        workspace_id: UUID,
+        task_id: UUID,
+        lease_owner: str,
+        lease_expires_at: datetime.datetime,
+    ) -> Task | None:
+        """Push the lease deadline of an in_progress task still held by `lease_owner`."""
+        stmt = (
+            update(self.model)
+            .where(
+                self.model.id == task_id,
+                self.model.workspace_id == workspace_id,
+                self.model.status == TaskStatus.IN_PROGRESS.value,
+                self.model.lease_owner == lease_owner,
+            )
+            .values(lease_expires_at=lease_expires_at)
+            .returning(self.model)
+        )
+        result = await session.scalars(
+            stmt, execution_options={"synchronize_session": False, "populate_existing": True}
+        )
+        return result.one_or_none()
+
+    async def release_expired_leases(
+        self, session: AsyncSession, now: datetime.datetime
+    ) -> Sequence[tuple[UUID, UUID]]:
+        """Return every in_progress task whose lease expired before `now` to pending.
+
+        Runs as a single UPDATE served by the partial lease index; returns (task id, workspace id) of released tasks.
+        """
+        stmt = (
+            update(self.model)
+            .where(
+                self.model.status == TaskStatus.IN_PROGRESS.value,
+                self.model.lease_expires_at < now,
+            )
+            .values(status=TaskStatus.PENDING.value, lease_owner=None, lease_expires_at=None)
+            .returning(self.model.id, self.model.workspace_id)
+        )
+        result = await session.execute(stmt, execution_options={"synchronize_session": False})
+        return [(row.id, row.workspace_id) for row in result]
@@ -0,0 +1,59 @@
+"""Scheduling order of tasks.
+
+Each task gets a virtual deadline, `schedule_at`: the time it was enqueued minus a head start for its
+priority and urgency, pulled earlier when its due date is close. Work is taken in ascending
+`schedule_at`. Because the value does not depend on the current time it can be stored and indexed,
+and aging comes for free: every hour a task waits counts as much as an hour of head start, so
+low-priority work is overtaken only by work that is more important by more than the time it has
+already waited.
+"""
+
+import datetime
+
+from app.tasks.tasks.enum import TaskPriority, TaskUrgency
+
+_HOUR = datetime.timedelta(hours=1)
+
+PRIORITY_HEAD_START: dict[str, datetime.timedelta] = {
+    TaskPriority.LOW.value: 0 * _HOUR,
+    TaskPriority.NORMAL.value: 2 * _HOUR,
+    TaskPriority.HIGH.value: 12 * _HOUR,
+    TaskPriority.CRITICAL.value: 48 * _HOUR,
+}
+URGENCY_HEAD_START: dict[str, datetime.timedelta] = {
+    TaskUrgency.LOW.value: 0 * _HOUR,
+    TaskUrgency.NORMAL.value: 1 * _HOUR,
+    TaskUrgency.HIGH.value: 4 * _HOUR,
+    TaskUrgency.CRITICAL.value: 24 * _HOUR,
+}
+# A task with a due date is scheduled no later than this long before it
+DUE_DATE_LEAD = 24 * _HOUR
+
+
+def _utc(value: datetime.datetime) -> datetime.datetime:
+    return value.astimezone(datetime.UTC) if value.tzinfo else value.replace(tzinfo=datetime.UTC)
+
+
+def schedule_at(
+    enqueued_at: datetime.datetime,
+    priority: str | None,
+    urgency: str | None,
+    due_date: datetime.datetime | None,
+) -> datetime.datetime:
+    """The virtual deadline of a task; missing priority or urgency count as normal."""
+    value = (
+        _utc(enqueued_at)
+        - PRIORITY_HEAD_START[priority or TaskPriority.NORMAL.value]
+        - URGENCY_HEAD_START[urgency or TaskUrgency.NORMAL.value]
+    )
+    if due_date is not None:
+        value = min(value, _utc(due_date) - DUE_DATE_LEAD)
+    return value
+
+
+def default_schedule_at(context) -> datetime.datetime:
+    """Column default: schedule a new row from the current time and the values it is inserted with."""
+    params = context.get_current_parameters()
+    return schedule_at(
+        datetime.datetime.now(datetime.UTC), params.get("priority"), params.get("urgency"), params.get("due_date")
+    )
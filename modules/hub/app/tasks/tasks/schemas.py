@@ -41,6 +41,15 @@ class TaskCreate(TaskDbCreate):
     """Schema for creating a new Task."""
 
     tags: list[str] = Field(default_factory=list, description="List of tag names")
+    blocked_by: list[UUID] = Field(
+        default_factory=list, max_length=100, description="IDs of existing tasks that must be done before this one"
+    )
+
+
+class TaskBatchCreate(BaseModel):
+    """Schema for creating many Tasks in one request."""
+
+    items: list[TaskCreate] = Field(..., min_length=1, max_length=5000, description="Tasks to create")
 
 
 class TaskDbUpdate(BaseModel):
@@ -65,6 +74,9 @@ class TaskUpdate(TaskDbUpdate):
     """Schema for updating an existing Task."""
 
     tags: list[str] | None = Field(default=None, description="List of tag names")
+    changed_by: str = Field(
+        default="user", max_length=100, description="Who made the change; recorded in the task history"
+    )
 
 
 class TaskRead(UUIDSchemaMixin, TimestampSchemaMixin, BaseModel):
@@ -82,13 +94,51 @@ class TaskRead(UUIDSchemaMixin, TimestampSchemaMixin, BaseModel):
     external_ref: str | None = Field(default=None, description="External reference")
     due_date: datetime.datetime | None = Field(default=None, description="Due date")
     completed_at: datetime.datetime | None = Field(default=None, description="Completion time")
+    schedule_at: datetime.datetime = Field(..., description="Virtual deadline; work is taken in ascending order")
     result_summary: str | None = Field(default=None, description="Result summary")
+    lease_owner: str | None = Field(default=None, description="Worker currently holding the task lease")
+    lease_expires_at: datetime.datetime | None = Field(default=None, description="Lease deadline")
+    unresolved_dependency_count: int = Field(
+        default=0, description="Predecessors not done yet; the task can be claimed only at 0"
+    )
     tags: list[TaskTagRead] = Field(default_factory=list, description="Associated tags")
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class TaskHeartbeat(BaseModel):
+    """Schema for extending the lease of a claimed Task."""
+
+    worker_id: str = Field(..., max_length=100, description="Worker that holds the lease")
+    lease_seconds: int | None = Field(
+        default=None, ge=1, le=86400, description="New lease duration (defaults to the server setting)"
+    )
+
+
+class TaskDependencyCreate(BaseModel):
+    """Schema for adding "blocked by" edges to a Task."""
+
+    depends_on_task_ids: list[UUID] = Field(
+        ..., min_length=1, max_length=100, description="IDs of tasks that must be done before this one"
+    )
+
+
 class TaskReadWithRelations(TaskRead):
     """Schema for reading Task with related data."""
 
     subtasks: list[TaskRead] = Field(default_factory=list, description="Subtasks")
+
+
+class TaskTreeNode(TaskRead):
+    """Task in a subtask tree, with the progress of its returned descendants."""
+
+    depth: int = Field(default=0, description="Levels below the requested task")
+    children: list["TaskTreeNode"] = Field(default_factory=list, description="Direct subtasks")
+    truncated: bool = Field(default=False, description="Whether subtasks below the depth limit were left out")
+    descendant_count: int = Field(default=0, description="Number of returned descendants")
+    descendant_status_counts: dict[TaskStatus, int] = Field(
+        default_factory=dict, description="Returned descendants per status"
+    )
+    percent_done: float = Field(
+        default=0.0, description="Percentage of non-cancelled descendants that are done (own status for leaves)"
+    )
@@ -0,0 +1,90 @@
+"""Full-text search over task title, description and result summary.
+
+- PostgreSQL: a stored generated `tasks.search_vector` (tsvector, title > description > result summary
+  weights) under a GIN index, matched with `websearch_to_tsquery`; a pg_trgm GIN index on `title`
+  adds fuzzy title matches. Results are ranked by `ts_rank_cd` plus title similarity.
+- SQLite (local deployments): an FTS5 table kept in sync by triggers, ranked by bm25. Its rows are
+  keyed by rowid, so the triggers find a task's row by key instead of scanning the index.
+
+Neither structure is mapped on the model: the DDL below runs after `tasks` is created (tests and
+`create_all`) and the migration issues the same statements.
+"""
+
+from typing import Any
+
+from sqlalchemy import Column, Integer, MetaData, Select, String, Table, Uuid, false, func, literal_column, select
+
+# 'simple': no stemming or stop words, so mixed-language content is indexed as written
+SEARCH_CONFIG = "simple"
+
+POSTGRESQL_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(result_summary, '')), 'C')) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_tasks_search_vector ON tasks USING gin (search_vector)",
+    "CREATE INDEX IF NOT EXISTS ix_tasks_title_trgm ON tasks USING gin (title gin_trgm_ops)",
+]
+
+# The implicit rowid of tasks may be renumbered by VACUUM, so `tasks_fts_rowids` gives each task a
+# stable integer key (INTEGER PRIMARY KEY survives VACUUM) that the FTS5 rows use as their rowid.
+_FTS_ROWID = "(SELECT rowid FROM tasks_fts_rowids WHERE task_id = {}.id)"
+SQLITE_DDL = [
+    "CREATE TABLE IF NOT EXISTS tasks_fts_rowids (rowid INTEGER PRIMARY KEY, task_id CHAR(32) NOT NULL UNIQUE)",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(title, description, result_summary)",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts_rowids (task_id) VALUES (new.id); "
+    "INSERT INTO tasks_fts (rowid, title, description, result_summary) "
+    f"VALUES ({_FTS_ROWID.format('new')}, new.title, new.description, new.result_summary); END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description, result_summary ON tasks BEGIN "
+    f"DELETE FROM tasks_fts WHERE rowid = {_FTS_ROWID.format('old')}; "
+    "INSERT INTO tasks_fts (rowid, title, description, result_summary) "
+    f"VALUES ({_FTS_ROWID.format('new')}, new.title, new.description, new.result_summary); END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+    f"DELETE FROM tasks_fts WHERE rowid = {_FTS_ROWID.format('old')}; "
+    "DELETE FROM tasks_fts_rowids WHERE task_id = old.id; END",
+]
+SQLITE_DROP_DDL = ["DROP TABLE IF EXISTS tasks_fts", "DROP TABLE IF EXISTS tasks_fts_rowids"]
+
+# Separate metadata: create_all must not create the FTS tables as plain tables
+_fts_metadata = MetaData()
+tasks_fts = Table(
+    "tasks_fts",
+    _fts_metadata,
+    Column("rowid", Integer),
+    Column("title", String),
+    Column("description", String),
+    Column("result_summary", String),
+)
+tasks_fts_rowids = Table("tasks_fts_rowids", _fts_metadata, Column("rowid", Integer), Column("task_id", Uuid))
+# bm25 weights in column order (title, description, result_summary)
+_BM25_WEIGHTS = (10.0, 5.0, 1.0)
+
+
+def fts5_query(term: str) -> str:
+    """Every word of `term` as a quoted prefix query, so user input cannot inject FTS5 syntax."""
+    return " ".join('"' + word.replace('"', '""') + '"*' for word in term.split())
+
+
+def search_statement(model: Any, term: str, dialect: str) -> Select:
+    """`select(model)` narrowed to the tasks matching `term`, best match first."""
+    if dialect == "postgresql":
+        vector = literal_column("tasks.search_vector")
+        query = func.websearch_to_tsquery(literal_column(f"'{SEARCH_CONFIG}'::regconfig"), term)
+        rank = func.ts_rank_cd(vector, query) + func.similarity(model.title, term)
+        return select(model).where(vector.op("@@")(query) | model.title.op("%")(term)).order_by(rank.desc(), model.id)
+    if dialect == "sqlite":
+        query = fts5_query(term)
+        if not query:
+            return select(model).where(false())
+        fts = literal_column("tasks_fts")
+        matches = (
+            select(tasks_fts_rowids.c.task_id, func.bm25(fts, *_BM25_WEIGHTS).label("rank"))
+            .select_from(tasks_fts)
+            .join(tasks_fts_rowids, tasks_fts_rowids.c.rowid == tasks_fts.c.rowid)
+            .where(fts.op("MATCH")(query))
+            .subquery()
+        )
+        return select(model).join(matches, matches.c.task_id == model.id).order_by(matches.c.rank, model.id)
+    raise NotImplementedError(f"Full-text search is not supported for dialect '{dialect}'")
@@ -1,11 +1,23 @@
 """Task Service for Hub Module."""
 
-from typing import Annotated
+import datetime
+from collections.abc import AsyncIterator, Collection, Mapping, Sequence
+from typing import Annotated, Any
+from uuid import UUID
 
+from app.common.database import advisory_xact_lock
+from app.common.export import ExportServiceMixin
+from app.common.pagination import CursorPaginationServiceMixin, normalize_where
+from app.common.settings import get_hub_settings
 from app.platform.workspaces.repos import WorkspaceRepository
+from app.tasks.task_tags.models import TaskTag
+from app.tasks.tasks.enum import TaskQueue, TaskStatus
 from app.tasks.tasks.models import Task
 from app.tasks.tasks.repos import TaskRepository
-from app.tasks.tasks.schemas import TaskDbCreate, TaskDbUpdate
+from app.tasks.tasks.scheduling import schedule_at
+from app.tasks.tasks.schemas import TaskDbCreate, TaskDbUpdate, TaskTreeNode
+from app.tasks.tasks.tree import build_task_tree
+from app_base.base.exceptions.basic import BadRequestException, NotFoundException
 from app_base.base.repos.base import BaseRepository
 from app_base.base.services.base import (
     BaseCreateServiceMixin,
@@ -17,6 +29,10 @@ from app_base.base.services.base import (
 from app_base.base.services.exists_check_hook import ExistsCheckHooksMixin
 from app_base.base.services.nested_resource_hook import NestedResourceContextKwargs, NestedResourceHooksMixin
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Columns `schedule_at` is computed from
+SCHEDULE_FIELDS = ("created_at", "priority", "urgency", "due_date")
 
 
 class TaskContextKwargs(NestedResourceContextKwargs):
@@ -24,6 +40,8 @@ class TaskContextKwargs(NestedResourceContextKwargs):
 
 
 class TaskService(
+    CursorPaginationServiceMixin,  # Keyset pagination for list endpoints
+    ExportServiceMixin,  # Streaming NDJSON export
     NestedResourceHooksMixin,  # Relationship with Workspace
     ExistsCheckHooksMixin,  # Ensure existence checks before operations
     BaseCreateServiceMixin[TaskRepository, Task, TaskDbCreate, TaskContextKwargs],
@@ -57,3 +75,207 @@ class TaskService(
     @property
     def fk_name(self) -> str:
         return "workspace_id"
+
+    async def ensure_workspace_exists(self, session: AsyncSession, workspace_id: UUID) -> None:
+        """Raise NotFoundException if the parent workspace does not exist."""
+        workspace = await self.parent_repo.get(session, where=[self.parent_repo.model.id == workspace_id])
+        if workspace is None:
+            raise NotFoundException()
+
+    async def get_field_values(
+        self,
+        session: AsyncSession,
+        obj_id: UUID,
+        fields: Sequence[str],
+        context: TaskContextKwargs,
+        for_update: bool = False,
+    ) -> dict[str, str] | None:
+        return await self.repo.get_field_values(session, obj_id, fields, context["parent_id"], for_update=for_update)
+
+    async def create_batch(
+        self,
+        session: AsyncSession,
+        objs: Sequence[TaskDbCreate],
+        tags: Sequence[Sequence[TaskTag]],
+        context: TaskContextKwargs,
+        blocked_by: Sequence[Sequence[UUID]] | None = None,
+    ) -> list[Task]:
+        """Create many tasks at once; `tags[i]` are the tags of `objs[i]`, `blocked_by[i]` its predecessors.
+
+        The caller is expected to have checked the workspace with `ensure_workspace_exists`.
+        """
+        tag_ids = [[tag.id for tag in obj_tags] for obj_tags in tags]
+        ids = await self.repo.bulk_create(session, context["parent_id"], objs, tag_ids)
+        if blocked_by:
+            edges = [(obj_id, dep_id) for obj_id, dep_ids in zip(ids, blocked_by, strict=True) for dep_id in dep_ids]
+            if edges:
+                await self.add_dependencies(session, edges, context, check_cycles=False)
+        return await self.repo.get_by_ids(session, ids)
+
+    async def stream_export(
+        self,
+        session: AsyncSession,
+        context: TaskContextKwargs | None = None,
+        where: Sequence | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Stream task rows with their tag names, fetching tags once per partition."""
+        async for rows in super().stream_export(session, context=context, where=where):
+            tag_names = await self.repo.get_tag_names_by_task_ids(session, [row["id"] for row in rows])
+            for row in rows:
+                row["tags"] = tag_names.get(row["id"], [])
+            yield rows
+
+    async def get_multi_by_schedule(
+        self,
+        session: AsyncSession,
+        offset: int,
+        limit: int | None,
+        context: TaskContextKwargs,
+        where: Sequence | None = None,
+    ) -> list[Task]:
+        where = [*normalize_where(where), self.repo.model.workspace_id == context["parent_id"]]
+        return await self.repo.get_multi_by_schedule(session, offset, limit, where=where)
+
+    async def search(
+        self,
+        session: AsyncSession,
+        term: str,
+        offset: int,
+        limit: int | None,
+        context: TaskContextKwargs,
+        where: Sequence | None = None,
+    ) -> list[Task]:
+        where = [*normalize_where(where), self.repo.model.workspace_id == context["parent_id"]]
+        return await self.repo.search(session, term, offset, limit, where=where)
+
+    @staticmethod
+    def schedule_changes(obj_in: TaskDbUpdate) -> dict[str, Any]:
+        """The inputs of `schedule_at` this update sets."""
+        return {
+            field: getattr(value, "value", value)
+            for field in ("priority", "urgency", "due_date")
+            if (value := getattr(obj_in, field)) is not None
+        }
+
+    @staticmethod
+    def reschedule_fields(changes: Mapping[str, Any], current: Mapping[str, Any]) -> dict[str, Any]:
+        """Update fields keeping `schedule_at` in step with `changes` applied over the task's `current` values.
+
+        `current` holds the task's SCHEDULE_FIELDS, read under the row lock so a concurrent update of another
+        input cannot slip in between the read and the write.
+        """
+        if not changes:
+            return {}
+        values = {**current, **changes}
+        return {
+            "schedule_at": schedule_at(values["created_at"], values["priority"], values["urgency"], values["due_date"])
+        }
+
+    async def get_tree(
+        self, session: AsyncSession, obj_id: UUID, max_depth: int, context: TaskContextKwargs
+    ) -> TaskTreeNode | None:
+        """The task's subtree down to `max_depth` levels with progress rollups; None if the task does not exist."""
+        # One level more than returned, so nodes at the limit know whether they were cut
+        rows = await self.repo.get_subtree(session, context["parent_id"], obj_id, max_depth + 1)
+        return build_task_tree(rows, max_depth)
+
+    async def get_dependencies(self, session: AsyncSession, obj_id: UUID, context: TaskContextKwargs) -> list[Task]:
+        await self._ensure_tasks_exist(session, [obj_id], context)
+        return await self.repo.get_dependencies(session, obj_id)
+
+    async def add_dependencies(
+        self,
+        session: AsyncSession,
+        edges: Sequence[tuple[UUID, UUID]],
+        context: TaskContextKwargs,
+        check_cycles: bool = True,
+    ) -> None:
+        """Add (task id, predecessor id) "blocked by" edges within the workspace.
+
+        Every task involved is locked first: the predecessors, then the dependents, each in id order (the
+        order a status change takes them in, so the two cannot deadlock). A predecessor finishing
+        concurrently then either commits before the recount, which sees it done, or waits and shifts the
+        new edge itself. New tasks have no dependents and cannot close a cycle, so their callers skip the
+        check; with the check, additions are serialized per workspace so two cannot close a cycle together.
+        """
+        if any(task_id == dep_id for task_id, dep_id in edges):
+            raise BadRequestException("A task cannot depend on itself")
+        if check_cycles:
+            await advisory_xact_lock(session, f"task_dependencies:{context['parent_id']}")
+        task_ids = {task_id for task_id, _ in edges}
+        dep_ids = {dep_id for _, dep_id in edges}
+        existing_deps = await self.repo.get_existing_ids(session, context["parent_id"], dep_ids, for_update=True)
+        if task_ids - await self.repo.get_existing_ids(session, context["parent_id"], task_ids, for_update=True):
+            raise NotFoundException()
+        missing = dep_ids - existing_deps
+        if missing:
+            raise BadRequestException(f"Unknown predecessor tasks: {', '.join(sorted(map(str, missing)))}")
+        await self.repo.add_dependencies(session, edges)
+        if check_cycles:
+            for task_id in task_ids:
+                if await self.repo.has_dependency_cycle(session, task_id):
+                    raise BadRequestException("Dependency would create a cycle")
+
+    async def remove_dependency(
+        self, session: AsyncSession, obj_id: UUID, depends_on_task_id: UUID, context: TaskContextKwargs
+    ) -> None:
+        await self._ensure_tasks_exist(session, [obj_id], context)
+        if not await self.repo.remove_dependency(session, obj_id, depends_on_task_id):
+            raise NotFoundException()
+
+    async def sync_dependents(
+        self, session: AsyncSession, obj_id: UUID, previous_status: str | None, status: str | None
+    ) -> list[UUID]:
+        """Keep dependents' counts in step with a status change of `obj_id`; returns the tasks it unblocked.
+
+        `status` None means the task is being deleted, which also resolves its dependents.
+        """
+        done = TaskStatus.DONE.value
+        if previous_status != done and status in (done, None):
+            return await self.repo.shift_dependent_counts(session, obj_id, -1)
+        if previous_status == done and status not in (done, None):
+            await self.repo.shift_dependent_counts(session, obj_id, 1)
+        return []
+
+    async def _ensure_tasks_exist(
+        self, session: AsyncSession, ids: Collection[UUID], context: TaskContextKwargs
+    ) -> None:
+        if set(ids) - await self.repo.get_existing_ids(session, context["parent_id"], ids):
+            raise NotFoundException()
+
+    async def claim(
+        self,
+        session: AsyncSession,
+        queue: TaskQueue,
+        limit: int,
+        worker_id: str,
+        lease_seconds: int | None,
+        context: TaskContextKwargs,
+    ) -> Sequence[Task]:
+        """Claim pending tasks of a queue for a worker, leasing them until the returned deadline."""
+        await self.ensure_workspace_exists(session, context["parent_id"])
+        return await self.repo.claim_pending(
+            session, context["parent_id"], queue, limit, worker_id, self._lease_deadline(lease_seconds)
+        )
+
+    async def heartbeat(
+        self,
+        session: AsyncSession,
+        obj_id: UUID,
+        worker_id: str,
+        lease_seconds: int | None,
+        context: TaskContextKwargs,
+    ) -> Task | None:
+        """Extend the lease of a task; returns None when the worker no longer holds it."""
+        return await self.repo.extend_lease(
+            session, context["parent_id"], obj_id, worker_id, self._lease_deadline(lease_seconds)
+        )
+
+    async def release_expired_leases(self, session: AsyncSession) -> Sequence[tuple[UUID, UUID]]:
+        return await self.repo.release_expired_leases(session, datetime.datetime.now(datetime.UTC))
+
+    @staticmethod
+    def _lease_deadline(lease_seconds: int | None) -> datetime.datetime:
+        if lease_seconds is None:
+            lease_seconds = get_hub_settings().TASK_LEASE_SECONDS
+        return datetime.datetime.now(datetime.UTC) + datetime.timedelta(seconds=lease_seconds)
@@ -0,0 +1,59 @@
+"""Subtask trees with per-node progress rollups."""
+
+from collections.abc import Sequence
+from uuid import UUID
+
+from app.tasks.tasks.enum import TaskStatus
+from app.tasks.tasks.models import Task
+from app.tasks.tasks.schemas import TaskTreeNode
+
+
+def build_task_tree(rows: Sequence[tuple[Task, int]], max_depth: int) -> TaskTreeNode | None:
+    """Nest `(task, depth)` rows (root first, as loaded by `TaskRepository.get_subtree`) and roll up progress.
+
+    Rows one level below `max_depth` are not returned; they only mark their parent as `truncated`,
+    so the loader should fetch `max_depth + 1` levels. Rollups cover the returned nodes.
+    """
+    if not rows:
+        return None
+    depths: dict[UUID, int] = {}
+    tasks: dict[UUID, Task] = {}
+    for task, depth in rows:
+        # A parent cycle yields the same task again at a greater depth; keep the first one
+        if task.id not in depths:
+            depths[task.id] = depth
+            tasks[task.id] = task
+    root_id = rows[0][0].id
+
+    children: dict[UUID, list[UUID]] = {}
+    for task_id, task in tasks.items():
+        if task_id != root_id and task.parent_task_id in tasks:
+            children.setdefault(task.parent_task_id, []).append(task_id)
+
+    def build(task_id: UUID) -> TaskTreeNode:
+        node = TaskTreeNode.model_validate(tasks[task_id])
+        node.depth = depths[task_id]
+        counts = dict.fromkeys(TaskStatus, 0)
+        for child_id in children.get(task_id, ()):
+            if depths[child_id] > max_depth:
+                node.truncated = True
+                continue
+            child = build(child_id)
+            node.children.append(child)
+            counts[child.status] += 1
+            for status, count in child.descendant_status_counts.items():
+                counts[status] += count
+        node.descendant_status_counts = counts
+        node.descendant_count = sum(counts.values())
+        node.percent_done = _percent_done(node.status, counts)
+        return node
+
+    return build(root_id)
+
+
+def _percent_done(status: TaskStatus, counts: dict[TaskStatus, int]) -> float:
+    """Share of done work among non-cancelled descendants; a node without any falls back to its own status."""
+    active = sum(counts.values()) - counts[TaskStatus.CANCELLED]
+    if active == 0:
+        return 100.0 if status == TaskStatus.DONE else 0.0
+    return round(100 * counts[TaskStatus.DONE] / active, 2)
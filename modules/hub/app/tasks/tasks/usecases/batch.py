@@ -0,0 +1,43 @@
+from collections.abc import Sequence
+from typing import Annotated
+
+from app.tasks.task_tags.services import TaskTagService
+from app.tasks.tasks.enum import TaskEventType
+from app.tasks.tasks.events import publish_task_event
+from app.tasks.tasks.models import Task
+from app.tasks.tasks.schemas import TaskBatchCreate, TaskDbCreate
+from app.tasks.tasks.services import TaskContextKwargs, TaskService
+from app_base.base.usecases.base import BaseUseCase
+from app_base.core.database.transaction import AsyncTransaction
+from fastapi import Depends
+
+
+class CreateBatchTaskUseCase(BaseUseCase):
+    def __init__(
+        self, service: Annotated[TaskService, Depends()], tag_service: Annotated[TaskTagService, Depends()]
+    ) -> None:
+        self.service = service
+        self.tag_service = tag_service
+
+    async def execute(self, obj_data: TaskBatchCreate, context: TaskContextKwargs) -> Sequence[Task]:
+        async with AsyncTransaction() as session:
+            await self.service.ensure_workspace_exists(session, context["parent_id"])
+
+            # Resolve the tags of every task with a single batched get-or-create
+            all_names = [name for item in obj_data.items for name in item.tags]
+            tags_by_name = {
+                tag.name: tag for tag in await self.tag_service.get_or_create_tags(session, all_names, context)
+            }
+            tags = [
+                [tags_by_name[name] for name in dict.fromkeys(n.strip() for n in item.tags if n.strip())]
+                for item in obj_data.items
+            ]
+
+            db_objs = [
+                TaskDbCreate.model_validate(item.model_dump(exclude={"tags", "blocked_by"})) for item in obj_data.items
+            ]
+            blocked_by = [list(dict.fromkeys(item.blocked_by)) for item in obj_data.items]
+            tasks = await self.service.create_batch(session, db_objs, tags, context, blocked_by=blocked_by)
+            # One summary event: per-task notifications would flood subscribers (and pg_notify)
+            await publish_task_event(session, TaskEventType.BATCH_CREATED, context["parent_id"], count=len(tasks))
+            return tasks
@@ -0,0 +1,36 @@
+from collections.abc import Sequence
+from typing import Annotated
+
+from app.tasks.tasks.enum import TaskEventType, TaskQueue
+from app.tasks.tasks.events import publish_task_event
+from app.tasks.tasks.models import Task
+from app.tasks.tasks.services import TaskContextKwargs, TaskService
+from app_base.base.usecases.base import BaseUseCase
+from app_base.core.database.transaction import AsyncTransaction
+from fastapi import Depends
+
+
+class ClaimTaskUseCase(BaseUseCase):
+    def __init__(self, service: Annotated[TaskService, Depends()]) -> None:
+        self.service = service
+
+    async def execute(
+        self,
+        queue: TaskQueue,
+        limit: int,
+        worker_id: str,
+        lease_seconds: int | None,
+        context: TaskContextKwargs,
+    ) -> Sequence[Task]:
+        async with AsyncTransaction() as session:
+            tasks = await self.service.claim(session, queue, limit, worker_id, lease_seconds, context)
+            if tasks:
+                await publish_task_event(
+                    session,
+                    TaskEventType.CLAIMED,
+                    context["parent_id"],
+                    task_ids=[task.id for task in tasks],
+                    queue=queue,
+                    worker_id=worker_id,
+                )
+            return tasks
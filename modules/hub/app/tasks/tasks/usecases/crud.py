@@ -1,10 +1,15 @@
 from typing import Annotated, Optional
 from uuid import UUID
 
+from app.common.export import BaseExportUseCase
+from app.common.pagination import BaseGetMultiByCursorUseCase
+from app.tasks.task_histories.services import TRACKED_TASK_FIELDS, TaskHistoryService
 from app.tasks.task_tags.services import TaskTagService
+from app.tasks.tasks.enum import TaskEventType, TaskStatus
+from app.tasks.tasks.events import publish_task_event, publish_task_ids_event, task_event_data
 from app.tasks.tasks.models import Task
 from app.tasks.tasks.schemas import TaskCreate, TaskDbCreate, TaskDbUpdate, TaskUpdate
-from app.tasks.tasks.services import TaskContextKwargs, TaskService
+from app.tasks.tasks.services import SCHEDULE_FIELDS, TaskContextKwargs, TaskService
 from app_base.base.usecases.crud import (
     BaseCreateUseCase,
     BaseDeleteUseCase,
@@ -26,6 +31,16 @@ class GetMultiTaskUseCase(BaseGetMultiUseCase[TaskService, Task, TaskContextKwar
         super().__init__(service)
 
 
+class GetMultiTaskByCursorUseCase(BaseGetMultiByCursorUseCase[TaskService]):
+    def __init__(self, service: Annotated[TaskService, Depends()]) -> None:
+        super().__init__(service)
+
+
+class ExportTaskUseCase(BaseExportUseCase[TaskService]):
+    def __init__(self, service: Annotated[TaskService, Depends()]) -> None:
+        super().__init__(service)
+
+
 class CreateTaskUseCase(BaseCreateUseCase[TaskService, Task, TaskCreate, TaskContextKwargs]):
     def __init__(
         self, service: Annotated[TaskService, Depends()], tag_service: Annotated[TaskTagService, Depends()]
@@ -39,17 +54,27 @@ class CreateTaskUseCase(BaseCreateUseCase[TaskService, Task, TaskCreate, TaskCon
         tag_objects = await self.tag_service.get_or_create_tags(session, tags, context)
 
         # Create Task
-        db_obj = TaskDbCreate.model_validate(obj_data.model_dump(exclude={"tags"}))
+        db_obj = TaskDbCreate.model_validate(obj_data.model_dump(exclude={"tags", "blocked_by"}))
 
-        return await self.service.create(session, db_obj, context=context, tags=tag_objects)
+        task = await self.service.create(session, db_obj, context=context, tags=tag_objects)
+        if obj_data.blocked_by:
+            edges = [(task.id, dep_id) for dep_id in dict.fromkeys(obj_data.blocked_by)]
+            await self.service.add_dependencies(session, edges, context, check_cycles=False)
+            await session.refresh(task, ["unresolved_dependency_count"])
+        await publish_task_event(session, TaskEventType.CREATED, task.workspace_id, **task_event_data(task))
+        return task
 
 
 class UpdateTaskUseCase(BaseUpdateUseCase[TaskService, Task, TaskUpdate, TaskContextKwargs]):
     def __init__(
-        self, service: Annotated[TaskService, Depends()], tag_service: Annotated[TaskTagService, Depends()]
+        self,
+        service: Annotated[TaskService, Depends()],
+        tag_service: Annotated[TaskTagService, Depends()],
+        history_service: Annotated[TaskHistoryService, Depends()],
     ) -> None:
         super().__init__(service)
         self.tag_service = tag_service
+        self.history_service = history_service
 
     async def _execute(
         self, session: AsyncSession, obj_id: UUID, obj_data: TaskUpdate, context: Optional[TaskContextKwargs]
@@ -62,10 +87,63 @@ class UpdateTaskUseCase(BaseUpdateUseCase[TaskService, Task, TaskUpdate, TaskCon
             tag_objects = None
 
         # Update Task
-        db_obj = TaskDbUpdate.model_validate(obj_data.model_dump(exclude={"tags"}))
-        return await self.service.update(session, obj_id, db_obj, context, tags=tag_objects)
+        db_obj = TaskDbUpdate.model_validate(obj_data.model_dump(exclude={"tags", "changed_by"}))
+        update_fields = {}
+        if db_obj.status is not None and db_obj.status != TaskStatus.IN_PROGRESS:
+            # Leaving in_progress releases the worker lease
+            update_fields.update(lease_owner=None, lease_expires_at=None)
+
+        # Snapshot tracked fields before the update so changes can be written to the history, along with the
+        # inputs of `schedule_at` when the update changes one of them. The row stays locked from this read on: a
+        # concurrent update of the same task waits and then sees this one's values, so a transition to done
+        # shifts the dependents' counts (and is recorded) once, and a schedule is never computed from inputs
+        # another update is replacing.
+        tracked = {
+            field: getattr(db_obj, field).value for field in TRACKED_TASK_FIELDS if getattr(db_obj, field) is not None
+        }
+        schedule_changes = self.service.schedule_changes(db_obj)
+        locked_fields = list(dict.fromkeys([*tracked, *(SCHEDULE_FIELDS if schedule_changes else ())]))
+        current = (
+            await self.service.get_field_values(session, obj_id, locked_fields, context, for_update=True)
+            if locked_fields
+            else None
+        )
+        previous = {field: current[field] for field in tracked} if current is not None and tracked else None
+        if current is not None:
+            update_fields.update(self.service.reschedule_fields(schedule_changes, current))
+
+        task = await self.service.update(session, obj_id, db_obj, context, tags=tag_objects, **update_fields)
+        if task is not None:
+            if previous is not None:
+                entries = await self.history_service.record_task_changes(
+                    session, task.id, task.workspace_id, previous, tracked, obj_data.changed_by
+                )
+                for history_id, entry in entries.items():
+                    await publish_task_event(
+                        session,
+                        TaskEventType.HISTORY_CREATED,
+                        task.workspace_id,
+                        task_id=task.id,
+                        task_history_id=history_id,
+                        event_type=entry.event_type,
+                        new_value=entry.new_value,
+                    )
+            await publish_task_event(session, TaskEventType.UPDATED, task.workspace_id, **task_event_data(task))
+            if previous is not None and "status" in tracked:
+                unblocked = await self.service.sync_dependents(session, task.id, previous["status"], tracked["status"])
+                await publish_task_ids_event(session, TaskEventType.UNBLOCKED, task.workspace_id, unblocked)
+        return task
 
 
 class DeleteTaskUseCase(BaseDeleteUseCase[TaskService, Task, TaskContextKwargs]):
     def __init__(self, service: Annotated[TaskService, Depends()]) -> None:
         super().__init__(service)
+
+    async def _execute(self, session: AsyncSession, obj_id: UUID, context: Optional[TaskContextKwargs]):
+        # A deleted predecessor no longer blocks its dependents; locked like in UpdateTaskUseCase
+        current = await self.service.get_field_values(session, obj_id, ["status"], context, for_update=True)
+        unblocked = await self.service.sync_dependents(session, obj_id, current["status"], None) if current else []
+        result = await super()._execute(session, obj_id, context)
+        await publish_task_event(session, TaskEventType.DELETED, context["parent_id"], task_id=obj_id)
+        await publish_task_ids_event(session, TaskEventType.UNBLOCKED, context["parent_id"], unblocked)
+        return result
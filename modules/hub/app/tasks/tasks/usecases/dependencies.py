@@ -0,0 +1,50 @@
+from typing import Annotated
+from uuid import UUID
+
+from app.tasks.tasks.enum import TaskEventType
+from app.tasks.tasks.events import publish_task_event, task_event_data
+from app.tasks.tasks.models import Task
+from app.tasks.tasks.schemas import TaskDependencyCreate
+from app.tasks.tasks.services import TaskContextKwargs, TaskService
+from app_base.base.usecases.base import BaseUseCase
+from app_base.core.database.transaction import AsyncTransaction
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class GetTaskDependenciesUseCase(BaseUseCase):
+    def __init__(self, service: Annotated[TaskService, Depends()]) -> None:
+        self.service = service
+
+    async def execute(self, obj_id: UUID, context: TaskContextKwargs) -> list[Task]:
+        async with AsyncTransaction() as session:
+            return await self.service.get_dependencies(session, obj_id, context)
+
+
+class AddTaskDependenciesUseCase(BaseUseCase):
+    def __init__(self, service: Annotated[TaskService, Depends()]) -> None:
+        self.service = service
+
+    async def execute(self, obj_id: UUID, obj_data: TaskDependencyCreate, context: TaskContextKwargs) -> Task:
+        async with AsyncTransaction() as session:
+            edges = [(obj_id, dep_id) for dep_id in dict.fromkeys(obj_data.depends_on_task_ids)]
+            await self.service.add_dependencies(session, edges, context)
+            return await _updated_task(session, self.service, obj_id, context)
+
+
+class RemoveTaskDependencyUseCase(BaseUseCase):
+    def __init__(self, service: Annotated[TaskService, Depends()]) -> None:
+        self.service = service
+
+    async def execute(self, obj_id: UUID, depends_on_task_id: UUID, context: TaskContextKwargs) -> Task:
+        async with AsyncTransaction() as session:
+            await self.service.remove_dependency(session, obj_id, depends_on_task_id, context)
+            return await _updated_task(session, self.service, obj_id, context)
+
+
+async def _updated_task(session: AsyncSession, service: TaskService, obj_id: UUID, context: TaskContextKwargs) -> Task:
+    """Reload the task after its count was rewritten in SQL and announce the change."""
+    task = await service.get(session, obj_id, context=context)
+    await session.refresh(task, ["unresolved_dependency_count"])
+    await publish_task_event(session, TaskEventType.UPDATED, task.workspace_id, **task_event_data(task))
+    return task
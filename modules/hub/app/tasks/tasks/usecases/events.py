@@ -0,0 +1,33 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Annotated
+
+from app.common.events import SSE_KEEPALIVE, format_sse, get_event_broker
+from app.common.settings import get_hub_settings
+from app.tasks.tasks.services import TaskContextKwargs, TaskService
+from app_base.base.usecases.base import BaseUseCase
+from app_base.core.database.transaction import AsyncTransaction
+from fastapi import Depends
+
+
+class StreamTaskEventsUseCase(BaseUseCase):
+    def __init__(self, service: Annotated[TaskService, Depends()]) -> None:
+        self.service = service
+
+    async def execute(self, context: TaskContextKwargs) -> AsyncIterator[bytes]:
+        async with AsyncTransaction() as session:
+            await self.service.ensure_workspace_exists(session, context["parent_id"])
+        return self._stream(str(context["parent_id"]))
+
+    async def _stream(self, topic: str) -> AsyncIterator[bytes]:
+        keepalive = get_hub_settings().TASK_EVENTS_KEEPALIVE_SECONDS
+        async with get_event_broker().subscribe(topic) as queue:
+            # Flush headers right away so clients know the subscription is live
+            yield SSE_KEEPALIVE
+            while True:
+                try:
+                    payload = await asyncio.wait_for(queue.get(), timeout=keepalive)
+                except TimeoutError:
+                    yield SSE_KEEPALIVE
+                    continue
+                yield format_sse(payload)
@@ -0,0 +1,36 @@
+from collections import Counter
+from typing import Annotated
+from uuid import UUID
+
+from app.tasks.tasks.enum import TaskEventType
+from app.tasks.tasks.events import publish_task_event
+from app.tasks.tasks.models import Task
+from app.tasks.tasks.schemas import TaskHeartbeat
+from app.tasks.tasks.services import TaskContextKwargs, TaskService
+from app_base.base.usecases.base import BaseUseCase
+from app_base.core.database.transaction import AsyncTransaction
+from fastapi import Depends
+
+
+class HeartbeatTaskUseCase(BaseUseCase):
+    def __init__(self, service: Annotated[TaskService, Depends()]) -> None:
+        self.service = service
+
+    async def execute(self, obj_id: UUID, obj_data: TaskHeartbeat, context: TaskContextKwargs) -> Task | None:
+        async with AsyncTransaction() as session:
+            return await self.service.heartbeat(session, obj_id, obj_data.worker_id, obj_data.lease_seconds, context)
+
+
+class ReleaseExpiredTaskLeasesUseCase(BaseUseCase):
+    """Return tasks whose worker stopped heartbeating to the pending pool."""
+
+    def __init__(self, service: Annotated[TaskService, Depends()]) -> None:
+        self.service = service
+
+    async def execute(self) -> int:
+        async with AsyncTransaction() as session:
+            released = await self.service.release_expired_leases(session)
+            counts = Counter(workspace_id for _, workspace_id in released)
+            for workspace_id, count in counts.items():
+                await publish_task_event(session, TaskEventType.LEASE_EXPIRED, workspace_id, count=count)
+            return len(released)
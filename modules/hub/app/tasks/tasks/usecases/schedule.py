@@ -0,0 +1,26 @@
+from collections.abc import Sequence
+from typing import Annotated
+
+from app.tasks.tasks.services import TaskContextKwargs, TaskService
+from app_base.base.schemas.paginated import PaginatedList
+from app_base.base.usecases.base import BaseUseCase
+from app_base.core.database.transaction import AsyncTransaction
+from fastapi import Depends
+
+
+class GetMultiTaskByScheduleUseCase(BaseUseCase):
+    """Tasks in scheduling order; no total is counted, the page is a top-N read of the schedule index."""
+
+    def __init__(self, service: Annotated[TaskService, Depends()]) -> None:
+        self.service = service
+
+    async def execute(
+        self,
+        offset: int,
+        limit: int | None,
+        context: TaskContextKwargs,
+        where: Sequence | None = None,
+    ) -> PaginatedList:
+        async with AsyncTransaction() as session:
+            items = await self.service.get_multi_by_schedule(session, offset, limit, context, where=where)
+        return PaginatedList(items=items, offset=offset, limit=limit)
@@ -0,0 +1,27 @@
+from collections.abc import Sequence
+from typing import Annotated
+
+from app.tasks.tasks.services import TaskContextKwargs, TaskService
+from app_base.base.schemas.paginated import PaginatedList
+from app_base.base.usecases.base import BaseUseCase
+from app_base.core.database.transaction import AsyncTransaction
+from fastapi import Depends
+
+
+class SearchTaskUseCase(BaseUseCase):
+    """Full-text search, best match first; like the schedule order, no total is counted."""
+
+    def __init__(self, service: Annotated[TaskService, Depends()]) -> None:
+        self.service = service
+
+    async def execute(
+        self,
+        term: str,
+        offset: int,
+        limit: int | None,
+        context: TaskContextKwargs,
+        where: Sequence | None = None,
+    ) -> PaginatedList:
+        async with AsyncTransaction() as session:
+            items = await self.service.search(session, term, offset, limit, context, where=where)
+        return PaginatedList(items=items, offset=offset, limit=limit)
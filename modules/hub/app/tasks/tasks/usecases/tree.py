@@ -0,0 +1,17 @@
+from typing import Annotated
+from uuid import UUID
+
+from app.tasks.tasks.schemas import TaskTreeNode
+from app.tasks.tasks.services import TaskContextKwargs, TaskService
+from app_base.base.usecases.base import BaseUseCase
+from app_base.core.database.transaction import AsyncTransaction
+from fastapi import Depends
+
+
+class GetTaskTreeUseCase(BaseUseCase):
+    def __init__(self, service: Annotated[TaskService, Depends()]) -> None:
+        self.service = service
+
+    async def execute(self, obj_id: UUID, max_depth: int, context: TaskContextKwargs) -> TaskTreeNode | None:
+        async with AsyncTransaction() as session:
+            return await self.service.get_tree(session, obj_id, max_depth, context)
@@ -0,0 +1,57 @@
+"""access path indexes
+
+Revision ID: b84e0d5c7a12
+Revises: 3f7a1c2d9e41
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b84e0d5c7a12'
+down_revision: Union[str, None] = '3f7a1c2d9e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns): foreign keys plus the filter/sort paths of the list and claim routes
+INDEXES = [
+    ('ix_tasks_workspace_id_status_queue_created_at', 'tasks', ['workspace_id', 'status', 'queue', 'created_at']),
+    ('ix_tasks_workspace_id_created_at', 'tasks', ['workspace_id', 'created_at', 'id']),
+    ('ix_tasks_parent_task_id', 'tasks', ['parent_task_id']),
+    ('ix_task_tags_workspace_id_name', 'task_tags', ['workspace_id', 'name']),
+    ('ix_task_tag_associations_tag_id_task_id', 'task_tag_associations', ['tag_id', 'task_id']),
+    ('ix_task_history_workspace_id_created_at', 'task_history', ['workspace_id', 'created_at', 'id']),
+    ('ix_task_history_task_id_created_at', 'task_history', ['task_id', 'created_at']),
+    ('ix_task_history_assigned_agent_id', 'task_history', ['assigned_agent_id']),
+    ('ix_conversations_workspace_id_created_at', 'conversations', ['workspace_id', 'created_at']),
+    ('ix_chat_messages_conversation_id_created_at', 'chat_messages', ['conversation_id', 'created_at', 'id']),
+    ('ix_chat_messages_agent_execution_id', 'chat_messages', ['agent_execution_id']),
+    ('ix_routing_logs_message_id', 'routing_logs', ['message_id']),
+    ('ix_routing_logs_target_task_id', 'routing_logs', ['target_task_id']),
+    ('ix_routing_logs_target_agent_id', 'routing_logs', ['target_agent_id']),
+    ('ix_routing_logs_created_at', 'routing_logs', ['created_at', 'id']),
+    ('ix_agent_executions_task_id', 'agent_executions', ['task_id']),
+    ('ix_agent_executions_configured_agent_id', 'agent_executions', ['configured_agent_id']),
+    ('ix_agent_executions_created_at', 'agent_executions', ['created_at', 'id']),
+    ('ix_configured_agent_skills_skill_id', 'configured_agent_skills', ['skill_id']),
+    ('ix_configured_agent_mcps_mcp_id', 'configured_agent_mcps', ['mcp_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block; it keeps large tables writable.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
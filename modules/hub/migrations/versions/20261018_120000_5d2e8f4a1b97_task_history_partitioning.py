@@ -0,0 +1,128 @@
+"""task history partitioning
+
+Revision ID: 5d2e8f4a1b97
+Revises: b84e0d5c7a12
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2e8f4a1b97'
+down_revision: Union[str, None] = 'b84e0d5c7a12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Partitions pre-created past the current month; the app's maintenance job keeps this window rolling.
+PARTITIONS_AHEAD_MONTHS = 3
+
+INDEXES = [
+    ('ix_task_history_workspace_id_created_at', ['workspace_id', 'created_at', 'id'], {}),
+    ('ix_task_history_task_id_created_at', ['task_id', 'created_at'], {}),
+    ('ix_task_history_assigned_agent_id', ['assigned_agent_id'], {}),
+    ('ix_task_history_created_at_brin', ['created_at'], {'postgresql_using': 'brin'}),
+]
+
+
+def _columns() -> list:
+    return [
+        sa.Column('workspace_id', sa.UUID(), nullable=False),
+        sa.Column('task_id', sa.UUID(), nullable=False),
+        sa.Column('assigned_agent_id', sa.UUID(), nullable=True),
+        sa.Column('event_type', sa.String(length=50), nullable=False),
+        sa.Column('previous_value', sa.String(length=100), nullable=True),
+        sa.Column('new_value', sa.String(length=100), nullable=False),
+        sa.Column('changed_by', sa.String(length=100), nullable=False),
+        sa.Column('comment', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(['assigned_agent_id'], ['configured_agents.id'], ),
+        sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ),
+        sa.ForeignKeyConstraint(['workspace_id'], ['workspaces.id'], ),
+    ]
+
+
+def _add_months(month: datetime.datetime, months: int) -> datetime.datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        # Declarative partitioning is PostgreSQL-only; other backends keep the plain table.
+        op.create_index('ix_task_history_created_at_brin', 'task_history', ['created_at'], unique=False)
+        return
+
+    # Move the heap table aside; its primary key index name must be freed for the new table.
+    op.rename_table('task_history', 'task_history_unpartitioned')
+    op.execute('ALTER INDEX task_history_pkey RENAME TO task_history_unpartitioned_pkey')
+    for name, _, _ in INDEXES[:-1]:
+        op.execute(f'ALTER INDEX {name} RENAME TO {name}_unpartitioned')
+
+    # The partition key has to be part of the primary key.
+    op.create_table(
+        'task_history',
+        *_columns(),
+        sa.PrimaryKeyConstraint('id', 'created_at'),
+        postgresql_partition_by='RANGE (created_at)',
+    )
+
+    now = datetime.datetime.now(datetime.UTC)
+    current = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    oldest = op.get_bind().execute(sa.text('SELECT min(created_at) FROM task_history_unpartitioned')).scalar()
+    month = current
+    if oldest is not None:
+        oldest = oldest.astimezone(datetime.UTC)
+        month = min(current, oldest.replace(day=1, hour=0, minute=0, second=0, microsecond=0))
+    last = _add_months(current, PARTITIONS_AHEAD_MONTHS)
+    while month <= last:
+        upper = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE task_history_p{month:%Y%m} PARTITION OF task_history "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+        month = upper
+    op.execute('CREATE TABLE task_history_default PARTITION OF task_history DEFAULT')
+
+    op.execute(
+        'INSERT INTO task_history (workspace_id, task_id, assigned_agent_id, event_type, previous_value, '
+        'new_value, changed_by, comment, created_at, id) '
+        'SELECT workspace_id, task_id, assigned_agent_id, event_type, previous_value, '
+        'new_value, changed_by, comment, created_at, id FROM task_history_unpartitioned'
+    )
+    op.drop_table('task_history_unpartitioned')
+
+    # Indexes on the partitioned parent cascade to every partition, including future ones.
+    for name, columns, kwargs in INDEXES:
+        op.create_index(name, 'task_history', columns, unique=False, **kwargs)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        op.drop_index('ix_task_history_created_at_brin', table_name='task_history')
+        return
+
+    for name, _, _ in INDEXES:
+        op.drop_index(name, table_name='task_history')
+    op.rename_table('task_history', 'task_history_partitioned')
+    op.execute('ALTER INDEX task_history_pkey RENAME TO task_history_partitioned_pkey')
+
+    op.create_table('task_history', *_columns(), sa.PrimaryKeyConstraint('id'))
+    op.execute(
+        'INSERT INTO task_history (workspace_id, task_id, assigned_agent_id, event_type, previous_value, '
+        'new_value, changed_by, comment, created_at, id) '
+        'SELECT workspace_id, task_id, assigned_agent_id, event_type, previous_value, '
+        'new_value, changed_by, comment, created_at, id FROM task_history_partitioned'
+    )
+    # Dropping the parent drops every partition with it.
+    op.drop_table('task_history_partitioned')
+    for name, columns, kwargs in INDEXES[:-1]:
+        op.create_index(name, 'task_history', columns, unique=False, **kwargs)
@@ -0,0 +1,30 @@
+"""ai model catalog version index
+
+Revision ID: 7a41c9e3d250
+Revises: 5d2e8f4a1b97
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a41c9e3d250'
+down_revision: Union[str, None] = '5d2e8f4a1b97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Serves the max(version) probe of the latest-catalog cache
+    with op.get_context().autocommit_block():
+        op.create_index('ix_ai_model_catalogs_version', 'ai_model_catalogs', ['version'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_ai_model_catalogs_version', table_name='ai_model_catalogs', postgresql_concurrently=True)
@@ -0,0 +1,40 @@
+"""ai model catalog entries
+
+Revision ID: e3b6a9d1c478
+Revises: 7a41c9e3d250
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b6a9d1c478'
+down_revision: Union[str, None] = '7a41c9e3d250'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing versions keep a null hash; the next upload simply stores a new version with entries.
+    op.add_column('ai_model_catalogs', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.create_table('ai_model_catalog_entries',
+    sa.Column('catalog_id', sa.UUID(), nullable=False),
+    sa.Column('section', sa.String(length=50), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('data', sa.JSON().with_variant(postgresql.JSONB(astext_type=sa.Text()), 'postgresql'), nullable=False),
+    sa.ForeignKeyConstraint(['catalog_id'], ['ai_model_catalogs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('catalog_id', 'section', 'name')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('ai_model_catalog_entries')
+    op.drop_column('ai_model_catalogs', 'content_hash')
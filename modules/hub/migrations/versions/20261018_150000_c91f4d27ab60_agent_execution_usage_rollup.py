@@ -0,0 +1,107 @@
+"""agent execution usage rollup
+
+Revision ID: c91f4d27ab60
+Revises: e3b6a9d1c478
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c91f4d27ab60'
+down_revision: Union[str, None] = 'e3b6a9d1c478'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COUNTERS = ('input_tokens', 'output_tokens', 'total_tokens', 'cost')
+
+
+def _number(dialect: str, *keys: str) -> str:
+    """First numeric value among `keys` of token_usage, as SQL."""
+    if dialect == 'postgresql':
+        cases = [f"CASE WHEN jsonb_typeof(token_usage->'{key}') = 'number' THEN (token_usage->>'{key}')::numeric END" for key in keys]
+    else:
+        cases = [f"CASE WHEN json_type(token_usage, '$.{key}') IN ('integer', 'real') THEN json_extract(token_usage, '$.{key}') END" for key in keys]
+    return f"COALESCE({', '.join(cases)})" if len(cases) > 1 else cases[0]
+
+
+def _text(dialect: str, *keys: str) -> str:
+    if dialect == 'postgresql':
+        values = [f"NULLIF(token_usage->>'{key}', '')" for key in keys]
+    else:
+        values = [f"NULLIF(json_extract(token_usage, '$.{key}'), '')" for key in keys]
+    return f"COALESCE({', '.join(values)})"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    op.add_column('agent_executions', sa.Column('model_name', sa.String(length=100), nullable=True))
+    op.add_column('agent_executions', sa.Column('input_tokens', sa.Integer(), nullable=True))
+    op.add_column('agent_executions', sa.Column('output_tokens', sa.Integer(), nullable=True))
+    op.add_column('agent_executions', sa.Column('total_tokens', sa.Integer(), nullable=True))
+    op.add_column('agent_executions', sa.Column('cost', sa.Float(), nullable=True))
+    op.create_table('agent_execution_usage_hourly',
+    sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('agent_type', sa.String(length=50), nullable=False),
+    sa.Column('agent_key', sa.String(length=100), nullable=False),
+    sa.Column('model_name', sa.String(length=100), nullable=False),
+    sa.Column('execution_count', sa.Integer(), nullable=False),
+    sa.Column('input_tokens', sa.BigInteger(), nullable=False),
+    sa.Column('output_tokens', sa.BigInteger(), nullable=False),
+    sa.Column('total_tokens', sa.BigInteger(), nullable=False),
+    sa.Column('cost', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('bucket_start', 'agent_type', 'agent_key', 'model_name')
+    )
+
+    # Backfill the typed columns with the same key precedence as app.agents.agent_executions.usage
+    cast_int = 'bigint' if dialect == 'postgresql' else 'integer'
+    input_tokens = _number(dialect, 'input_tokens', 'prompt_tokens')
+    output_tokens = _number(dialect, 'output_tokens', 'completion_tokens')
+    op.execute(
+        f"UPDATE agent_executions SET "
+        f"input_tokens = CAST({input_tokens} AS {cast_int}), "
+        f"output_tokens = CAST({output_tokens} AS {cast_int}), "
+        f"total_tokens = CAST(COALESCE({_number(dialect, 'total_tokens')}, "
+        f"CASE WHEN {input_tokens} IS NOT NULL OR {output_tokens} IS NOT NULL "
+        f"THEN COALESCE({input_tokens}, 0) + COALESCE({output_tokens}, 0) END) AS {cast_int}), "
+        f"cost = CAST({_number(dialect, 'cost', 'total_cost', 'cost_usd')} AS float), "
+        f"model_name = SUBSTR({_text(dialect, 'model', 'model_name')}, 1, 100) "
+        f"WHERE token_usage IS NOT NULL"
+    )
+
+    if dialect == 'postgresql':
+        bucket = "date_trunc('hour', created_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'"
+        agent_key = "COALESCE(configured_agent_id::text, graph_agent_name, '')"
+    else:
+        # Same text format SQLAlchemy writes DateTime values in on SQLite
+        bucket = "strftime('%Y-%m-%d %H:00:00.000000', created_at)"
+        # UUIDs are stored as 32 hex digits on SQLite; the app keys the rollup on the dashed form
+        dashed = "lower(" + " || '-' || ".join(
+            f"substr(configured_agent_id, {start}, {length})" for start, length in ((1, 8), (9, 4), (13, 4), (17, 4), (21, 12))
+        ) + ")"
+        agent_key = f"COALESCE({dashed}, graph_agent_name, '')"
+    sums = ', '.join(f'COALESCE(SUM({name}), 0)' for name in COUNTERS)
+    op.execute(
+        f"INSERT INTO agent_execution_usage_hourly (bucket_start, agent_type, agent_key, model_name, execution_count, "
+        f"{', '.join(COUNTERS)}) "
+        f"SELECT {bucket}, agent_type, {agent_key}, COALESCE(model_name, ''), COUNT(*), {sums} "
+        f"FROM agent_executions "
+        f"WHERE {' OR '.join(f'{name} IS NOT NULL' for name in COUNTERS)} "
+        f"GROUP BY 1, 2, 3, 4"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('agent_execution_usage_hourly')
+    op.drop_column('agent_executions', 'cost')
+    op.drop_column('agent_executions', 'total_tokens')
+    op.drop_column('agent_executions', 'output_tokens')
+    op.drop_column('agent_executions', 'input_tokens')
+    op.drop_column('agent_executions', 'model_name')
@@ -0,0 +1,55 @@
+"""chat message metadata jsonb
+
+Revision ID: 4f8a2c6e91d3
+Revises: c91f4d27ab60
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f8a2c6e91d3'
+down_revision: Union[str, None] = 'c91f4d27ab60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        # Other backends store JSON the same way either type is declared.
+        op.create_index('ix_chat_messages_metadata', 'chat_messages', ['metadata'], unique=False)
+        return
+
+    op.alter_column(
+        'chat_messages', 'metadata',
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        existing_type=postgresql.JSON(astext_type=sa.Text()),
+        existing_nullable=False,
+        postgresql_using='metadata::jsonb',
+    )
+    # jsonb_path_ops: smaller than the default opclass and serves exactly the @> containment filter.
+    op.create_index(
+        'ix_chat_messages_metadata', 'chat_messages', ['metadata'], unique=False,
+        postgresql_using='gin', postgresql_ops={'metadata': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_chat_messages_metadata', table_name='chat_messages')
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.alter_column(
+        'chat_messages', 'metadata',
+        type_=postgresql.JSON(astext_type=sa.Text()),
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        existing_nullable=False,
+        postgresql_using='metadata::json',
+    )
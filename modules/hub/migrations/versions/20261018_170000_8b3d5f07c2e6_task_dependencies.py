@@ -0,0 +1,44 @@
+"""task dependencies
+
+Revision ID: 8b3d5f07c2e6
+Revises: 4f8a2c6e91d3
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b3d5f07c2e6'
+down_revision: Union[str, None] = '4f8a2c6e91d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+READY = "status = 'pending' AND unresolved_dependency_count = 0"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('task_dependencies',
+    sa.Column('task_id', sa.UUID(), nullable=False),
+    sa.Column('depends_on_task_id', sa.UUID(), nullable=False),
+    sa.ForeignKeyConstraint(['depends_on_task_id'], ['tasks.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('task_id', 'depends_on_task_id')
+    )
+    op.create_index('ix_task_dependencies_depends_on_task_id_task_id', 'task_dependencies', ['depends_on_task_id', 'task_id'], unique=False)
+    # Existing tasks have no predecessors, so 0 is their exact count.
+    op.add_column('tasks', sa.Column('unresolved_dependency_count', sa.Integer(), server_default='0', nullable=False))
+    op.create_index('ix_tasks_ready_workspace_id_queue_created_at', 'tasks', ['workspace_id', 'queue', 'created_at', 'id'], unique=False, postgresql_where=sa.text(READY), sqlite_where=sa.text(READY))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_ready_workspace_id_queue_created_at', table_name='tasks', postgresql_where=sa.text(READY), sqlite_where=sa.text(READY))
+    op.drop_column('tasks', 'unresolved_dependency_count')
+    op.drop_index('ix_task_dependencies_depends_on_task_id_task_id', table_name='task_dependencies')
+    op.drop_table('task_dependencies')
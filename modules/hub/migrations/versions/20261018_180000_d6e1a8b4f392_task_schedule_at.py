@@ -0,0 +1,69 @@
+"""task schedule_at
+
+Revision ID: d6e1a8b4f392
+Revises: 8b3d5f07c2e6
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6e1a8b4f392'
+down_revision: Union[str, None] = '8b3d5f07c2e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+READY = "status = 'pending' AND unresolved_dependency_count = 0"
+
+# Head starts in hours; keep in step with app.tasks.tasks.scheduling at the time of this revision.
+PRIORITY_HOURS = {'low': 0, 'normal': 2, 'high': 12, 'critical': 48}
+URGENCY_HOURS = {'low': 0, 'normal': 1, 'high': 4, 'critical': 24}
+DUE_DATE_LEAD_HOURS = 24
+
+
+def _hours(column: str, hours: dict[str, int]) -> str:
+    whens = ' '.join(f"WHEN '{value}' THEN {count}" for value, count in hours.items())
+    return f'(CASE {column} {whens} ELSE {hours["normal"]} END)'
+
+
+def _backfill_sql(dialect: str) -> str:
+    head_start = f"({_hours('priority', PRIORITY_HOURS)} + {_hours('urgency', URGENCY_HOURS)})"
+    if dialect == 'postgresql':
+        # LEAST skips NULLs; due_date is stored without time zone, as UTC
+        return (
+            f"UPDATE tasks SET schedule_at = LEAST(created_at - {head_start} * interval '1 hour', "
+            f"(due_date AT TIME ZONE 'UTC') - interval '{DUE_DATE_LEAD_HOURS} hours')"
+        )
+    enqueued = f"strftime('%Y-%m-%d %H:%M:%f', created_at, '-' || {head_start} || ' hours')"
+    due = f"strftime('%Y-%m-%d %H:%M:%f', due_date, '-{DUE_DATE_LEAD_HOURS} hours')"
+    return (
+        f"UPDATE tasks SET schedule_at = CASE WHEN due_date IS NOT NULL AND {due} < {enqueued} "
+        f"THEN {due} ELSE {enqueued} END"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    op.add_column('tasks', sa.Column('schedule_at', sa.DateTime(timezone=True), nullable=True))
+    op.execute(_backfill_sql(dialect))
+    if dialect == 'postgresql':
+        # SQLite cannot add the constraint in place; the application always sets the column.
+        op.alter_column('tasks', 'schedule_at', existing_type=sa.DateTime(timezone=True), nullable=False)
+
+    op.drop_index('ix_tasks_ready_workspace_id_queue_created_at', table_name='tasks', postgresql_where=sa.text(READY), sqlite_where=sa.text(READY))
+    op.create_index('ix_tasks_ready_workspace_id_queue_schedule_at', 'tasks', ['workspace_id', 'queue', 'schedule_at', 'id'], unique=False, postgresql_where=sa.text(READY), sqlite_where=sa.text(READY))
+    op.create_index('ix_tasks_workspace_id_schedule_at', 'tasks', ['workspace_id', 'schedule_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_workspace_id_schedule_at', table_name='tasks')
+    op.drop_index('ix_tasks_ready_workspace_id_queue_schedule_at', table_name='tasks', postgresql_where=sa.text(READY), sqlite_where=sa.text(READY))
+    op.create_index('ix_tasks_ready_workspace_id_queue_created_at', 'tasks', ['workspace_id', 'queue', 'created_at', 'id'], unique=False, postgresql_where=sa.text(READY), sqlite_where=sa.text(READY))
+    op.drop_column('tasks', 'schedule_at')
@@ -0,0 +1,72 @@
+"""task search
+
+Revision ID: a3c7e92f5d18
+Revises: d6e1a8b4f392
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c7e92f5d18'
+down_revision: Union[str, None] = 'd6e1a8b4f392'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same statements as app.tasks.tasks.search, frozen at this revision.
+POSTGRESQL_DDL = [
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    "ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(result_summary, '')), 'C')) STORED",
+    'CREATE INDEX IF NOT EXISTS ix_tasks_search_vector ON tasks USING gin (search_vector)',
+    'CREATE INDEX IF NOT EXISTS ix_tasks_title_trgm ON tasks USING gin (title gin_trgm_ops)',
+]
+
+SQLITE_DDL = [
+    'CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(task_id UNINDEXED, title, description, result_summary)',
+    'CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN '
+    'INSERT INTO tasks_fts (task_id, title, description, result_summary) '
+    'VALUES (new.id, new.title, new.description, new.result_summary); END',
+    'CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description, result_summary ON tasks BEGIN '
+    'DELETE FROM tasks_fts WHERE task_id = old.id; '
+    'INSERT INTO tasks_fts (task_id, title, description, result_summary) '
+    'VALUES (new.id, new.title, new.description, new.result_summary); END',
+    'CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN '
+    'DELETE FROM tasks_fts WHERE task_id = old.id; END',
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        # The generated column is computed for existing rows when it is added.
+        for statement in POSTGRESQL_DDL:
+            op.execute(statement)
+    elif dialect == 'sqlite':
+        for statement in SQLITE_DDL:
+            op.execute(statement)
+        op.execute(
+            'INSERT INTO tasks_fts (task_id, title, description, result_summary) '
+            'SELECT id, title, description, result_summary FROM tasks'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute('DROP INDEX IF EXISTS ix_tasks_title_trgm')
+        op.execute('DROP INDEX IF EXISTS ix_tasks_search_vector')
+        op.execute('ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector')
+    elif dialect == 'sqlite':
+        for trigger in ('tasks_fts_insert', 'tasks_fts_update', 'tasks_fts_delete'):
+            op.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+        op.execute('DROP TABLE IF EXISTS tasks_fts')
@@ -0,0 +1,47 @@
+"""ai model catalog unique version
+
+Revision ID: f0b4d81c6a27
+Revises: a3c7e92f5d18
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f0b4d81c6a27'
+down_revision: Union[str, None] = 'a3c7e92f5d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Concurrent uploads may have stored the same version twice: the oldest row keeps the number,
+    # the others move past the current maximum in upload order.
+    bind = op.get_bind()
+    rows = bind.execute(sa.text('SELECT id, version FROM ai_model_catalogs ORDER BY version, created_at, id')).all()
+    next_version = max((version for _, version in rows), default=0) + 1
+    seen = set()
+    for catalog_id, version in rows:
+        if version in seen:
+            bind.execute(
+                sa.text('UPDATE ai_model_catalogs SET version = :version WHERE id = :id'),
+                {'version': next_version, 'id': catalog_id},
+            )
+            next_version += 1
+        seen.add(version)
+
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_ai_model_catalogs_version', table_name='ai_model_catalogs', postgresql_concurrently=True)
+        op.create_index('ix_ai_model_catalogs_version', 'ai_model_catalogs', ['version'], unique=True, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_ai_model_catalogs_version', table_name='ai_model_catalogs', postgresql_concurrently=True)
+        op.create_index('ix_ai_model_catalogs_version', 'ai_model_catalogs', ['version'], unique=False, postgresql_concurrently=True)
@@ -0,0 +1,44 @@
+"""task history outlives task
+
+Revision ID: b5e2c7a9d4f1
+Revises: f0b4d81c6a27
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e2c7a9d4f1'
+down_revision: Union[str, None] = 'f0b4d81c6a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _task_fk_name() -> str | None:
+    return op.get_bind().execute(sa.text(
+        "SELECT conname FROM pg_constraint "
+        "WHERE conrelid = 'task_history'::regclass AND confrelid = 'tasks'::regclass AND contype = 'f'"
+    )).scalar()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Task history is append-only and kept when its task is deleted, so task_id stops being a foreign key.
+    # SQLite does not enforce foreign keys unless asked to (the app never does), so only PostgreSQL needs it.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    name = _task_fk_name()
+    if name is not None:
+        op.drop_constraint(name, 'task_history', type_='foreignkey')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('DELETE FROM task_history WHERE NOT EXISTS (SELECT 1 FROM tasks WHERE tasks.id = task_history.task_id)')
+    op.create_foreign_key('task_history_task_id_fkey', 'task_history', 'tasks', ['task_id'], ['id'])
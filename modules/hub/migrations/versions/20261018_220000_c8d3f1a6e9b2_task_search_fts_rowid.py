@@ -0,0 +1,91 @@
+"""task search fts rowid
+
+Revision ID: c8d3f1a6e9b2
+Revises: b5e2c7a9d4f1
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d3f1a6e9b2'
+down_revision: Union[str, None] = 'b5e2c7a9d4f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TRIGGERS = ('tasks_fts_insert', 'tasks_fts_update', 'tasks_fts_delete')
+
+# Same statements as app.tasks.tasks.search, frozen at this revision: the FTS rows are keyed by rowid
+# (through tasks_fts_rowids) so the triggers no longer scan tasks_fts for an UNINDEXED task_id.
+SQLITE_DDL = [
+    'CREATE TABLE IF NOT EXISTS tasks_fts_rowids (rowid INTEGER PRIMARY KEY, task_id CHAR(32) NOT NULL UNIQUE)',
+    'CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(title, description, result_summary)',
+    'CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN '
+    'INSERT INTO tasks_fts_rowids (task_id) VALUES (new.id); '
+    'INSERT INTO tasks_fts (rowid, title, description, result_summary) '
+    'VALUES ((SELECT rowid FROM tasks_fts_rowids WHERE task_id = new.id), '
+    'new.title, new.description, new.result_summary); END',
+    'CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description, result_summary ON tasks BEGIN '
+    'DELETE FROM tasks_fts WHERE rowid = (SELECT rowid FROM tasks_fts_rowids WHERE task_id = old.id); '
+    'INSERT INTO tasks_fts (rowid, title, description, result_summary) '
+    'VALUES ((SELECT rowid FROM tasks_fts_rowids WHERE task_id = new.id), '
+    'new.title, new.description, new.result_summary); END',
+    'CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN '
+    'DELETE FROM tasks_fts WHERE rowid = (SELECT rowid FROM tasks_fts_rowids WHERE task_id = old.id); '
+    'DELETE FROM tasks_fts_rowids WHERE task_id = old.id; END',
+]
+
+# The a3c7e92f5d18 statements, restored on downgrade.
+PREVIOUS_SQLITE_DDL = [
+    'CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(task_id UNINDEXED, title, description, result_summary)',
+    'CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN '
+    'INSERT INTO tasks_fts (task_id, title, description, result_summary) '
+    'VALUES (new.id, new.title, new.description, new.result_summary); END',
+    'CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description, result_summary ON tasks BEGIN '
+    'DELETE FROM tasks_fts WHERE task_id = old.id; '
+    'INSERT INTO tasks_fts (task_id, title, description, result_summary) '
+    'VALUES (new.id, new.title, new.description, new.result_summary); END',
+    'CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN '
+    'DELETE FROM tasks_fts WHERE task_id = old.id; END',
+]
+
+
+def _drop_sqlite_fts() -> None:
+    for trigger in TRIGGERS:
+        op.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+    op.execute('DROP TABLE IF EXISTS tasks_fts')
+    op.execute('DROP TABLE IF EXISTS tasks_fts_rowids')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # PostgreSQL search is unchanged.
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    _drop_sqlite_fts()
+    for statement in SQLITE_DDL:
+        op.execute(statement)
+    op.execute('INSERT INTO tasks_fts_rowids (task_id) SELECT id FROM tasks')
+    op.execute(
+        'INSERT INTO tasks_fts (rowid, title, description, result_summary) '
+        'SELECT tasks_fts_rowids.rowid, tasks.title, tasks.description, tasks.result_summary '
+        'FROM tasks JOIN tasks_fts_rowids ON tasks_fts_rowids.task_id = tasks.id'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    _drop_sqlite_fts()
+    for statement in PREVIOUS_SQLITE_DDL:
+        op.execute(statement)
+    op.execute(
+        'INSERT INTO tasks_fts (task_id, title, description, result_summary) '
+        'SELECT id, title, description, result_summary FROM tasks'
+    )
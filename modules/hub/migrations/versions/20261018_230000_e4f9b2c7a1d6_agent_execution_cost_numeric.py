@@ -0,0 +1,63 @@
+"""agent execution cost numeric
+
+Revision ID: e4f9b2c7a1d6
+Revises: c8d3f1a6e9b2
+Create Date: 2026-10-18 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4f9b2c7a1d6'
+down_revision: Union[str, None] = 'c8d3f1a6e9b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COUNTERS = ('input_tokens', 'output_tokens', 'total_tokens', 'cost')
+
+
+def _rebuild_rollup(dialect: str) -> None:
+    """Recompute the hourly rollup from the executions, as the c91f4d27ab60 backfill does."""
+    if dialect == 'postgresql':
+        bucket = "date_trunc('hour', created_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'"
+        agent_key = "COALESCE(configured_agent_id::text, graph_agent_name, '')"
+    else:
+        bucket = "strftime('%Y-%m-%d %H:00:00.000000', created_at)"
+        dashed = "lower(" + " || '-' || ".join(
+            f"substr(configured_agent_id, {start}, {length})" for start, length in ((1, 8), (9, 4), (13, 4), (17, 4), (21, 12))
+        ) + ")"
+        agent_key = f"COALESCE({dashed}, graph_agent_name, '')"
+    sums = ', '.join(f'COALESCE(SUM({name}), 0)' for name in COUNTERS)
+    op.execute('DELETE FROM agent_execution_usage_hourly')
+    op.execute(
+        f"INSERT INTO agent_execution_usage_hourly (bucket_start, agent_type, agent_key, model_name, execution_count, "
+        f"{', '.join(COUNTERS)}) "
+        f"SELECT {bucket}, agent_type, {agent_key}, COALESCE(model_name, ''), COUNT(*), {sums} "
+        f"FROM agent_executions "
+        f"WHERE {' OR '.join(f'{name} IS NOT NULL' for name in COUNTERS)} "
+        f"GROUP BY 1, 2, 3, 4"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The rollup is maintained by adding and subtracting deltas; binary floats drift, so cost becomes an
+    # exact decimal and the rollup is rebuilt to drop the error accumulated so far.
+    with op.batch_alter_table('agent_executions') as batch_op:
+        batch_op.alter_column('cost', existing_type=sa.Float(), type_=sa.Numeric(18, 8), existing_nullable=True)
+    with op.batch_alter_table('agent_execution_usage_hourly') as batch_op:
+        batch_op.alter_column('cost', existing_type=sa.Float(), type_=sa.Numeric(18, 8), existing_nullable=False)
+    _rebuild_rollup(op.get_bind().dialect.name)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('agent_execution_usage_hourly') as batch_op:
+        batch_op.alter_column('cost', existing_type=sa.Numeric(18, 8), type_=sa.Float(), existing_nullable=False)
+    with op.batch_alter_table('agent_executions') as batch_op:
+        batch_op.alter_column('cost', existing_type=sa.Numeric(18, 8), type_=sa.Float(), existing_nullable=True)
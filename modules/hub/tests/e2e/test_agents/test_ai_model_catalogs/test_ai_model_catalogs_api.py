@@ -0,0 +1,67 @@
+import pytest
+from app.agents.ai_model_catalogs.cache import get_ai_model_catalog_cache
+from app.agents.ai_model_catalogs.schemas import AIModelCatalogRead
+from httpx import AsyncClient
+from tests.utils.assertions import assert_status_code
+
+
+@pytest.mark.e2e
+class TestAIModelCatalogsAPI:
+    _base_url = "/api/v1/ai_model_catalogs"
+
+    async def test_unchanged_catalog_does_not_create_version(self, client: AsyncClient):
+        data = {"models": [{"name": "small", "provider": "a"}, {"name": "large", "provider": "b"}]}
+
+        first = await client.post(self._base_url, json={"data": data})
+        # Same entries in another order
+        again = await client.post(self._base_url, json={"data": {"models": data["models"][::-1]}})
+
+        assert_status_code(first, 201)
+        assert_status_code(again, 200)
+        assert AIModelCatalogRead.model_validate(again.json()).id == AIModelCatalogRead.model_validate(first.json()).id
+
+    async def test_latest_catalog_etag(self, client: AsyncClient):
+        get_ai_model_catalog_cache().clear()
+        await client.post(self._base_url, json={"data": {"models": [{"name": "small", "provider": "a"}]}})
+
+        response = await client.get(f"{self._base_url}/latest")
+        etag = response.headers["ETag"]
+        not_modified = await client.get(f"{self._base_url}/latest", headers={"If-None-Match": etag})
+        yaml_not_modified = await client.get(
+            f"{self._base_url}/download_yaml/latest", headers={"If-None-Match": f"W/{etag}"}
+        )
+
+        assert_status_code(response, 200)
+        assert AIModelCatalogRead.model_validate(response.json()).version == 1
+        assert_status_code(not_modified, 304)
+        assert not_modified.content == b""
+        assert_status_code(yaml_not_modified, 304)
+
+        await client.post(self._base_url, json={"data": {"models": [{"name": "small", "provider": "c"}]}})
+        changed = await client.get(f"{self._base_url}/latest", headers={"If-None-Match": etag})
+
+        assert_status_code(changed, 200)
+        assert changed.headers["ETag"] != etag
+
+    async def test_diff_catalog_versions(self, client: AsyncClient):
+        await client.post(
+            self._base_url,
+            json={"data": {"models": [{"name": "small", "provider": "a"}, {"name": "old", "provider": "a"}]}},
+        )
+        await client.post(
+            self._base_url,
+            json={"data": {"models": [{"name": "small", "provider": "b"}, {"name": "new", "provider": "a"}]}},
+        )
+
+        response = await client.get(f"{self._base_url}/diff", params={"from_version": 1})
+        missing = await client.get(f"{self._base_url}/diff", params={"from_version": 1, "to_version": 9})
+
+        assert_status_code(response, 200)
+        assert response.json() == {
+            "from_version": 1,
+            "to_version": 2,
+            "added": [{"section": "models", "name": "new"}],
+            "removed": [{"section": "models", "name": "old"}],
+            "changed": [{"section": "models", "name": "small"}],
+        }
+        assert_status_code(missing, 404)
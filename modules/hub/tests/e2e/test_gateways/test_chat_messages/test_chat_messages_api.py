@@ -0,0 +1,51 @@
+import pytest
+from app.gateways.chat_messages.repos import ChatMessageRepository
+from app.gateways.conversations.models import Conversation
+from app.gateways.conversations.repos import ConversationRepository
+from app.platform.workspaces.models import Workspace
+from app.platform.workspaces.repos import WorkspaceRepository
+from httpx import AsyncClient
+from tests.utils.assertions import assert_status_code
+
+
+@pytest.mark.e2e
+class TestChatMessagesAPI:
+    _base_url = "/api/v1/workspaces/{workspace_id}/conversations/{conversation_id}/chat_messages"
+
+    @classmethod
+    def base_url(cls, workspace_id, conversation_id) -> str:
+        return cls._base_url.format(workspace_id=workspace_id, conversation_id=conversation_id)
+
+    async def test_filter_chat_messages_by_metadata(self, client: AsyncClient, make_db):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        conversation: Conversation = await make_db(ConversationRepository, workspace_id=workspace.id, context={})
+        match = await make_db(
+            ChatMessageRepository,
+            conversation_id=conversation.id,
+            agent_execution_id=None,
+            metadata_={"channel_message_id": "42", "thread": {"ts": "1.5", "reply": True}},
+        )
+        await make_db(
+            ChatMessageRepository,
+            conversation_id=conversation.id,
+            agent_execution_id=None,
+            metadata_={"channel_message_id": "43", "thread": {"ts": "1.5", "reply": True}},
+        )
+
+        response = await client.get(
+            self.base_url(workspace.id, conversation.id),
+            params={"filter_metadata": '{"channel_message_id": "42", "thread": {"reply": true}}'},
+        )
+
+        assert_status_code(response, 200)
+        assert [item["id"] for item in response.json()["items"]] == [str(match.id)]
+
+    async def test_filter_chat_messages_by_metadata_rejects_non_object(self, client: AsyncClient, make_db):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        conversation: Conversation = await make_db(ConversationRepository, workspace_id=workspace.id, context={})
+
+        response = await client.get(
+            self.base_url(workspace.id, conversation.id), params={"filter_metadata": '["channel_message_id"]'}
+        )
+
+        assert_status_code(response, 400)
@@ -1,3 +1,6 @@
+import datetime
+
+import orjson
 import pytest
 from app.platform.workspaces.models import Workspace
 from app.platform.workspaces.repos import WorkspaceRepository
@@ -102,52 +105,64 @@ class TestTaskHistoriesAPI:
         assert len(response.json()["items"]) == 5
         assert response.json()["total_count"] == 5
 
-    async def test_update_task_history(
+    async def test_get_multi_task_histories_created_range(
         self,
         client: AsyncClient,
         make_db,
+        make_db_batch,
     ):
-        # Create a workspace and task
         workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
         task: Task = await make_db(TaskRepository, workspace_id=workspace.id)
-
-        # Create a task history entry
-        task_history: TaskHistory = await make_db(
+        await make_db_batch(
+            TaskHistoryRepository,
+            2,
+            workspace_id=workspace.id,
+            task_id=task.id,
+            created_at=datetime.datetime(2025, 1, 15, tzinfo=datetime.UTC),
+        )
+        recent = await make_db_batch(
             TaskHistoryRepository,
+            3,
             workspace_id=workspace.id,
             task_id=task.id,
+            created_at=datetime.datetime(2025, 3, 15, tzinfo=datetime.UTC),
         )
 
-        update_data = {"comment": "Updated comment"}
-        response = await client.put(self.base_url(workspace.id, task_history.id), json=update_data)
+        response = await client.get(
+            self.base_url(workspace.id),
+            params={"filter_created_after": "2025-02-01T00:00:00Z", "filter_created_before": "2025-04-01T00:00:00Z"},
+        )
 
         assert_status_code(response, 200)
-        updated_task_history = TaskHistoryRead.model_validate(response.json())
-        assert updated_task_history.comment == "Updated comment"
+        assert sorted(item["id"] for item in response.json()["items"]) == sorted(str(h.id) for h in recent)
 
-    async def test_delete_task_history(
+    async def test_task_history_is_append_only(
         self,
         client: AsyncClient,
         make_db,
     ):
-        # Create a workspace and task
         workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
         task: Task = await make_db(TaskRepository, workspace_id=workspace.id)
+        task_history: TaskHistory = await make_db(TaskHistoryRepository, workspace_id=workspace.id, task_id=task.id)
 
-        # Create a task history entry
-        task_history: TaskHistory = await make_db(
-            TaskHistoryRepository,
-            workspace_id=workspace.id,
-            task_id=task.id,
-        )
-
+        response = await client.put(self.base_url(workspace.id, task_history.id), json={"comment": "Updated"})
+        assert_status_code(response, 405)
         response = await client.delete(self.base_url(workspace.id, task_history.id))
+        assert_status_code(response, 405)
 
-        assert_status_code(response, 200)
-        response_json = response.json()
-        assert "message" in response_json
-        assert response_json["identity"] == str(task_history.id)
+    async def test_export_task_histories(
+        self,
+        client: AsyncClient,
+        make_db,
+        make_db_batch,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        task: Task = await make_db(TaskRepository, workspace_id=workspace.id)
+        histories = await make_db_batch(TaskHistoryRepository, 4, workspace_id=workspace.id, task_id=task.id)
 
-        # Verify deletion
-        response = await client.get(self.base_url(workspace.id, task_history.id))
-        assert_status_code(response, 404)
+        response = await client.get(f"{self.base_url(workspace.id)}/export")
+
+        assert_status_code(response, 200)
+        rows = [orjson.loads(line) for line in response.content.splitlines()]
+        assert sorted(row["id"] for row in rows) == sorted(str(history.id) for history in histories)
+        assert all(row["task_id"] == str(task.id) for row in rows)
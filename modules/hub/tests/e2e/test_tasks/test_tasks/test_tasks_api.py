@@ -1,8 +1,13 @@
+import datetime
+import uuid
+
+import orjson
 import pytest
 from app.platform.workspaces.models import Workspace
 from app.platform.workspaces.repos import WorkspaceRepository
 from app.tasks.task_tags.models import TaskTag
 from app.tasks.task_tags.repos import TaskTagRepository
+from app.tasks.tasks.enum import TaskQueue, TaskStatus
 from app.tasks.tasks.models import Task
 from app.tasks.tasks.repos import TaskRepository
 from app.tasks.tasks.schemas import TaskCreate, TaskRead, TaskUpdate
@@ -89,6 +94,99 @@ class TestTasksAPI:
         assert len(response.json()["items"]) == 5
         assert response.json()["total_count"] == 5
 
+    async def test_get_multi_tasks_by_cursor(
+        self,
+        client: AsyncClient,
+        make_db,
+        make_db_batch,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        tasks = await make_db_batch(TaskRepository, 5, workspace_id=workspace.id)
+
+        seen = []
+        cursor = ""
+        for _ in range(3):
+            response = await client.get(self.base_url(workspace.id), params={"cursor": cursor, "limit": 2})
+            assert_status_code(response, 200)
+            assert "total_count" not in response.json()
+            seen.extend(item["id"] for item in response.json()["items"])
+            cursor = response.json()["next_cursor"]
+            if cursor is None:
+                break
+
+        assert cursor is None
+        assert sorted(seen) == sorted(str(task.id) for task in tasks)
+
+    async def test_get_multi_tasks_invalid_cursor(
+        self,
+        client: AsyncClient,
+        make_db,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+
+        response = await client.get(self.base_url(workspace.id), params={"cursor": "not-a-cursor"})
+
+        assert_status_code(response, 400)
+
+    async def test_get_tasks_filtered_by_tags(
+        self,
+        client: AsyncClient,
+        make_db,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        titles_by_tags = {"Bug in UI": ["bug", "ui"], "Bug": ["bug"], "UI docs": ["ui", "docs"], "Untagged": []}
+        for title, tags in titles_by_tags.items():
+            response = await client.post(
+                self.base_url(workspace.id), json=TaskCreate(title=title, tags=tags).model_dump()
+            )
+            assert_status_code(response, 201)
+
+        async def titles(params: dict) -> set[str]:
+            response = await client.get(self.base_url(workspace.id), params=params)
+            assert_status_code(response, 200)
+            return {task["title"] for task in response.json()["items"]}
+
+        assert await titles({"filter_tags_any": ["bug", "docs"]}) == {"Bug in UI", "Bug", "UI docs"}
+        assert await titles({"filter_tags_all": ["bug", "ui"]}) == {"Bug in UI"}
+        assert await titles({"filter_tags_none": ["ui"]}) == {"Bug", "Untagged"}
+        assert await titles({"filter_tags_any": ["ui"], "filter_tags_none": ["docs"]}) == {"Bug in UI"}
+
+    async def test_export_tasks(
+        self,
+        client: AsyncClient,
+        make_db,
+        make_db_batch,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        other_workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        tasks = await make_db_batch(TaskRepository, 3, workspace_id=workspace.id, status=TaskStatus.DONE.value)
+        await make_db(TaskRepository, workspace_id=workspace.id, status=TaskStatus.PENDING.value)
+        await make_db(TaskRepository, workspace_id=other_workspace.id, status=TaskStatus.DONE.value)
+
+        response = await client.get(f"{self.base_url(workspace.id)}/export", params={"filter_status": "done"})
+
+        assert_status_code(response, 200)
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [orjson.loads(line) for line in response.content.splitlines()]
+        assert sorted(row["id"] for row in rows) == sorted(str(task.id) for task in tasks)
+        assert all(row["tags"] == [] for row in rows)
+
+    async def test_export_tasks_invalid_workspace(
+        self,
+        client: AsyncClient,
+    ):
+        response = await client.get(f"{self.base_url(uuid.uuid4())}/export")
+
+        assert_status_code(response, 404)
+
+    async def test_stream_task_events_invalid_workspace(
+        self,
+        client: AsyncClient,
+    ):
+        response = await client.get(f"{self.base_url(uuid.uuid4())}/events")
+
+        assert_status_code(response, 404)
+
     async def test_update_task(
         self,
         client: AsyncClient,
@@ -149,3 +247,84 @@ class TestTasksAPI:
         # Verify deletion
         response = await client.get(self.base_url(workspace.id, task.id))
         assert_status_code(response, 404)
+
+    async def test_claim_tasks(
+        self,
+        client: AsyncClient,
+        make_db,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        task: Task = await make_db(
+            TaskRepository,
+            workspace_id=workspace.id,
+            queue=TaskQueue.LOCAL_AGENT.value,
+            status=TaskStatus.PENDING.value,
+        )
+
+        response = await client.post(
+            f"{self.base_url(workspace.id)}/claim",
+            params={"queue": TaskQueue.LOCAL_AGENT.value, "limit": 5, "worker_id": "worker-1"},
+        )
+
+        assert_status_code(response, 200)
+        claimed = [TaskRead.model_validate(item) for item in response.json()]
+        assert [t.id for t in claimed] == [task.id]
+        assert claimed[0].status == TaskStatus.IN_PROGRESS
+        assert claimed[0].lease_owner == "worker-1"
+
+        # Nothing left to claim
+        response = await client.post(
+            f"{self.base_url(workspace.id)}/claim",
+            params={"queue": TaskQueue.LOCAL_AGENT.value, "worker_id": "worker-1"},
+        )
+        assert_status_code(response, 200)
+        assert response.json() == []
+
+    async def test_heartbeat_task(
+        self,
+        client: AsyncClient,
+        make_db,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        task: Task = await make_db(
+            TaskRepository,
+            workspace_id=workspace.id,
+            status=TaskStatus.IN_PROGRESS.value,
+            lease_owner="worker-1",
+            lease_expires_at=datetime.datetime(2000, 1, 1, tzinfo=datetime.UTC),
+        )
+
+        response = await client.post(
+            f"{self.base_url(workspace.id, task.id)}/heartbeat", json={"worker_id": "worker-1", "lease_seconds": 120}
+        )
+        assert_status_code(response, 200)
+        heartbeat = TaskRead.model_validate(response.json())
+        assert heartbeat.lease_owner == "worker-1"
+        assert heartbeat.lease_expires_at.year > 2000
+
+        # A different worker does not hold the lease
+        response = await client.post(
+            f"{self.base_url(workspace.id, task.id)}/heartbeat", json={"worker_id": "worker-2"}
+        )
+        assert_status_code(response, 409)
+
+    async def test_create_tasks_batch(
+        self,
+        client: AsyncClient,
+        make_db,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        payload = {
+            "items": [
+                TaskCreate(title="Batch Task 1", tags=["import"]).model_dump(),
+                TaskCreate(title="Batch Task 2").model_dump(),
+            ]
+        }
+
+        response = await client.post(f"{self.base_url(workspace.id)}:batch", json=payload)
+
+        assert_status_code(response, 201)
+        created = [TaskRead.model_validate(item) for item in response.json()]
+        assert [t.title for t in created] == ["Batch Task 1", "Batch Task 2"]
+        assert [tag.name for tag in created[0].tags] == ["import"]
+        assert created[1].tags == []
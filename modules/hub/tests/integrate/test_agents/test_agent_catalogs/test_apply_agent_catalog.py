@@ -0,0 +1,93 @@
+import pytest
+from app.agents.agent_catalogs.schemas import AgentCatalog
+from app.agents.agent_catalogs.usecases.apply import ApplyAgentCatalogUseCase
+from app.agents.agent_skills.repos import AgentSkillRepository
+from app.agents.configured_agents.models import ConfiguredAgent
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.utils.fastapi import resolve_dependency
+
+CATALOG = {
+    "skills": [{"name": "jr_cli", "skill_path": "skills/jr_cli/SKILL.md"}],
+    "mcps": [{"name": "dagster", "connection_config": {"url": "http://localhost:3000"}}],
+    "configured_agents": [
+        {
+            "name": "code-reviewer",
+            "model": "llm-high-performance",
+            "system_prompt": "You review code.",
+            "skills": ["jr_cli"],
+            "mcps": ["dagster"],
+            "config": {"temperature": 0.3},
+        }
+    ],
+}
+
+
+@pytest.mark.integrate
+class TestApplyAgentCatalog:
+    async def test_apply_agent_catalog(
+        self,
+        inspect_session: AsyncSession,
+    ):
+        use_case = resolve_dependency(ApplyAgentCatalogUseCase)
+        catalog = AgentCatalog.model_validate(CATALOG)
+
+        plan = await use_case.execute(catalog, dry_run=True)
+        assert [(c.action, c.kind, c.name) for c in plan.changes] == [
+            ("create", "skill", "jr_cli"),
+            ("create", "mcp", "dagster"),
+            ("create", "configured_agent", "code-reviewer"),
+        ]
+        assert await inspect_session.scalar(select(func.count()).select_from(ConfiguredAgent)) == 0
+
+        await use_case.execute(catalog)
+        agent = await inspect_session.scalar(select(ConfiguredAgent).where(ConfiguredAgent.name == "code-reviewer"))
+        assert agent.model_name == "llm-high-performance"
+        assert [skill.name for skill in agent.skills] == ["jr_cli"]
+        assert [mcp.mcp_endpoint for mcp in agent.mcps] == ["http://localhost:3000"]
+
+        assert (await use_case.execute(catalog)).is_empty
+
+    async def test_apply_agent_catalog_update_and_prune(
+        self,
+        session: AsyncSession,
+        make_db,
+    ):
+        await make_db(AgentSkillRepository, name="stale_skill")
+        await session.commit()
+        use_case = resolve_dependency(ApplyAgentCatalogUseCase)
+        await use_case.execute(AgentCatalog.model_validate(CATALOG))
+
+        changed = {**CATALOG, "configured_agents": [{**CATALOG["configured_agents"][0], "skills": []}]}
+        plan = await use_case.execute(AgentCatalog.model_validate(changed), prune=True)
+
+        assert [(c.action, c.kind, c.name, c.fields) for c in plan.changes] == [
+            ("update", "configured_agent", "code-reviewer", ["skills"]),
+            ("delete", "skill", "jr_cli", []),
+            ("delete", "skill", "stale_skill", []),
+        ]
+
+    async def test_apply_agent_catalog_skill_change_bumps_linked_agent(
+        self,
+        inspect_session: AsyncSession,
+    ):
+        use_case = resolve_dependency(ApplyAgentCatalogUseCase)
+        await use_case.execute(AgentCatalog.model_validate(CATALOG))
+        updated_at = select(ConfiguredAgent.updated_at).where(ConfiguredAgent.name == "code-reviewer")
+        before = await inspect_session.scalar(updated_at)
+
+        changed = {**CATALOG, "skills": [{"name": "jr_cli", "skill_path": "skills/jr_cli/v2/SKILL.md"}]}
+        plan = await use_case.execute(AgentCatalog.model_validate(changed))
+
+        # Only the skill is reported, but the agent's resolved snapshot depends on it
+        assert [(c.action, c.kind, c.name) for c in plan.changes] == [("update", "skill", "jr_cli")]
+        assert await inspect_session.scalar(updated_at) > before
+
+    async def test_apply_agent_catalog_unknown_reference(self):
+        use_case = resolve_dependency(ApplyAgentCatalogUseCase)
+        catalog = AgentCatalog.model_validate(
+            {"configured_agents": [{"name": "lonely", "model": "llm-default", "skills": ["missing"]}]}
+        )
+
+        with pytest.raises(ValueError, match="missing"):
+            await use_case.execute(catalog)
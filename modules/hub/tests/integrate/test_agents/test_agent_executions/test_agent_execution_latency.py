@@ -0,0 +1,39 @@
+import datetime
+
+import pytest
+from app.agents.agent_executions.latency import get_execution_latency_collector
+from app.agents.agent_executions.schemas import AgentExecutionCreate, AgentExecutionUpdate
+from app.agents.agent_executions.usecases.crud import CreateAgentExecutionUseCase, UpdateAgentExecutionUseCase
+from app.agents.agent_executions.usecases.latency import GetAgentExecutionLatencyUseCase
+from tests.utils.fastapi import resolve_dependency
+
+
+@pytest.mark.integrate
+class TestAgentExecutionLatency:
+    async def test_latency_recorded_on_completion(self):
+        get_execution_latency_collector().clear()
+        create = resolve_dependency(CreateAgentExecutionUseCase)
+        update = resolve_dependency(UpdateAgentExecutionUseCase)
+        latency = resolve_dependency(GetAgentExecutionLatencyUseCase)
+        started_at = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+
+        execution = await create.execute(
+            AgentExecutionCreate(
+                agent_type="graph",
+                graph_agent_name="planner",
+                execution_type="task_processing",
+                status="running",
+                started_at=started_at,
+            )
+        )
+        assert await latency.execute() == []
+
+        completion = AgentExecutionUpdate(status="success", completed_at=started_at + datetime.timedelta(seconds=3))
+        await update.execute(execution.id, completion)
+        # Repeating the terminal update is not a second completion
+        await update.execute(execution.id, completion)
+        [summary] = await latency.execute({"agent": "planner"})
+
+        assert (summary.execution_type, summary.status, summary.count) == ("task_processing", "success", 1)
+        assert summary.p50 == summary.p99 == summary.max == 3.0
+        assert await latency.execute({"status": "failed"}) == []
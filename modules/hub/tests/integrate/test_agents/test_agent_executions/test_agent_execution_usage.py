@@ -0,0 +1,44 @@
+import pytest
+from app.agents.agent_executions.schemas import AgentExecutionCreate, AgentExecutionUpdate
+from app.agents.agent_executions.usecases.crud import CreateAgentExecutionUseCase, UpdateAgentExecutionUseCase
+from app.agents.agent_executions.usecases.usage import GetAgentExecutionUsageUseCase
+from tests.utils.fastapi import resolve_dependency
+
+
+@pytest.mark.integrate
+class TestAgentExecutionUsage:
+    async def test_usage_rollup_follows_execution_writes(self):
+        create = resolve_dependency(CreateAgentExecutionUseCase)
+        update = resolve_dependency(UpdateAgentExecutionUseCase)
+        usage = resolve_dependency(GetAgentExecutionUsageUseCase)
+
+        execution = await create.execute(
+            AgentExecutionCreate(
+                agent_type="graph",
+                graph_agent_name="router",
+                execution_type="routing_decision",
+                token_usage={"prompt_tokens": 10, "completion_tokens": 5, "model": "small"},
+            )
+        )
+        await create.execute(
+            AgentExecutionCreate(agent_type="graph", graph_agent_name="router", execution_type="routing_decision")
+        )
+
+        assert execution.input_tokens == 10
+        assert execution.total_tokens == 15
+
+        # A second report for the same execution replaces its contribution instead of adding to it
+        await update.execute(
+            execution.id,
+            AgentExecutionUpdate(token_usage={"input_tokens": 12, "output_tokens": 8, "model": "small", "cost": 0.25}),
+        )
+        [total] = await usage.execute("total")
+
+        assert total.bucket_start is None
+        assert (total.agent_key, total.model_name) == ("router", "small")
+        assert total.execution_count == 1
+        assert (total.input_tokens, total.output_tokens, total.total_tokens) == (12, 8, 20)
+        assert total.cost == pytest.approx(0.25)
+        [hourly] = await usage.execute("hour")
+        assert hourly.bucket_start is not None
+        assert hourly.total_tokens == 20
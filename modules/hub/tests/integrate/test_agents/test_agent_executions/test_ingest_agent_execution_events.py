@@ -0,0 +1,123 @@
+import uuid
+
+import pytest
+from app.agents.agent_executions.enum import AgentExecutionStatus
+from app.agents.agent_executions.ingest import get_agent_execution_ingest_buffer
+from app.agents.agent_executions.models import AgentExecution
+from app.agents.agent_executions.schemas import AgentExecutionEvent, AgentExecutionEventBatch
+from app.agents.agent_executions.usecases.ingest import (
+    FlushAgentExecutionEventsUseCase,
+    IngestAgentExecutionEventsUseCase,
+)
+from app_base.base.exceptions.basic import BadRequestException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.utils.fastapi import resolve_dependency
+
+
+def _created(execution_id: uuid.UUID, **kwargs) -> AgentExecutionEvent:
+    return AgentExecutionEvent(
+        id=execution_id, agent_type="graph", graph_agent_name="router", execution_type="routing_decision", **kwargs
+    )
+
+
+@pytest.mark.integrate
+class TestIngestAgentExecutionEvents:
+    async def test_events_coalesced_and_flushed(self, inspect_session: AsyncSession):
+        get_agent_execution_ingest_buffer().drain()
+        ingest = resolve_dependency(IngestAgentExecutionEventsUseCase)
+        flush = resolve_dependency(FlushAgentExecutionEventsUseCase)
+        done_id, running_id = uuid.uuid4(), uuid.uuid4()
+
+        result = await ingest.execute(
+            AgentExecutionEventBatch(
+                events=[
+                    _created(done_id),
+                    _created(running_id, status="running"),
+                    AgentExecutionEvent(id=done_id, status="running"),
+                    AgentExecutionEvent(id=done_id, status="success", token_usage={"total_tokens": 12}),
+                    # Late duplicate delivery must not move the execution back
+                    AgentExecutionEvent(id=done_id, status="running"),
+                ]
+            )
+        )
+
+        assert result.accepted == 5
+        assert result.buffered == 2
+        assert await flush.execute() == 2
+
+        rows = {
+            row.id: row
+            for row in await inspect_session.scalars(
+                select(AgentExecution).where(AgentExecution.id.in_([done_id, running_id]))
+            )
+        }
+        assert rows[done_id].status == AgentExecutionStatus.SUCCESS
+        assert rows[done_id].token_usage == {"total_tokens": 12}
+        assert rows[running_id].status == AgentExecutionStatus.RUNNING
+
+        await ingest.execute(
+            AgentExecutionEventBatch(
+                events=[
+                    AgentExecutionEvent(id=running_id, status="failed", error_message="boom"),
+                    AgentExecutionEvent(id=done_id, status="pending"),
+                ]
+            )
+        )
+        assert await flush.execute() == 2
+
+        inspect_session.expire_all()
+        rows = {
+            row.id: row
+            for row in await inspect_session.scalars(
+                select(AgentExecution).where(AgentExecution.id.in_([done_id, running_id]))
+            )
+        }
+        assert rows[running_id].status == AgentExecutionStatus.FAILED
+        assert rows[running_id].error_message == "boom"
+        assert rows[done_id].status == AgentExecutionStatus.SUCCESS
+
+    async def test_events_with_unknown_references_are_rejected(self):
+        buffer = get_agent_execution_ingest_buffer()
+        buffer.drain()
+        ingest = resolve_dependency(IngestAgentExecutionEventsUseCase)
+
+        with pytest.raises(BadRequestException):
+            await ingest.execute(AgentExecutionEventBatch(events=[_created(uuid.uuid4(), task_id=uuid.uuid4())]))
+        assert len(buffer) == 0
+
+    async def test_invalid_row_does_not_drop_the_others(self, inspect_session: AsyncSession):
+        buffer = get_agent_execution_ingest_buffer()
+        buffer.drain()
+        ingest = resolve_dependency(IngestAgentExecutionEventsUseCase)
+        flush = resolve_dependency(FlushAgentExecutionEventsUseCase)
+        valid_id, invalid_id = uuid.uuid4(), uuid.uuid4()
+
+        await ingest.execute(AgentExecutionEventBatch(events=[_created(valid_id, status="running")]))
+        # A row the database rejects (here: a missing NOT NULL column) is dropped on its own
+        buffer.restore([{"id": invalid_id, "agent_type": "graph", "execution_type": None}])
+
+        assert await flush.execute() == 1
+        assert len(buffer) == 0
+        rows = await inspect_session.scalars(
+            select(AgentExecution.id).where(AgentExecution.id.in_([valid_id, invalid_id]))
+        )
+        assert list(rows) == [valid_id]
+
+    async def test_change_flushed_before_create_is_deferred(self, inspect_session: AsyncSession):
+        buffer = get_agent_execution_ingest_buffer()
+        buffer.drain()
+        ingest = resolve_dependency(IngestAgentExecutionEventsUseCase)
+        flush = resolve_dependency(FlushAgentExecutionEventsUseCase)
+        execution_id = uuid.uuid4()
+
+        # Another replica still buffers the create: the change waits for it instead of being lost
+        await ingest.execute(AgentExecutionEventBatch(events=[AgentExecutionEvent(id=execution_id, status="success")]))
+        assert await flush.execute() == 0
+        assert len(buffer) == 1
+
+        await ingest.execute(AgentExecutionEventBatch(events=[_created(execution_id, status="running")]))
+        assert await flush.execute() == 1
+        assert len(buffer) == 0
+        execution = await inspect_session.get(AgentExecution, execution_id)
+        assert execution.status == AgentExecutionStatus.SUCCESS
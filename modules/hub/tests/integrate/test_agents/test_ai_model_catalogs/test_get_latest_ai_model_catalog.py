@@ -0,0 +1,61 @@
+import pytest
+from app.agents.ai_model_catalogs.cache import get_ai_model_catalog_cache
+from app.agents.ai_model_catalogs.schemas import AIModelCatalogCreate
+from app.agents.ai_model_catalogs.services import AIModelCatalogService
+from app.agents.ai_model_catalogs.usecases.crud import CreateAIModelCatalogUseCase, DeleteAIModelCatalogUseCase
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.utils.fastapi import resolve_dependency
+
+
+@pytest.mark.integrate
+class TestGetLatestAIModelCatalog:
+    async def test_latest_catalog_cached_per_version(
+        self,
+        session: AsyncSession,
+    ):
+        get_ai_model_catalog_cache().clear()
+        create_use_case = resolve_dependency(CreateAIModelCatalogUseCase)
+        service = resolve_dependency(AIModelCatalogService)
+
+        await create_use_case.execute(AIModelCatalogCreate(data={"models": [{"name": "small", "provider": "a"}]}))
+        first = await service.get_latest_ai_model(session)
+        again = await service.get_latest_ai_model(session)
+
+        assert first is not None
+        assert first.catalog.version == 1
+        assert again is first
+        assert first.models == {"small": {"name": "small", "provider": "a"}}
+
+        await create_use_case.execute(AIModelCatalogCreate(data={"models": {"large": {"provider": "b"}}}))
+        latest = await service.get_latest_ai_model(session)
+        spec = await service.get_latest_model_spec(session, "large")
+
+        assert latest.catalog.version == 2
+        assert spec == {"provider": "b"}
+
+    async def test_reused_version_is_not_served_from_cache(
+        self,
+        session: AsyncSession,
+    ):
+        get_ai_model_catalog_cache().clear()
+        create_use_case = resolve_dependency(CreateAIModelCatalogUseCase)
+        delete_use_case = resolve_dependency(DeleteAIModelCatalogUseCase)
+        service = resolve_dependency(AIModelCatalogService)
+
+        await create_use_case.execute(AIModelCatalogCreate(data={"models": {"small": {"provider": "a"}}}))
+        deleted, _ = await create_use_case.execute(AIModelCatalogCreate(data={"models": {"large": {"provider": "b"}}}))
+        cached = await service.get_latest_ai_model(session)
+        await session.commit()
+
+        # Deleting the newest version frees its number for the next upload
+        await delete_use_case.execute(deleted.id)
+        replacement, created = await create_use_case.execute(
+            AIModelCatalogCreate(data={"models": {"medium": {"provider": "c"}}})
+        )
+        latest = await service.get_latest_ai_model(session)
+
+        assert created
+        assert replacement.version == cached.catalog.version == 2
+        assert latest.catalog.id == replacement.id
+        assert latest.etag != cached.etag
+        assert set(latest.models) == {"medium"}
@@ -1,4 +1,8 @@
+import uuid
+
 import pytest
+from app.agents.agent_mcps.repos import AgentMCPRepository
+from app.agents.agent_skills.repos import AgentSkillRepository
 from app.agents.configured_agents.models import ConfiguredAgent
 from app.agents.configured_agents.schemas import ConfiguredAgentCreate
 from app.agents.configured_agents.usecases.crud import CreateConfiguredAgentUseCase
@@ -25,3 +29,23 @@ class TestCreateConfiguredAgent:
         db_agent = await session.get(ConfiguredAgent, result.id)
         assert db_agent is not None
         assert db_agent.name == "Integration Agent"
+
+    async def test_create_configured_agent_with_duplicate_link_ids(self, make_db):
+        skill = await make_db(AgentSkillRepository)
+        mcp = await make_db(AgentMCPRepository)
+        use_case = resolve_dependency(CreateConfiguredAgentUseCase)
+
+        agent_in = ConfiguredAgentCreate(
+            name="Linked Agent", model_name="gpt-4", skill_ids=[skill.id, skill.id], mcp_ids=[mcp.id]
+        )
+        result = await use_case.execute(agent_in)
+
+        assert [s.id for s in result.skills] == [skill.id]
+        assert [m.id for m in result.mcps] == [mcp.id]
+
+    async def test_create_configured_agent_invalid_skill_id(self):
+        use_case = resolve_dependency(CreateConfiguredAgentUseCase)
+
+        agent_in = ConfiguredAgentCreate(name="Broken Agent", model_name="gpt-4", skill_ids=[uuid.uuid4()])
+        with pytest.raises(ValueError):
+            await use_case.execute(agent_in)
@@ -0,0 +1,92 @@
+import uuid
+
+import pytest
+from app.agents.agent_mcps.repos import AgentMCPRepository
+from app.agents.agent_skills.models import AgentSkill
+from app.agents.agent_skills.repos import AgentSkillRepository
+from app.agents.ai_model_catalogs.cache import get_ai_model_catalog_cache
+from app.agents.ai_model_catalogs.repos import AIModelCatalogRepository
+from app.agents.ai_model_catalogs.schemas import AIModelCatalogCreate
+from app.agents.ai_model_catalogs.usecases.crud import CreateAIModelCatalogUseCase, DeleteAIModelCatalogUseCase
+from app.agents.configured_agents.cache import get_resolved_agent_cache
+from app.agents.configured_agents.models import ConfiguredAgent
+from app.agents.configured_agents.repos import ConfiguredAgentRepository
+from app.agents.configured_agents.schemas import ConfiguredAgentUpdate
+from app.agents.configured_agents.usecases.crud import UpdateConfiguredAgentUseCase
+from app.agents.configured_agents.usecases.resolve import GetResolvedConfiguredAgentUseCase
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.utils.fastapi import resolve_dependency
+
+
+@pytest.mark.integrate
+class TestGetResolvedConfiguredAgent:
+    async def test_get_resolved_configured_agent(
+        self,
+        session: AsyncSession,
+        make_db,
+    ):
+        get_ai_model_catalog_cache().clear()
+        get_resolved_agent_cache().clear()
+        await make_db(AIModelCatalogRepository, version=1, data={"models": [{"name": "gpt-4", "max_tokens": 8192}]})
+        skill: AgentSkill = await make_db(AgentSkillRepository, skill_path="/skills/search", is_active=True)
+        inactive_skill: AgentSkill = await make_db(AgentSkillRepository, is_active=False)
+        mcp = await make_db(AgentMCPRepository, mcp_endpoint="http://mcp.local", is_active=True)
+        agent: ConfiguredAgent = await make_db(
+            ConfiguredAgentRepository,
+            model_name="gpt-4",
+            system_prompt="Be brief.",
+            config={"temperature": 0.2},
+            skills=[skill, inactive_skill],
+            mcps=[mcp],
+        )
+        await session.commit()
+
+        use_case = resolve_dependency(GetResolvedConfiguredAgentUseCase)
+        resolved = await use_case.execute(agent.id)
+
+        assert resolved is not None
+        assert resolved.model_spec == {"name": "gpt-4", "max_tokens": 8192}
+        assert resolved.catalog_version == 1
+        assert resolved.model_args == {"temperature": 0.2}
+        assert resolved.system_prompt == "Be brief."
+        assert [s.skill_path for s in resolved.skills] == ["/skills/search"]
+        assert [m.mcp_endpoint for m in resolved.mcps] == ["http://mcp.local"]
+        assert await use_case.execute(agent.id) is resolved
+
+        update_use_case = resolve_dependency(UpdateConfiguredAgentUseCase)
+        await update_use_case.execute(agent.id, ConfiguredAgentUpdate(system_prompt="Be thorough."))
+
+        refreshed = await use_case.execute(agent.id)
+        assert refreshed is not resolved
+        assert refreshed.system_prompt == "Be thorough."
+
+    async def test_reused_catalog_version_is_not_served_from_cache(
+        self,
+        session: AsyncSession,
+        make_db,
+    ):
+        get_ai_model_catalog_cache().clear()
+        get_resolved_agent_cache().clear()
+        create_catalog = resolve_dependency(CreateAIModelCatalogUseCase)
+        await create_catalog.execute(AIModelCatalogCreate(data={"models": {"gpt-4": {"max_tokens": 8192}}}))
+        newest, _ = await create_catalog.execute(AIModelCatalogCreate(data={"models": {"gpt-4": {"max_tokens": 1}}}))
+        agent: ConfiguredAgent = await make_db(ConfiguredAgentRepository, model_name="gpt-4")
+        await session.commit()
+        use_case = resolve_dependency(GetResolvedConfiguredAgentUseCase)
+        resolved = await use_case.execute(agent.id)
+
+        # Deleting the newest version frees its number for the next upload
+        await resolve_dependency(DeleteAIModelCatalogUseCase).execute(newest.id)
+        replacement, _ = await create_catalog.execute(
+            AIModelCatalogCreate(data={"models": {"gpt-4": {"max_tokens": 4096}}})
+        )
+        refreshed = await use_case.execute(agent.id)
+
+        assert replacement.version == resolved.catalog_version == refreshed.catalog_version
+        assert refreshed.catalog_id == replacement.id
+        assert refreshed.model_spec == {"max_tokens": 4096}
+
+    async def test_get_resolved_configured_agent_not_found(self):
+        use_case = resolve_dependency(GetResolvedConfiguredAgentUseCase)
+
+        assert await use_case.execute(uuid.uuid4()) is None
@@ -0,0 +1,56 @@
+import pytest
+from app.agents.agent_mcps.repos import AgentMCPRepository
+from app.agents.agent_skills.repos import AgentSkillRepository
+from app.agents.configured_agents.models import ConfiguredAgentMCP, ConfiguredAgentSkill
+from app.agents.configured_agents.repos import ConfiguredAgentRepository
+from app.agents.configured_agents.schemas import ConfiguredAgentUpdate
+from app.agents.configured_agents.usecases.crud import UpdateConfiguredAgentUseCase
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.utils.fastapi import resolve_dependency
+
+
+@pytest.mark.integrate
+class TestUpdateConfiguredAgent:
+    async def test_update_configured_agent_replaces_links(
+        self,
+        session: AsyncSession,
+        inspect_session: AsyncSession,
+        make_db,
+    ):
+        kept, dropped, added = [await make_db(AgentSkillRepository) for _ in range(3)]
+        mcp = await make_db(AgentMCPRepository)
+        agent = await make_db(ConfiguredAgentRepository, skills=[kept, dropped], mcps=[mcp])
+        await session.commit()
+        use_case = resolve_dependency(UpdateConfiguredAgentUseCase)
+
+        result = await use_case.execute(agent.id, ConfiguredAgentUpdate(skill_ids=[kept.id, added.id, added.id]))
+
+        assert {s.id for s in result.skills} == {kept.id, added.id}
+        skill_ids = set(
+            await inspect_session.scalars(
+                select(ConfiguredAgentSkill.skill_id).where(ConfiguredAgentSkill.agent_id == agent.id)
+            )
+        )
+        assert skill_ids == {kept.id, added.id}
+        # mcp_ids not given: MCP links are left alone
+        mcp_ids = set(
+            await inspect_session.scalars(
+                select(ConfiguredAgentMCP.mcp_id).where(ConfiguredAgentMCP.agent_id == agent.id)
+            )
+        )
+        assert mcp_ids == {mcp.id}
+
+    async def test_update_configured_agent_clears_links(
+        self,
+        session: AsyncSession,
+        make_db,
+    ):
+        mcp = await make_db(AgentMCPRepository)
+        agent = await make_db(ConfiguredAgentRepository, mcps=[mcp])
+        await session.commit()
+        use_case = resolve_dependency(UpdateConfiguredAgentUseCase)
+
+        result = await use_case.execute(agent.id, ConfiguredAgentUpdate(mcp_ids=[]))
+
+        assert result.mcps == []
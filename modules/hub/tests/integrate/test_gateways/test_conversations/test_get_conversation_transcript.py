@@ -0,0 +1,73 @@
+import datetime
+import uuid
+
+import pytest
+from app.agents.agent_executions.repos import AgentExecutionRepository
+from app.gateways.chat_messages.repos import ChatMessageRepository
+from app.gateways.conversations.repos import ConversationRepository
+from app.gateways.conversations.usecases.transcript import GetConversationTranscriptUseCase
+from app.gateways.routing_logs.repos import RoutingLogRepository
+from app.platform.workspaces.repos import WorkspaceRepository
+from app_base.base.exceptions.basic import NotFoundException
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.utils.fastapi import resolve_dependency
+
+
+@pytest.mark.integrate
+class TestGetConversationTranscript:
+    async def test_transcript_windows_oldest_first(self, session: AsyncSession, make_db):
+        workspace = await make_db(WorkspaceRepository, is_default=False)
+        conversation = await make_db(ConversationRepository, workspace_id=workspace.id, context={})
+        execution = await make_db(
+            AgentExecutionRepository,
+            agent_type="graph",
+            graph_agent_name="responder",
+            execution_type="chat_response",
+            status="success",
+            configured_agent_id=None,
+            task_id=None,
+            total_tokens=42,
+        )
+        base = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+        messages = []
+        for i in range(5):
+            messages.append(
+                await make_db(
+                    ChatMessageRepository,
+                    conversation_id=conversation.id,
+                    role="assistant" if i % 2 else "user",
+                    content=f"message {i}",
+                    agent_execution_id=execution.id if i % 2 else None,
+                    created_at=base + datetime.timedelta(minutes=i),
+                )
+            )
+        await make_db(
+            RoutingLogRepository,
+            message_id=messages[4].id,
+            routing_result="new_task",
+            target_task_id=None,
+            target_agent_id=None,
+        )
+
+        use_case = resolve_dependency(GetConversationTranscriptUseCase)
+        context = {"parent_id": workspace.id}
+
+        latest = await use_case.execute(conversation.id, 2, context=context)
+        assert [m.content for m in latest.messages] == ["message 3", "message 4"]
+        assert latest.messages[0].agent_execution.total_tokens == 42
+        assert [log.routing_result for log in latest.messages[1].routing_logs] == ["new_task"]
+        assert latest.next_cursor is not None
+
+        older = await use_case.execute(conversation.id, 10, latest.next_cursor, context=context)
+        assert [m.content for m in older.messages] == ["message 0", "message 1", "message 2"]
+        assert older.messages[0].agent_execution is None
+        assert older.next_cursor is None
+
+    async def test_transcript_of_other_workspace_not_found(self, session: AsyncSession, make_db):
+        workspace = await make_db(WorkspaceRepository, is_default=False)
+        conversation = await make_db(ConversationRepository, workspace_id=workspace.id, context={})
+
+        use_case = resolve_dependency(GetConversationTranscriptUseCase)
+
+        with pytest.raises(NotFoundException):
+            await use_case.execute(conversation.id, 10, context={"parent_id": uuid.uuid4()})
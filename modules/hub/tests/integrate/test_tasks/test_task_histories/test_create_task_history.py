@@ -1,3 +1,5 @@
+import uuid
+
 import pytest
 from app.platform.workspaces.models import Workspace
 from app.platform.workspaces.repos import WorkspaceRepository
@@ -7,6 +9,7 @@ from app.tasks.task_histories.services import TaskHistoryContextKwargs
 from app.tasks.task_histories.usecases.crud import CreateTaskHistoryUseCase
 from app.tasks.tasks.models import Task
 from app.tasks.tasks.repos import TaskRepository
+from app_base.base.exceptions.basic import NotFoundException
 from sqlalchemy.ext.asyncio import AsyncSession
 from tests.utils.fastapi import resolve_dependency
 
@@ -48,3 +51,21 @@ class TestCreateTaskHistory:
         assert db_task_history.task_id == task.id
         assert db_task_history.workspace_id == workspace.id
         assert db_task_history.comment == "Task started during integration test"
+
+    async def test_create_task_history_unknown_task(
+        self,
+        session: AsyncSession,
+        make_db,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        other_workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        other_task: Task = await make_db(TaskRepository, workspace_id=other_workspace.id)
+        use_case = resolve_dependency(CreateTaskHistoryUseCase)
+        context: TaskHistoryContextKwargs = {"parent_id": workspace.id}
+
+        # task_id is not a foreign key: the use case checks the task exists in the workspace
+        for task_id in (uuid.uuid4(), other_task.id):
+            with pytest.raises(NotFoundException):
+                await use_case.execute(
+                    TaskHistoryCreate(task_id=task_id, event_type="status_change", changed_by="user"), context=context
+                )
@@ -4,6 +4,7 @@ from app.platform.workspaces.repos import WorkspaceRepository
 from app.tasks.task_histories.models import TaskHistory
 from app.tasks.task_histories.repos import TaskHistoryRepository
 from app.tasks.task_histories.services import TaskHistoryContextKwargs, TaskHistoryService
+from app.tasks.task_histories.usecases.crud import GetMultiTaskHistoryByCursorUseCase
 from app.tasks.tasks.models import Task
 from app.tasks.tasks.repos import TaskRepository
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -37,3 +38,28 @@ class TestGetTaskHistory:
         assert retrieved_task_history is not None
         assert retrieved_task_history.id == task_history.id
         assert retrieved_task_history.event_type == "assignment"
+
+    async def test_get_multi_task_history_by_cursor(
+        self,
+        session: AsyncSession,
+        make_db,
+        make_db_batch,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        other_workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        task: Task = await make_db(TaskRepository, workspace_id=workspace.id)
+        histories = await make_db_batch(TaskHistoryRepository, 5, workspace_id=workspace.id, task_id=task.id)
+        await make_db(TaskHistoryRepository, workspace_id=other_workspace.id, task_id=task.id)
+        await session.commit()
+
+        use_case = resolve_dependency(GetMultiTaskHistoryByCursorUseCase)
+        context: TaskHistoryContextKwargs = {"parent_id": workspace.id}
+
+        first = await use_case.execute(3, "", context=context)
+        second = await use_case.execute(3, first.next_cursor, context=context)
+
+        assert len(first.items) == 3
+        assert first.next_cursor is not None
+        assert len(second.items) == 2
+        assert second.next_cursor is None
+        assert {h.id for h in [*first.items, *second.items]} == {h.id for h in histories}
@@ -0,0 +1,67 @@
+import uuid
+
+import pytest
+from app.platform.workspaces.models import Workspace
+from app.platform.workspaces.repos import WorkspaceRepository
+from app.tasks.tasks.enum import TaskQueue, TaskStatus
+from app.tasks.tasks.models import Task
+from app.tasks.tasks.repos import TaskRepository
+from app.tasks.tasks.services import TaskContextKwargs
+from app.tasks.tasks.usecases.claim import ClaimTaskUseCase
+from app_base.base.exceptions.basic import NotFoundException
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.utils.fastapi import resolve_dependency
+
+
+@pytest.mark.integrate
+class TestClaimTask:
+    async def test_claim_task_moves_pending_to_in_progress(
+        self,
+        session: AsyncSession,
+        inspect_session: AsyncSession,
+        make_db,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        pending = [
+            await make_db(
+                TaskRepository,
+                workspace_id=workspace.id,
+                queue=TaskQueue.LOCAL_AGENT.value,
+                status=TaskStatus.PENDING.value,
+            )
+            for _ in range(3)
+        ]
+        # Tasks that must never be claimed
+        await make_db(
+            TaskRepository, workspace_id=workspace.id, queue=TaskQueue.WORKFLOW.value, status=TaskStatus.PENDING.value
+        )
+        await make_db(
+            TaskRepository, workspace_id=workspace.id, queue=TaskQueue.LOCAL_AGENT.value, status=TaskStatus.DONE.value
+        )
+        await session.commit()
+
+        use_case = resolve_dependency(ClaimTaskUseCase)
+        context: TaskContextKwargs = {"parent_id": workspace.id}
+
+        first = await use_case.execute(TaskQueue.LOCAL_AGENT, 2, "worker-1", 60, context=context)
+        second = await use_case.execute(TaskQueue.LOCAL_AGENT, 2, "worker-1", 60, context=context)
+        third = await use_case.execute(TaskQueue.LOCAL_AGENT, 2, "worker-1", 60, context=context)
+
+        assert len(first) == 2
+        assert len(second) == 1
+        assert third == []
+
+        claimed_ids = {task.id for task in [*first, *second]}
+        assert claimed_ids == {task.id for task in pending}
+        for task_id in claimed_ids:
+            db_task = await inspect_session.get(Task, task_id)
+            assert db_task.status == TaskStatus.IN_PROGRESS.value
+            assert db_task.lease_owner == "worker-1"
+            assert db_task.lease_expires_at is not None
+
+    async def test_claim_task_invalid_workspace(self, session: AsyncSession):
+        use_case = resolve_dependency(ClaimTaskUseCase)
+        context: TaskContextKwargs = {"parent_id": uuid.uuid4()}
+
+        with pytest.raises(NotFoundException):
+            await use_case.execute(TaskQueue.DEFAULT, 1, "worker-1", None, context=context)
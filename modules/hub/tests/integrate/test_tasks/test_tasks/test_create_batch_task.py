@@ -0,0 +1,58 @@
+import uuid
+
+import pytest
+from app.platform.workspaces.models import Workspace
+from app.platform.workspaces.repos import WorkspaceRepository
+from app.tasks.task_tags.models import TaskTag
+from app.tasks.tasks.models import Task
+from app.tasks.tasks.schemas import TaskBatchCreate, TaskCreate
+from app.tasks.tasks.services import TaskContextKwargs
+from app.tasks.tasks.usecases.batch import CreateBatchTaskUseCase
+from app_base.base.exceptions.basic import NotFoundException
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.utils.fastapi import resolve_dependency
+
+
+@pytest.mark.integrate
+class TestCreateBatchTask:
+    async def test_create_batch_task_success(
+        self,
+        session: AsyncSession,
+        inspect_session: AsyncSession,
+        make_db,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        await session.commit()
+        use_case = resolve_dependency(CreateBatchTaskUseCase)
+
+        batch_in = TaskBatchCreate(
+            items=[
+                TaskCreate(
+                    title=f"Issue {i}", external_ref=f"https://github.com/o/r/issues/{i}", tags=["sync", f"t{i % 2}"]
+                )
+                for i in range(10)
+            ]
+        )
+        context: TaskContextKwargs = {"parent_id": workspace.id}
+        created = await use_case.execute(batch_in, context=context)
+
+        assert [task.title for task in created] == [f"Issue {i}" for i in range(10)]
+        assert {tag.name for tag in created[0].tags} == {"sync", "t0"}
+        assert {tag.name for tag in created[1].tags} == {"sync", "t1"}
+
+        task_count = await inspect_session.scalar(
+            select(func.count()).select_from(Task).where(Task.workspace_id == workspace.id)
+        )
+        assert task_count == 10
+        tag_count = await inspect_session.scalar(
+            select(func.count()).select_from(TaskTag).where(TaskTag.workspace_id == workspace.id)
+        )
+        assert tag_count == 3
+
+    async def test_create_batch_task_invalid_workspace(self, session: AsyncSession):
+        use_case = resolve_dependency(CreateBatchTaskUseCase)
+        context: TaskContextKwargs = {"parent_id": uuid.uuid4()}
+
+        with pytest.raises(NotFoundException):
+            await use_case.execute(TaskBatchCreate(items=[TaskCreate(title="Orphan")]), context=context)
@@ -1,10 +1,13 @@
 import pytest
 from app.platform.workspaces.models import Workspace
 from app.platform.workspaces.repos import WorkspaceRepository
+from app.tasks.task_tags.models import TaskTag
+from app.tasks.task_tags.repos import TaskTagRepository
 from app.tasks.tasks.models import Task
 from app.tasks.tasks.schemas import TaskCreate
 from app.tasks.tasks.services import TaskContextKwargs
 from app.tasks.tasks.usecases.crud import CreateTaskUseCase
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from tests.utils.fastapi import resolve_dependency
 
@@ -42,3 +45,26 @@ class TestCreateTask:
         # Refresh to check relationships if needed, though session.get might have it cached or we need await session.refresh(db_task, ["tags"])
         await session.refresh(db_task, ["tags"])
         assert len(db_task.tags) == 2
+
+    async def test_create_task_reuses_existing_tags(
+        self,
+        session: AsyncSession,
+        inspect_session: AsyncSession,
+        make_db,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        existing: TaskTag = await make_db(TaskTagRepository, workspace_id=workspace.id, name="existing")
+        await session.commit()
+        use_case = resolve_dependency(CreateTaskUseCase)
+
+        task_in = TaskCreate(title="Tagged Task", tags=["new", " existing ", "new", ""])
+        context: TaskContextKwargs = {"parent_id": workspace.id}
+        created_task = await use_case.execute(task_in, context=context)
+
+        assert sorted(tag.name for tag in created_task.tags) == ["existing", "new"]
+        assert existing.id in {tag.id for tag in created_task.tags}
+
+        tag_count = await inspect_session.scalar(
+            select(func.count()).select_from(TaskTag).where(TaskTag.workspace_id == workspace.id)
+        )
+        assert tag_count == 2
@@ -1,6 +1,8 @@
 import pytest
 from app.platform.workspaces.models import Workspace
 from app.platform.workspaces.repos import WorkspaceRepository
+from app.tasks.task_histories.models import TaskHistory
+from app.tasks.task_histories.repos import TaskHistoryRepository
 from app.tasks.tasks.models import Task
 from app.tasks.tasks.repos import TaskRepository
 from app.tasks.tasks.services import TaskContextKwargs
@@ -31,6 +33,24 @@ class TestDeleteTask:
         db_task = await inspect_session.get(Task, task.id)
         assert db_task is None
 
+    async def test_delete_task_keeps_history(
+        self,
+        session: AsyncSession,
+        inspect_session: AsyncSession,
+        make_db,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        task: Task = await make_db(TaskRepository, workspace_id=workspace.id)
+        history: TaskHistory = await make_db(TaskHistoryRepository, workspace_id=workspace.id, task_id=task.id)
+        delete_use_case = resolve_dependency(DeleteTaskUseCase)
+
+        await delete_use_case.execute(task.id, context={"parent_id": workspace.id})
+
+        # History is append-only and outlives its task
+        db_history = await inspect_session.get(TaskHistory, history.id)
+        assert db_history is not None
+        assert db_history.task_id == task.id
+
     async def test_delete_task_not_found(
         self,
         session: AsyncSession,
@@ -0,0 +1,58 @@
+import uuid
+
+import pytest
+from app.platform.workspaces.models import Workspace
+from app.platform.workspaces.repos import WorkspaceRepository
+from app.tasks.tasks.enum import TaskStatus
+from app.tasks.tasks.models import Task
+from app.tasks.tasks.repos import TaskRepository
+from app.tasks.tasks.usecases.tree import GetTaskTreeUseCase
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.utils.fastapi import resolve_dependency
+
+
+@pytest.mark.integrate
+class TestGetTaskTree:
+    async def test_tree_rolls_up_descendants(self, session: AsyncSession, make_db):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        epic: Task = await make_db(TaskRepository, workspace_id=workspace.id, title="Epic", parent_task_id=None)
+        story: Task = await make_db(
+            TaskRepository, workspace_id=workspace.id, title="Story", parent_task_id=epic.id, status="pending"
+        )
+        await make_db(
+            TaskRepository, workspace_id=workspace.id, title="Dropped", parent_task_id=epic.id, status="cancelled"
+        )
+        step: Task = await make_db(
+            TaskRepository, workspace_id=workspace.id, title="Step 1", parent_task_id=story.id, status="done"
+        )
+        await make_db(
+            TaskRepository, workspace_id=workspace.id, title="Step 2", parent_task_id=story.id, status="pending"
+        )
+        await make_db(
+            TaskRepository, workspace_id=workspace.id, title="Detail", parent_task_id=step.id, status="pending"
+        )
+
+        use_case = resolve_dependency(GetTaskTreeUseCase)
+
+        tree = await use_case.execute(epic.id, 2, context={"parent_id": workspace.id})
+
+        assert tree.id == epic.id
+        assert sorted(child.title for child in tree.children) == ["Dropped", "Story"]
+        assert tree.descendant_count == 4
+        assert tree.descendant_status_counts[TaskStatus.CANCELLED] == 1
+        assert tree.percent_done == pytest.approx(100 / 3, abs=0.01)
+        [story_node] = [child for child in tree.children if child.id == story.id]
+        assert story_node.depth == 1
+        assert story_node.percent_done == 50.0
+        [step_node] = [child for child in story_node.children if child.id == step.id]
+        # "Detail" is below the depth limit
+        assert step_node.children == []
+        assert step_node.truncated is True
+
+    async def test_tree_not_found_in_other_workspace(self, session: AsyncSession, make_db):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        task: Task = await make_db(TaskRepository, workspace_id=workspace.id, parent_task_id=None)
+
+        use_case = resolve_dependency(GetTaskTreeUseCase)
+
+        assert await use_case.execute(task.id, 5, context={"parent_id": uuid.uuid4()}) is None
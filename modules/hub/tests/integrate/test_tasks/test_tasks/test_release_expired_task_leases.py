@@ -0,0 +1,50 @@
+import datetime
+
+import pytest
+from app.platform.workspaces.models import Workspace
+from app.platform.workspaces.repos import WorkspaceRepository
+from app.tasks.tasks.enum import TaskStatus
+from app.tasks.tasks.models import Task
+from app.tasks.tasks.repos import TaskRepository
+from app.tasks.tasks.usecases.lease import ReleaseExpiredTaskLeasesUseCase
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.utils.fastapi import resolve_dependency
+
+
+@pytest.mark.integrate
+class TestReleaseExpiredTaskLeases:
+    async def test_release_expired_task_leases(
+        self,
+        session: AsyncSession,
+        inspect_session: AsyncSession,
+        make_db,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        now = datetime.datetime.now(datetime.UTC)
+        expired: Task = await make_db(
+            TaskRepository,
+            workspace_id=workspace.id,
+            status=TaskStatus.IN_PROGRESS.value,
+            lease_owner="crashed-worker",
+            lease_expires_at=now - datetime.timedelta(minutes=5),
+        )
+        alive: Task = await make_db(
+            TaskRepository,
+            workspace_id=workspace.id,
+            status=TaskStatus.IN_PROGRESS.value,
+            lease_owner="live-worker",
+            lease_expires_at=now + datetime.timedelta(minutes=5),
+        )
+        await session.commit()
+
+        use_case = resolve_dependency(ReleaseExpiredTaskLeasesUseCase)
+        released = await use_case.execute()
+
+        assert released == 1
+        db_expired = await inspect_session.get(Task, expired.id)
+        assert db_expired.status == TaskStatus.PENDING.value
+        assert db_expired.lease_owner is None
+        assert db_expired.lease_expires_at is None
+        db_alive = await inspect_session.get(Task, alive.id)
+        assert db_alive.status == TaskStatus.IN_PROGRESS.value
+        assert db_alive.lease_owner == "live-worker"
@@ -0,0 +1,55 @@
+import pytest
+from app.platform.workspaces.models import Workspace
+from app.platform.workspaces.repos import WorkspaceRepository
+from app.tasks.tasks.repos import TaskRepository
+from app.tasks.tasks.schemas import TaskUpdate
+from app.tasks.tasks.services import TaskContextKwargs
+from app.tasks.tasks.usecases.crud import UpdateTaskUseCase
+from app.tasks.tasks.usecases.search import SearchTaskUseCase
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.utils.fastapi import resolve_dependency
+
+
+@pytest.mark.integrate
+class TestSearchTasks:
+    async def test_search_ranks_and_tracks_changes(self, session: AsyncSession, make_db):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        other_workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+
+        async def make_task(
+            workspace_id, title: str, description: str | None = None, result_summary: str | None = None
+        ):
+            return await make_db(
+                TaskRepository,
+                workspace_id=workspace_id,
+                title=title,
+                description=description,
+                result_summary=result_summary,
+            )
+
+        await make_task(workspace.id, "Fix login redirect", "Users land on a blank page")
+        await make_task(workspace.id, "Write onboarding guide", "Cover the login flow for new users")
+        unrelated = await make_task(workspace.id, "Rotate API keys", "Quarterly chore")
+        await make_task(other_workspace.id, "Fix login redirect")
+        await session.commit()
+
+        context: TaskContextKwargs = {"parent_id": workspace.id}
+        use_case = resolve_dependency(SearchTaskUseCase)
+
+        page = await use_case.execute("login", 0, 10, context=context)
+        # A title match outranks a description match; other workspaces are never searched
+        assert [task.title for task in page.items] == ["Fix login redirect", "Write onboarding guide"]
+        assert page.total_count is None
+
+        update = resolve_dependency(UpdateTaskUseCase)
+        await update.execute(unrelated.id, TaskUpdate(description="Also revoke the login tokens"), context=context)
+
+        page = await use_case.execute("login", 0, 10, context=context)
+        assert {task.title for task in page.items} == {
+            "Fix login redirect",
+            "Write onboarding guide",
+            "Rotate API keys",
+        }
+
+        page = await use_case.execute("login", 1, 1, context=context)
+        assert len(page.items) == 1
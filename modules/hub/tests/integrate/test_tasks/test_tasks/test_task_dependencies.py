@@ -0,0 +1,100 @@
+import pytest
+from app.platform.workspaces.models import Workspace
+from app.platform.workspaces.repos import WorkspaceRepository
+from app.tasks.tasks.enum import TaskQueue, TaskStatus
+from app.tasks.tasks.models import Task
+from app.tasks.tasks.schemas import TaskCreate, TaskDependencyCreate, TaskUpdate
+from app.tasks.tasks.services import TaskContextKwargs
+from app.tasks.tasks.usecases.claim import ClaimTaskUseCase
+from app.tasks.tasks.usecases.crud import CreateTaskUseCase, DeleteTaskUseCase, UpdateTaskUseCase
+from app.tasks.tasks.usecases.dependencies import AddTaskDependenciesUseCase, RemoveTaskDependencyUseCase
+from app_base.base.exceptions.basic import BadRequestException
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.utils.fastapi import resolve_dependency
+
+
+@pytest.mark.integrate
+class TestTaskDependencies:
+    async def test_dependents_become_claimable_when_predecessor_is_done(
+        self,
+        session: AsyncSession,
+        inspect_session: AsyncSession,
+        make_db,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        context: TaskContextKwargs = {"parent_id": workspace.id}
+        create = resolve_dependency(CreateTaskUseCase)
+        update = resolve_dependency(UpdateTaskUseCase)
+        claim = resolve_dependency(ClaimTaskUseCase)
+
+        fetch = await create.execute(TaskCreate(title="Fetch", queue=TaskQueue.WORKFLOW), context=context)
+        parse = await create.execute(
+            TaskCreate(title="Parse", queue=TaskQueue.LOCAL_AGENT, blocked_by=[fetch.id]), context=context
+        )
+        report = await create.execute(
+            TaskCreate(title="Report", queue=TaskQueue.LOCAL_AGENT, blocked_by=[fetch.id, parse.id]), context=context
+        )
+        assert (parse.unresolved_dependency_count, report.unresolved_dependency_count) == (1, 2)
+
+        assert await claim.execute(TaskQueue.LOCAL_AGENT, 10, "worker-1", 60, context=context) == []
+
+        await update.execute(fetch.id, TaskUpdate(status=TaskStatus.DONE), context=context)
+
+        claimed = await claim.execute(TaskQueue.LOCAL_AGENT, 10, "worker-1", 60, context=context)
+        assert [task.id for task in claimed] == [parse.id]
+        db_report = await inspect_session.get(Task, report.id)
+        assert db_report.unresolved_dependency_count == 1
+
+        # Reopening a done predecessor blocks its dependents again
+        await update.execute(fetch.id, TaskUpdate(status=TaskStatus.PENDING), context=context)
+        await inspect_session.refresh(db_report)
+        assert db_report.unresolved_dependency_count == 2
+
+    async def test_add_and_remove_dependencies(self, session: AsyncSession, make_db):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        context: TaskContextKwargs = {"parent_id": workspace.id}
+        create = resolve_dependency(CreateTaskUseCase)
+        add = resolve_dependency(AddTaskDependenciesUseCase)
+        remove = resolve_dependency(RemoveTaskDependencyUseCase)
+
+        first = await create.execute(TaskCreate(title="First"), context=context)
+        second = await create.execute(TaskCreate(title="Second", blocked_by=[first.id]), context=context)
+        third = await create.execute(TaskCreate(title="Third"), context=context)
+
+        updated = await add.execute(third.id, TaskDependencyCreate(depends_on_task_ids=[first.id, second.id]), context)
+        assert updated.unresolved_dependency_count == 2
+
+        with pytest.raises(BadRequestException):
+            await add.execute(first.id, TaskDependencyCreate(depends_on_task_ids=[third.id]), context)
+        with pytest.raises(BadRequestException):
+            await add.execute(first.id, TaskDependencyCreate(depends_on_task_ids=[first.id]), context)
+
+        updated = await remove.execute(third.id, second.id, context)
+        assert updated.unresolved_dependency_count == 1
+
+    async def test_repeated_transition_to_done_shifts_dependents_once(
+        self,
+        session: AsyncSession,
+        inspect_session: AsyncSession,
+        make_db,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        context: TaskContextKwargs = {"parent_id": workspace.id}
+        create = resolve_dependency(CreateTaskUseCase)
+        update = resolve_dependency(UpdateTaskUseCase)
+        delete = resolve_dependency(DeleteTaskUseCase)
+
+        fetch = await create.execute(TaskCreate(title="Fetch"), context=context)
+        parse = await create.execute(TaskCreate(title="Parse"), context=context)
+        report = await create.execute(TaskCreate(title="Report", blocked_by=[fetch.id, parse.id]), context=context)
+
+        # The second update starts from a done status, so it must not resolve the edge again
+        await update.execute(fetch.id, TaskUpdate(status=TaskStatus.DONE), context=context)
+        await update.execute(fetch.id, TaskUpdate(status=TaskStatus.DONE), context=context)
+        db_report = await inspect_session.get(Task, report.id)
+        assert db_report.unresolved_dependency_count == 1
+
+        # Nor does deleting the already done predecessor
+        await delete.execute(fetch.id, context=context)
+        await inspect_session.refresh(db_report)
+        assert db_report.unresolved_dependency_count == 1
@@ -0,0 +1,112 @@
+import pytest
+from app.common.events import get_event_broker, publish_event
+from app.platform.workspaces.models import Workspace
+from app.platform.workspaces.repos import WorkspaceRepository
+from app.tasks.tasks.enum import TaskEventType, TaskPriority, TaskStatus
+from app.tasks.tasks.events import TASK_IDS_PER_EVENT
+from app.tasks.tasks.models import Task
+from app.tasks.tasks.repos import TaskRepository
+from app.tasks.tasks.schemas import TaskBatchCreate, TaskCreate, TaskUpdate
+from app.tasks.tasks.services import TaskContextKwargs
+from app.tasks.tasks.usecases.batch import CreateBatchTaskUseCase
+from app.tasks.tasks.usecases.crud import CreateTaskUseCase, UpdateTaskUseCase
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.utils.fastapi import resolve_dependency
+
+
+@pytest.mark.integrate
+class TestTaskEvents:
+    async def test_task_created_event_delivered_after_commit(
+        self,
+        session: AsyncSession,
+        make_db,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        other_workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        await session.commit()
+        use_case = resolve_dependency(CreateTaskUseCase)
+        broker = get_event_broker()
+
+        async with broker.subscribe(str(workspace.id)) as queue, broker.subscribe(str(other_workspace.id)) as other:
+            context: TaskContextKwargs = {"parent_id": workspace.id}
+            created_task = await use_case.execute(TaskCreate(title="Evented Task"), context=context)
+
+            assert queue.qsize() == 1
+            payload = queue.get_nowait()
+            assert payload["type"] == TaskEventType.CREATED.value
+            assert payload["data"]["task_id"] == str(created_task.id)
+            assert other.empty()
+
+    async def test_event_dropped_on_rollback(
+        self,
+        session: AsyncSession,
+        make_db,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        await session.commit()
+        topic = str(workspace.id)
+
+        async with get_event_broker().subscribe(topic) as queue:
+            await publish_event(session, topic, TaskEventType.UPDATED.value, {"task_id": "rolled-back"})
+            await session.rollback()
+            assert queue.empty()
+
+            await publish_event(session, topic, TaskEventType.UPDATED.value, {"task_id": "committed"})
+            await session.commit()
+            assert queue.get_nowait()["data"] == {"task_id": "committed"}
+
+    async def test_recorded_history_published(
+        self,
+        session: AsyncSession,
+        make_db,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        task: Task = await make_db(
+            TaskRepository,
+            workspace_id=workspace.id,
+            status=TaskStatus.PENDING.value,
+            priority=TaskPriority.NORMAL.value,
+        )
+        await session.commit()
+        use_case = resolve_dependency(UpdateTaskUseCase)
+
+        async with get_event_broker().subscribe(str(workspace.id)) as queue:
+            context: TaskContextKwargs = {"parent_id": workspace.id}
+            await use_case.execute(
+                task.id, TaskUpdate(status=TaskStatus.IN_PROGRESS, priority=TaskPriority.HIGH), context=context
+            )
+
+            payloads = [queue.get_nowait() for _ in range(queue.qsize())]
+            history = [p["data"] for p in payloads if p["type"] == TaskEventType.HISTORY_CREATED.value]
+            assert {(data["event_type"], data["new_value"]) for data in history} == {
+                ("status_change", TaskStatus.IN_PROGRESS.value),
+                ("priority_change", TaskPriority.HIGH.value),
+            }
+            assert all(data["task_id"] == str(task.id) for data in history)
+            assert len({data["task_history_id"] for data in history}) == 2
+
+    async def test_unblocked_event_split_under_notify_limit(
+        self,
+        session: AsyncSession,
+        make_db,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        await session.commit()
+        context: TaskContextKwargs = {"parent_id": workspace.id}
+        fetch = await resolve_dependency(CreateTaskUseCase).execute(TaskCreate(title="Fetch"), context=context)
+        dependents = await resolve_dependency(CreateBatchTaskUseCase).execute(
+            TaskBatchCreate(
+                items=[TaskCreate(title=f"Dependent {i}", blocked_by=[fetch.id]) for i in range(TASK_IDS_PER_EVENT + 1)]
+            ),
+            context=context,
+        )
+
+        async with get_event_broker().subscribe(str(workspace.id)) as queue:
+            await resolve_dependency(UpdateTaskUseCase).execute(
+                fetch.id, TaskUpdate(status=TaskStatus.DONE), context=context
+            )
+
+            payloads = [queue.get_nowait() for _ in range(queue.qsize())]
+            unblocked = [p["data"]["task_ids"] for p in payloads if p["type"] == TaskEventType.UNBLOCKED.value]
+            assert [len(ids) for ids in unblocked] == [TASK_IDS_PER_EVENT, 1]
+            assert sorted(i for ids in unblocked for i in ids) == sorted(str(task.id) for task in dependents)
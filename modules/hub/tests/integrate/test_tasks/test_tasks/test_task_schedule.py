@@ -0,0 +1,62 @@
+import datetime
+
+import pytest
+from app.platform.workspaces.models import Workspace
+from app.platform.workspaces.repos import WorkspaceRepository
+from app.tasks.tasks.enum import TaskPriority, TaskQueue, TaskStatus, TaskUrgency
+from app.tasks.tasks.models import Task
+from app.tasks.tasks.repos import TaskRepository
+from app.tasks.tasks.scheduling import schedule_at
+from app.tasks.tasks.schemas import TaskUpdate
+from app.tasks.tasks.services import TaskContextKwargs
+from app.tasks.tasks.usecases.claim import ClaimTaskUseCase
+from app.tasks.tasks.usecases.crud import UpdateTaskUseCase
+from app.tasks.tasks.usecases.schedule import GetMultiTaskByScheduleUseCase
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.utils.fastapi import resolve_dependency
+
+
+@pytest.mark.integrate
+class TestTaskSchedule:
+    async def test_schedule_order_and_claim(self, session: AsyncSession, make_db):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        now = datetime.datetime.now(datetime.UTC)
+
+        async def make_task(title: str, priority: TaskPriority, urgency: TaskUrgency, **kwargs) -> Task:
+            return await make_db(
+                TaskRepository,
+                workspace_id=workspace.id,
+                title=title,
+                status=TaskStatus.PENDING.value,
+                queue=TaskQueue.DEFAULT.value,
+                priority=priority.value,
+                urgency=urgency.value,
+                due_date=None,
+                **kwargs,
+            )
+
+        # Waiting since long before the others: aging puts it ahead of newer critical work
+        await make_task(
+            "Starved",
+            TaskPriority.LOW,
+            TaskUrgency.LOW,
+            schedule_at=schedule_at(now - datetime.timedelta(days=5), "low", "low", None),
+        )
+        await make_task("Routine", TaskPriority.NORMAL, TaskUrgency.NORMAL)
+        await make_task("Critical", TaskPriority.CRITICAL, TaskUrgency.HIGH)
+        due_soon = await make_task("Due soon", TaskPriority.LOW, TaskUrgency.LOW)
+        await session.commit()
+
+        context: TaskContextKwargs = {"parent_id": workspace.id}
+        update = resolve_dependency(UpdateTaskUseCase)
+        await update.execute(
+            due_soon.id, TaskUpdate(due_date=now.replace(tzinfo=None) + datetime.timedelta(hours=1)), context=context
+        )
+
+        schedule = resolve_dependency(GetMultiTaskByScheduleUseCase)
+        page = await schedule.execute(0, 10, context=context)
+        assert [task.title for task in page.items] == ["Starved", "Critical", "Due soon", "Routine"]
+
+        claim = resolve_dependency(ClaimTaskUseCase)
+        claimed = await claim.execute(TaskQueue.DEFAULT, 2, "worker-1", 60, context=context)
+        assert {task.title for task in claimed} == {"Starved", "Critical"}
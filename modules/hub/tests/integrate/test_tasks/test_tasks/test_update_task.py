@@ -1,13 +1,16 @@
 import pytest
 from app.platform.workspaces.models import Workspace
 from app.platform.workspaces.repos import WorkspaceRepository
+from app.tasks.task_histories.models import TaskHistory, TaskHistoryEventType
 from app.tasks.task_tags.models import TaskTag
 from app.tasks.task_tags.repos import TaskTagRepository
+from app.tasks.tasks.enum import TaskPriority, TaskQueue, TaskStatus
 from app.tasks.tasks.models import Task
 from app.tasks.tasks.repos import TaskRepository
 from app.tasks.tasks.schemas import TaskUpdate
 from app.tasks.tasks.services import TaskContextKwargs
 from app.tasks.tasks.usecases.crud import UpdateTaskUseCase
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from tests.utils.fastapi import resolve_dependency
 
@@ -44,3 +47,38 @@ class TestUpdateTask:
         assert db_task is not None
         assert len(db_task.tags) == 2
         assert {tag.name for tag in db_task.tags} == {"new_tag", "another_new_tag"}
+
+    async def test_update_task_records_history(
+        self,
+        session: AsyncSession,
+        inspect_session: AsyncSession,
+        make_db,
+    ):
+        workspace: Workspace = await make_db(WorkspaceRepository, is_default=False)
+        task: Task = await make_db(
+            TaskRepository,
+            workspace_id=workspace.id,
+            status=TaskStatus.PENDING.value,
+            queue=TaskQueue.DEFAULT.value,
+            priority=TaskPriority.NORMAL.value,
+        )
+        await session.commit()
+
+        use_case = resolve_dependency(UpdateTaskUseCase)
+        update_data = TaskUpdate(
+            status=TaskStatus.REVIEW,
+            queue=TaskQueue.DEFAULT,
+            priority=TaskPriority.HIGH,
+            title="Renamed",
+            changed_by="reviewer",
+        )
+        context: TaskContextKwargs = {"parent_id": workspace.id}
+        await use_case.execute(task.id, update_data, context=context)
+
+        histories = (await inspect_session.scalars(select(TaskHistory).where(TaskHistory.task_id == task.id))).all()
+        changes = {(h.event_type, h.previous_value, h.new_value, h.changed_by) for h in histories}
+        assert changes == {
+            (TaskHistoryEventType.STATUS_CHANGE.value, "pending", "review", "reviewer"),
+            (TaskHistoryEventType.PRIORITY_CHANGE.value, "normal", "high", "reviewer"),
+        }
+        assert all(h.workspace_id == workspace.id for h in histories)
@@ -0,0 +1,75 @@
+import asyncio
+
+import orjson
+import pytest
+from app.common import events
+from app.common.events import EVENTS_CHANNEL, EventBroker, PostgresEventListener
+
+
+class FakeConnection:
+    def __init__(self):
+        self.listeners = []
+        self.termination_listeners = []
+        self.terminated = False
+
+    def add_termination_listener(self, callback):
+        self.termination_listeners.append(callback)
+
+    async def add_listener(self, channel, callback):
+        self.listeners.append(callback)
+
+    async def execute(self, query):
+        return "SELECT 1"
+
+    def terminate(self):
+        self.terminated = True
+
+    def notify(self, payload: dict):
+        for callback in self.listeners:
+            callback(self, 0, EVENTS_CHANNEL, orjson.dumps(payload).decode())
+
+    def drop(self):
+        for callback in self.termination_listeners:
+            callback(self)
+
+
+async def _until(condition) -> None:
+    async with asyncio.timeout(1):
+        while not condition():
+            await asyncio.sleep(0)
+
+
+@pytest.mark.unit
+class TestPostgresEventListener:
+    async def test_reconnects_after_failures_and_drops(self, monkeypatch: pytest.MonkeyPatch):
+        connections = [FakeConnection(), FakeConnection()]
+        attempts = []
+
+        async def connect(dsn):
+            attempts.append(dsn)
+            if len(attempts) == 1:
+                raise OSError("connection refused")
+            return connections[len(attempts) - 2]
+
+        monkeypatch.setattr(events.asyncpg, "connect", connect)
+        broker = EventBroker()
+        listener = PostgresEventListener(broker, "postgresql://hub@db/hub")
+        listener.RECONNECT_MIN_SECONDS = 0
+
+        async with broker.subscribe("ws") as queue:
+            await listener.start()
+            try:
+                await _until(lambda: connections[0].listeners)
+                connections[0].notify({"topic": "ws", "type": "task.created", "data": {}})
+                assert queue.get_nowait()["type"] == "task.created"
+
+                connections[0].drop()
+                await _until(lambda: connections[1].listeners)
+                assert connections[0].terminated
+                connections[1].notify({"topic": "ws", "type": "task.updated", "data": {}})
+                assert queue.get_nowait()["type"] == "task.updated"
+            finally:
+                await listener.stop()
+
+        assert attempts == ["postgresql://hub@db/hub"] * 3
+        assert connections[1].terminated
@@ -0,0 +1,30 @@
+import pytest
+from app.common.metrics import LatencyCollector, LatencyHistogram, bucket_index, bucket_upper_value
+
+
+@pytest.mark.unit
+class TestLatencyHistogram:
+    def test_buckets_cover_every_value(self):
+        for value in range(10_000):
+            index = bucket_index(value)
+            assert bucket_upper_value(index) >= value
+            assert index == 0 or bucket_upper_value(index - 1) < value
+
+    def test_percentiles_within_bucket_precision(self):
+        histogram = LatencyHistogram()
+        for value in range(1, 10_001):
+            histogram.record(value)
+
+        for quantile, exact in ((0.5, 5000), (0.95, 9500), (0.99, 9900)):
+            assert exact <= histogram.percentile(quantile) <= exact * 1.07
+        assert histogram.percentile(1.0) == 10_000
+
+    def test_prometheus_summary(self):
+        collector = LatencyCollector("job_duration_seconds", "Job duration.", ("job",))
+        collector.observe(['say "hi"'], 0.25)
+
+        text = collector.render_prometheus()
+
+        assert "# TYPE job_duration_seconds summary" in text
+        assert 'job_duration_seconds{job="say \\"hi\\"",quantile="0.5"} 0.25' in text
+        assert 'job_duration_seconds_count{job="say \\"hi\\""} 1' in text
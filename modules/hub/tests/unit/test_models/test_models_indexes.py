@@ -0,0 +1,34 @@
+import pytest
+from app.main import create_app  # noqa: F401  # registers every model on Base.metadata
+from sqlalchemy import Table, UniqueConstraint
+from tests.fixtures.db import get_base
+
+
+def _leading_column_sets(table: Table) -> list[list[str]]:
+    """Column lists of every structure that can serve a lookup on its leading columns."""
+    candidates = [[col.name for col in table.primary_key.columns]]
+    candidates += [[col.name for col in index.columns] for index in table.indexes]
+    candidates += [
+        [col.name for col in constraint.columns]
+        for constraint in table.constraints
+        if isinstance(constraint, UniqueConstraint)
+    ]
+    candidates += [[col.name] for col in table.columns if col.unique or col.index]
+    return candidates
+
+
+def _foreign_keys():
+    for table in get_base().metadata.sorted_tables:
+        for fk in table.foreign_key_constraints:
+            yield pytest.param(table, [col.name for col in fk.columns], id=f"{table.name}.{'_'.join(fk.column_keys)}")
+
+
+@pytest.mark.unit
+class TestModelIndexes:
+    @pytest.mark.parametrize(("table", "fk_columns"), _foreign_keys())
+    def test_foreign_key_has_leading_index(self, table: Table, fk_columns: list[str]):
+        covered = any(set(columns[: len(fk_columns)]) == set(fk_columns) for columns in _leading_column_sets(table))
+        assert covered, (
+            f"Foreign key {table.name}({', '.join(fk_columns)}) has no index starting with its columns; "
+            "add one to the model's __table_args__ and a migration."
+        )